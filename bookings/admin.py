@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import BookingAction
+
+
+@admin.register(BookingAction)
+class BookingActionAdmin(admin.ModelAdmin):
+    list_display = ("user", "facility", "date", "count")
+    list_filter = ("facility", "date")
+    search_fields = ("user__student_id_number",)
+    readonly_fields = ("user", "facility", "date")
@@ -0,0 +1,129 @@
+"""
+시설 앱(gym, lounge, kitchen)의 관리자 화면에서 함께 쓰는 일괄 작업
+
+선택한 행을 하나씩 save() 하지 않고 UPDATE/DELETE 문 한 번으로 처리한 뒤,
+바뀐 기구/슬롯을 모아 같은 트랜잭션에서 record_machines_changed/record_slots_changed 를 호출해
+캐시를 한 번에 무효화합니다.
+"""
+
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.widgets import AdminDateWidget
+from django.db import transaction
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+
+from .engine import release_timeslots
+from .facilities import get_facility_for_model
+from .signals import record_machines_changed
+from .utils import delete_rows, get_day_range, parse_query_date
+
+
+class ReleasingDeleteMixin:
+    """
+    예약된 슬롯을 삭제하기 전에 release_timeslots 로 예약을 해제해
+    예약한 사용자의 하루 예약 횟수를 되돌리는 타임슬롯 관리자 믹스인
+    """
+
+    def delete_model(self, request, obj):
+        release_timeslots(type(obj).objects.filter(pk=obj.pk))
+        # 메모리의 obj 는 아직 예약된 상태이므로 post_delete 가 해제를 한 번 더 기록하지 않게 비웁니다.
+        obj.user_id = None
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        release_timeslots(queryset)
+        super().delete_queryset(request, queryset)
+
+
+class MachineChangeMixin:
+    """
+    변경/추가 화면에서 기구를 저장하면 record_machines_changed 를 호출하는 기구 관리자 믹스인
+    (관리자의 변경 화면은 한 트랜잭션 안에서 save_model 을 호출합니다)
+    """
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        record_machines_changed(type(obj), [obj.pk])
+
+
+class DateRangeActionForm(ActionForm):
+    """
+    작업 선택 상자 옆에 기간 입력란을 더한 폼 (disable_and_release_date_range 에서 사용)
+    """
+
+    date_from = forms.DateField(
+        label="시작 날짜", required=False, widget=AdminDateWidget
+    )
+    date_to = forms.DateField(label="종료 날짜", required=False, widget=AdminDateWidget)
+
+
+@admin.action(description="선택된 항목의 사용 가능 여부 반전")
+def toggle_availability(modeladmin, request, queryset):
+    with transaction.atomic():
+        machine_pks = list(queryset.values_list("pk", flat=True))
+        queryset.model.objects.filter(pk__in=machine_pks).update(
+            is_available=~F("is_available")
+        )
+        record_machines_changed(queryset.model, machine_pks)
+
+
+@admin.action(
+    description="선택된 기구를 사용 중지하고 기간 안의 예약 해제 (기간이 지나도 다시 켜지지 않음)"
+)
+def disable_and_release_date_range(modeladmin, request, queryset):
+    """
+    선택한 기구의 is_available 을 끄고 date_from ~ date_to 의 예약을 해제합니다.
+
+    기구에는 날짜별 사용 가능 여부가 없으므로 사용 중지는 기간과 상관없이 기구 전체에 적용되며,
+    기간이 끝나면 관리자가 "사용 가능 여부 반전" 으로 다시 켜야 합니다.
+    """
+    try:
+        date_from = parse_query_date(request.POST.get("date_from"), "date_from")
+        date_to = parse_query_date(request.POST.get("date_to"), "date_to")
+        if date_from > date_to:
+            raise ValidationError("date_from 은 date_to 보다 늦을 수 없습니다.")
+    except ValidationError as e:
+        modeladmin.message_user(request, e.detail[0], messages.ERROR)
+        return
+
+    facility = get_facility_for_model(queryset.model)
+    with transaction.atomic():
+        machine_pks = list(queryset.values_list("pk", flat=True))
+        queryset.model.objects.filter(pk__in=machine_pks).update(is_available=False)
+        record_machines_changed(queryset.model, machine_pks)
+        released_count = release_timeslots(
+            facility.timeslot_model.objects.filter(
+                **{f"{facility.machine_fk_field}__in": machine_pks},
+                start_time__gte=get_day_range(date_from)[0],
+                start_time__lt=get_day_range(date_to)[1],
+            )
+        )
+    modeladmin.message_user(
+        request,
+        f"기구 {len(machine_pks)}개를 사용 중지하고 "
+        f"{date_from} ~ {date_to} 의 예약 {released_count}개를 해제했습니다. "
+        "다시 사용하려면 사용 가능 여부를 직접 켜주세요.",
+        messages.SUCCESS,
+    )
+
+
+@admin.action(description="선택된 슬롯의 예약 해제")
+def release_selected_timeslots(modeladmin, request, queryset):
+    released_count = release_timeslots(queryset)
+    modeladmin.message_user(
+        request, f"예약 {released_count}개를 해제했습니다.", messages.SUCCESS
+    )
+
+
+@admin.action(description="선택된 슬롯 중 빈 슬롯 삭제")
+def purge_empty_timeslots(modeladmin, request, queryset):
+    """
+    예약되지 않은 슬롯은 목록 응답과 예약 현황에 나타나지 않으므로 캐시를 무효화하지 않습니다.
+    """
+    # 고른 뒤에 예약된 슬롯이 지워지지 않도록 user IS NULL 조건을 DELETE 문에 그대로 담습니다.
+    deleted_count = delete_rows(queryset.filter(user__isnull=True))
+    modeladmin.message_user(
+        request, f"빈 슬롯 {deleted_count}개를 삭제했습니다.", messages.SUCCESS
+    )
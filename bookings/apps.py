@@ -0,0 +1,27 @@
+from django.apps import AppConfig
+
+
+class BookingsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "bookings"
+
+    def ready(self):
+        from django.db.models.signals import post_delete
+
+        from .availability import update_availability_index
+        from .facilities import FACILITIES
+        from .occupancy import invalidate_occupancy_snapshot
+        from .signals import (
+            machines_changed,
+            notify_machine_deleted,
+            notify_timeslot_deleted,
+            slots_changed,
+        )
+
+        slots_changed.connect(update_availability_index)
+        slots_changed.connect(invalidate_occupancy_snapshot)
+        machines_changed.connect(invalidate_occupancy_snapshot)
+
+        for facility in FACILITIES.values():
+            post_delete.connect(notify_timeslot_deleted, sender=facility.timeslot_model)
+            post_delete.connect(notify_machine_deleted, sender=facility.machine_model)
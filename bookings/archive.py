@@ -0,0 +1,81 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ArchivedTimeSlot
+from .utils import delete_rows
+from .versions import (
+    bump_versions,
+    get_facility_day_version_key,
+    get_machine_day_version_key,
+    get_user_version_key,
+)
+
+
+def archive_timeslots(facility, before, batch_size):
+    """
+    facility 에서 before 이전에 시작한 슬롯을 기구별로 batch_size 개씩 옮깁니다.
+
+    예약된 슬롯은 ArchivedTimeSlot 으로 옮기고, 빈 슬롯은 삭제만 합니다.
+    배치마다 한 트랜잭션에서 보관 테이블 INSERT 와 원래 테이블 DELETE 를 함께 실행하므로
+    중간에 멈춰도 슬롯이 두 테이블에 동시에 있거나 사라지지 않습니다.
+
+    (보관한 예약 수, 원래 테이블에서 삭제한 슬롯 수) 를 반환합니다.
+    """
+    machine_pks = list(facility.machine_model.objects.values_list("pk", flat=True))
+    archived_count = deleted_count = 0
+    for machine_pk in machine_pks:
+        while True:
+            batch_archived_count, batch_deleted_count = _archive_batch(
+                facility, machine_pk, before, batch_size
+            )
+            archived_count += batch_archived_count
+            deleted_count += batch_deleted_count
+            if batch_deleted_count < batch_size:
+                break
+    return archived_count, deleted_count
+
+
+def _archive_batch(facility, machine_pk, before, batch_size):
+    timeslot_model = facility.timeslot_model
+    machine_fk_field = facility.machine_fk_field
+    with transaction.atomic():
+        # (기구, start_time) 유니크 인덱스를 따라 오래된 슬롯부터 가져옵니다.
+        timeslots = list(
+            timeslot_model.objects.filter(
+                **{machine_fk_field: machine_pk}, start_time__lt=before
+            )
+            .order_by("start_time")
+            .values("pk", "user_id", "start_time", "end_time", "booked_at")[:batch_size]
+        )
+        if not timeslots:
+            return 0, 0
+
+        booked_timeslots = [row for row in timeslots if row["user_id"] is not None]
+        ArchivedTimeSlot.objects.bulk_create(
+            [
+                ArchivedTimeSlot(
+                    facility=facility.key,
+                    id=row["pk"],
+                    machine_id=machine_pk,
+                    user_id=row["user_id"],
+                    start_time=row["start_time"],
+                    end_time=row["end_time"],
+                    booked_at=row["booked_at"],
+                )
+                for row in booked_timeslots
+            ]
+        )
+        # 보관은 예약 해제가 아니므로 post_delete 시그널(예약 해제 이벤트) 없이 지웁니다.
+        delete_rows(
+            timeslot_model.objects.filter(pk__in=[row["pk"] for row in timeslots])
+        )
+
+        # 목록 응답에서 보관된 예약이 빠지므로 관련 ETag/응답 캐시를 배치마다 한 번 무효화합니다.
+        version_keys = []
+        for row in booked_timeslots:
+            day = timezone.localtime(row["start_time"]).date()
+            version_keys.append(get_user_version_key(row["user_id"]))
+            version_keys.append(get_machine_day_version_key(facility, machine_pk, day))
+            version_keys.append(get_facility_day_version_key(facility, day))
+        bump_versions(version_keys)
+    return len(booked_timeslots), len(timeslots)
@@ -0,0 +1,224 @@
+"""
+config/asgi.py 로 실행할 때 쓰는 비동기 조회 뷰
+
+기구 목록, 기구 하나의 슬롯 목록을 비동기 ORM(aexists, async for)으로 조회해
+DB 응답을 기다리는 동안 이벤트 루프가 다른 연결을 처리할 수 있게 합니다.
+요청 해석, ETag, 페이지네이션, 직렬화는 sync_view_class 로 지정한 동기 뷰의 메서드를
+그대로 쓰므로 응답 본문과 헤더(ETag, Link)는 동기 뷰와 같습니다.
+토큰 인증만 지원하고 JSON 으로만 응답하며, 하루치 슬롯 목록 응답 캐시는 쓰지 않습니다.
+
+SlotEventStreamView 는 슬롯 변경을 Server-Sent Events 로 보내는 스트림이며
+연결마다 이벤트 루프에서 대기하므로 ASGI 로 실행할 때만 사용합니다.
+"""
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+
+from users.authentication import CachedTokenAuthentication
+
+from .events import DroppedError, slot_event_broadcaster
+from .facilities import get_facility_for_model
+from .models import SlotEvent
+from .renderers import dumps_json
+from .utils import parse_date_range, parse_query_date
+from .views import MAX_DATE_RANGE_DAYS
+
+
+def json_response(data, status=status.HTTP_200_OK):
+    return HttpResponse(
+        dumps_json(data), content_type="application/json", status=status
+    )
+
+
+def error_response(exc):
+    """
+    DRF 기본 예외 처리(rest_framework.views.exception_handler)와 같은 형식으로 응답합니다.
+    """
+    if isinstance(exc, Http404):
+        exc = exceptions.NotFound(*exc.args)
+    if isinstance(exc.detail, (list, dict)):
+        data = exc.detail
+    else:
+        data = {"detail": exc.detail}
+    response = json_response(data, status=exc.status_code)
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        response["WWW-Authenticate"] = CachedTokenAuthentication.keyword
+    return response
+
+
+async def authenticate_request(request):
+    """
+    토큰으로 인증한 (사용자, 토큰) 을 반환합니다. 토큰이 없으면 NotAuthenticated 를 일으킵니다.
+    """
+    result = await CachedTokenAuthentication().aauthenticate(request)
+    if result is None:
+        raise exceptions.NotAuthenticated()
+    return result
+
+
+def format_event(event):
+    """
+    SlotEvent 를 Server-Sent Events 메시지 하나로 만듭니다.
+    """
+    return (
+        f"id: {event.pk}\nevent: {event.event_type}\ndata: ".encode()
+        + dumps_json(event.data)
+        + b"\n\n"
+    )
+
+
+class AsyncReadView(View):
+    """
+    토큰 인증과 ETag 처리를 한 뒤 aget_response 로 응답을 만드는 비동기 조회 뷰
+
+    as_view(sync_view_class=...) 로 같은 응답을 만드는 동기 뷰를 지정하고,
+    하위 클래스에서 그 뷰 인스턴스를 받아 응답을 만드는 aget_response 를 정의합니다.
+    """
+
+    http_method_names = ["get"]
+    sync_view_class = None
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            result = await authenticate_request(request)
+        except exceptions.APIException as e:
+            return error_response(e)
+
+        drf_request = Request(request)
+        drf_request.user, drf_request.auth = result
+        view = self.sync_view_class(
+            request=drf_request, args=args, kwargs=kwargs, format_kwarg=None
+        )
+        try:
+            etag = await view.aget_etag()
+            if etag is not None:
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    not_modified["ETag"] = etag
+                    return not_modified
+            response = await self.aget_response(view)
+        except (exceptions.APIException, Http404) as e:
+            return error_response(e)
+        if etag is not None and response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+        return response
+
+    async def aget_response(self, view):
+        raise NotImplementedError
+
+
+class AsyncMachineListView(AsyncReadView):
+    """
+    BaseMachineListAPIView 의 비동기 버전
+    """
+
+    async def aget_response(self, view):
+        paginator = view.paginator
+        machines = await paginator.apaginate_queryset(
+            view.get_queryset(), view.request, view
+        )
+        response = json_response(view.get_serializer(machines, many=True).data)
+        paginator.add_link_header(response)
+        return response
+
+
+class AsyncTimeSlotListView(AsyncReadView):
+    """
+    BaseTimeSlotListAPIView 의 비동기 버전
+    """
+
+    async def aget_response(self, view):
+        machine_model_class = view.machine_model_class
+        if not await machine_model_class.objects.filter(
+            pk=view.kwargs.get("pk")
+        ).aexists():
+            raise Http404(
+                f"No {machine_model_class._meta.object_name} matches the given query."
+            )
+
+        timeslots = view.fetch_timeslots(view.get_timeslot_queryset())
+        query_params = view.request.query_params
+        if view.is_date_range_request():
+            date_from, date_to = parse_date_range(query_params, MAX_DATE_RANGE_DAYS)
+            rows = [timeslot async for timeslot in timeslots]
+            return json_response(list(view.group_by_day(rows, date_from, date_to)))
+
+        if "cursor" in query_params or "limit" in query_params:
+            paginator = view.paginator
+            page = await paginator.apaginate_queryset(timeslots, view.request, view)
+            response = json_response(view.serialize_timeslots(page))
+            paginator.add_link_header(response)
+            return response
+
+        rows = [timeslot async for timeslot in timeslots]
+        return json_response(view.serialize_timeslots(rows))
+
+
+class SlotEventStreamView(View):
+    """
+    한 시설의 하루치 슬롯 변경을 Server-Sent Events 로 보내는 스트림
+
+    date 날짜의 슬롯이 예약/해제되면 slots 이벤트를, 기구의 사용 가능 여부가 바뀌거나
+    기구가 삭제되면 machines 이벤트를 보냅니다. 이벤트가 없는 동안에는
+    SLOT_EVENT_KEEPALIVE_SECONDS 마다 주석 줄을 보내 연결을 유지합니다.
+    다시 연결할 때 Last-Event-ID 헤더를 보내면 그 뒤의 이벤트부터 이어서 보냅니다.
+    as_view(model_class=...) 로 시설의 타임슬롯 모델을 지정합니다.
+    """
+
+    http_method_names = ["get"]
+    model_class = None
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            await authenticate_request(request)
+            date = parse_query_date(request.GET.get("date"))
+        except exceptions.APIException as e:
+            return error_response(e)
+
+        facility = get_facility_for_model(self.model_class)
+        last_event_id = request.headers.get("Last-Event-ID", "")
+        response = StreamingHttpResponse(
+            self.stream(
+                facility.key,
+                date,
+                int(last_event_id) if last_event_id.isdigit() else None,
+            ),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # 프록시(nginx)가 이벤트를 모아 두지 않고 바로 보내도록 합니다.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def stream(self, facility_key, date, last_event_id):
+        subscription = slot_event_broadcaster.subscribe(facility_key, date)
+        try:
+            # 구독한 뒤에 놓친 이벤트를 읽으므로 둘 사이의 이벤트는 양쪽에 모두 있을 수 있습니다.
+            replayed_ids = set()
+            if last_event_id is not None:
+                async for event in SlotEvent.objects.filter(
+                    Q(date=date) | Q(date__isnull=True),
+                    facility=facility_key,
+                    pk__gt=last_event_id,
+                ).order_by("pk"):
+                    replayed_ids.add(event.pk)
+                    yield format_event(event)
+
+            while True:
+                try:
+                    event = await subscription.get(
+                        settings.SLOT_EVENT_KEEPALIVE_SECONDS
+                    )
+                except DroppedError:
+                    return
+                if event is None:
+                    yield b": keepalive\n\n"
+                elif event.pk not in replayed_ids:
+                    yield format_event(event)
+        finally:
+            slot_event_broadcaster.unsubscribe(subscription)
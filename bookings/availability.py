@@ -0,0 +1,150 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .facilities import get_facility_for_model
+from .utils import get_day_range
+
+SLOT_DURATION_MINUTES = 30
+SLOTS_PER_DAY = 24 * 60 // SLOT_DURATION_MINUTES
+
+
+def get_slot_position(start_time):
+    """
+    슬롯 시작 시간을 (날짜, 하루 안에서의 슬롯 번호) 로 변환
+    """
+    local_start_time = timezone.localtime(start_time)
+    minutes = local_start_time.hour * 60 + local_start_time.minute
+    return local_start_time.date(), minutes // SLOT_DURATION_MINUTES
+
+
+class AvailabilityIndex:
+    """
+    (시설, 기구, 날짜) 별 예약된 슬롯을 48비트 마스크로 보관하는 메모리 인덱스
+
+    시설-날짜 단위로 처음 조회할 때 한 번의 쿼리로 모든 기구의 마스크를 채우고,
+    이후 예약은 slots_changed 시그널로 반영합니다.
+    다른 워커 프로세스의 예약은 알 수 없으므로 AVAILABILITY_INDEX_TTL_SECONDS 가 지나면
+    다시 읽어옵니다. 시설-날짜 버전(bookings.versions)을 넘겨 조회하면 읽어올 때의 버전과
+    다를 때도 다시 읽어옵니다. 최종 판단은 항상 예약 트랜잭션이 합니다.
+
+    읽어오는 동안 update()/invalidate() 가 있었으면 읽은 마스크가 그 변경을 놓쳤을 수 있으므로
+    세대(_generation)를 비교해 저장하지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._days = {}
+        self._generation = 0
+
+    def get_day_masks(self, facility, day, version=None):
+        """
+        {기구 pk: 예약 마스크} 를 반환합니다. 예약이 없는 기구는 포함되지 않습니다.
+
+        version 은 읽기 전에 조회한 시설-날짜 버전입니다. 이 버전으로 만든 ETag 를 붙여
+        응답할 때 넘기면, 인덱스가 그 버전보다 오래되었으면 다시 읽어옵니다.
+        """
+        key = (facility.key, day)
+        entry = self._days.get(key)
+        if (
+            entry is None
+            or time.monotonic() >= entry[0]
+            or (version is not None and entry[2] != version)
+        ):
+            with self._lock:
+                generation = self._generation
+            masks = self._load(facility, day)
+            with self._lock:
+                if self._generation == generation:
+                    self._prune()
+                    self._days[key] = (
+                        time.monotonic() + settings.AVAILABILITY_INDEX_TTL_SECONDS,
+                        masks,
+                        version,
+                    )
+            return masks
+        return entry[1]
+
+    def get_mask(self, facility, machine_pk, day, version=None):
+        return self.get_day_masks(facility, day, version).get(machine_pk, 0)
+
+    def is_free(self, facility, machine_pk, start_times, versions=None):
+        """
+        versions 는 {날짜: 시설-날짜 버전} 입니다.
+        넘기면 인덱스가 그 버전과 다른 날짜는 다시 읽어 확인합니다.
+        """
+        for start_time in start_times:
+            day, position = get_slot_position(start_time)
+            version = versions.get(day) if versions is not None else None
+            if self.get_mask(facility, machine_pk, day, version) & (1 << position):
+                return False
+        return True
+
+    def update(self, facility, machine_pk, start_times, booked):
+        """
+        이미 읽어온 날짜에 한해 마스크를 갱신합니다. 읽지 않은 날짜는 다음 조회 때 읽습니다.
+
+        slots_changed 한 번에 bump_slot_versions 가 날짜마다 시설-날짜 버전을 1 올리므로
+        인덱스의 버전도 1 올립니다. 그 사이 다른 워커의 예약이 있었다면 버전이 달라 다시 읽습니다.
+        """
+        with self._lock:
+            self._generation += 1
+            for day in {get_slot_position(start_time)[0] for start_time in start_times}:
+                key = (facility.key, day)
+                entry = self._days.get(key)
+                if entry is not None and entry[2] is not None:
+                    self._days[key] = (entry[0], entry[1], entry[2] + 1)
+            for start_time in start_times:
+                day, position = get_slot_position(start_time)
+                entry = self._days.get((facility.key, day))
+                if entry is None:
+                    continue
+                masks = entry[1]
+                mask = masks.get(machine_pk, 0)
+                if booked:
+                    mask |= 1 << position
+                else:
+                    mask &= ~(1 << position)
+                if mask:
+                    masks[machine_pk] = mask
+                else:
+                    masks.pop(machine_pk, None)
+
+    def invalidate(self, facility=None):
+        with self._lock:
+            self._generation += 1
+            if facility is None:
+                self._days.clear()
+                return
+            for key in [key for key in self._days if key[0] == facility.key]:
+                del self._days[key]
+
+    def _load(self, facility, day):
+        start_dt, end_dt = get_day_range(day)
+        timeslots = facility.timeslot_model.objects.filter(
+            start_time__gte=start_dt,
+            start_time__lt=end_dt,
+            user__isnull=False,
+        ).values_list(f"{facility.machine_fk_field}_id", "start_time")
+        masks = {}
+        for machine_pk, start_time in timeslots:
+            position = get_slot_position(start_time)[1]
+            masks[machine_pk] = masks.get(machine_pk, 0) | (1 << position)
+        return masks
+
+    def _prune(self):
+        today = timezone.localdate()
+        for key in [key for key in self._days if key[1] < today - timedelta(days=1)]:
+            del self._days[key]
+
+
+availability_index = AvailabilityIndex()
+
+
+def update_availability_index(sender, machine_pk, start_times, booked, **kwargs):
+    availability_index.update(
+        get_facility_for_model(sender), machine_pk, start_times, booked
+    )
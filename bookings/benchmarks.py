@@ -0,0 +1,122 @@
+"""
+벤치마크 관리 명령에서 함께 쓰는 측정/보고 도구
+
+외부 서비스 없이 로컬 DB 와 Django 테스트 클라이언트만으로 요청을 보내고,
+지연 시간 백분위수와 처리량, 상태 코드 분포를 계산합니다.
+"""
+
+import json
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.test import Client
+
+TEST_CLIENT_HOST = "testserver"
+
+BOOK_URL_NAMES = {
+    "treadmill": "treadmill-timeslot-book",
+    "cycle": "cycle-timeslot-book",
+    "ping_pong_table": "ping-pong-table-timeslot-book",
+    "arcade_machine": "arcade-machine-timeslot-book",
+    "induction": "induction-timeslot book",
+}
+
+
+def allow_test_client_host():
+    """
+    테스트 클라이언트가 보내는 호스트를 허용합니다. 벤치마크 명령에서만 호출합니다.
+    """
+    if TEST_CLIENT_HOST not in settings.ALLOWED_HOSTS:
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, TEST_CLIENT_HOST]
+
+
+def get_auth_headers(token_key=None):
+    return {"Authorization": f"Token {token_key}"} if token_key else {}
+
+
+def make_client(token_key=None):
+    """
+    token_key 가 있으면 토큰 인증 헤더를 붙이는 테스트 클라이언트를 만듭니다.
+    """
+    return Client(headers=get_auth_headers(token_key))
+
+
+def timed_request(method, path, token_key=None, data=None):
+    """
+    요청 하나를 보내고 (상태 코드, 지연 시간(초)) 를 반환합니다.
+    """
+    client = make_client(token_key)
+    started = time.perf_counter()
+    if method == "post":
+        response = client.post(path, data, content_type="application/json")
+    else:
+        response = client.get(path, data)
+    return response.status_code, time.perf_counter() - started
+
+
+async def async_timed_request(client, method, path, token_key=None, data=None):
+    """
+    AsyncClient 로 ASGI 핸들러를 거쳐 요청 하나를 보내고 (상태 코드, 지연 시간(초)) 를 반환합니다.
+    """
+    headers = get_auth_headers(token_key)
+    started = time.perf_counter()
+    if method == "get":
+        response = await client.get(path, data, headers=headers)
+    else:
+        response = await client.generic(
+            method.upper(),
+            path,
+            json.dumps(data or {}),
+            content_type="application/json",
+            headers=headers,
+        )
+    return response.status_code, time.perf_counter() - started
+
+
+def percentile(sorted_values, pct):
+    """
+    정렬된 값 목록의 pct 백분위수를 선형 보간으로 계산합니다.
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        fraction
+    )
+
+
+def summarize(results, elapsed_seconds):
+    """
+    (상태 코드, 지연 시간) 목록을 요약합니다. 지연 시간은 밀리초로 변환합니다.
+    """
+    latencies = sorted(latency * 1000 for _, latency in results)
+    return {
+        "requests": len(results),
+        "elapsed_seconds": elapsed_seconds,
+        "throughput": len(results) / elapsed_seconds if elapsed_seconds else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "status_counts": dict(sorted(Counter(status for status, _ in results).items())),
+    }
+
+
+def format_summary(title, summary):
+    """
+    summarize 결과를 사람이 읽기 좋은 한 줄 보고서로 만듭니다.
+    """
+    statuses = " ".join(
+        f"{status}={count}" for status, count in summary["status_counts"].items()
+    )
+    return (
+        f"{title}: {summary['requests']} req in {summary['elapsed_seconds']:.2f}s "
+        f"({summary['throughput']:.1f} req/s) "
+        f"p50={summary['p50_ms']:.1f}ms p95={summary['p95_ms']:.1f}ms "
+        f"p99={summary['p99_ms']:.1f}ms max={summary['max_ms']:.1f}ms "
+        f"[{statuses}]"
+    )
@@ -0,0 +1,364 @@
+import random
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction, IntegrityError, OperationalError
+from django.db.models import Case, F, When
+from django.utils import timezone
+
+from .availability import availability_index, get_slot_position
+from .facilities import get_facility_for_model
+from .models import BookingAction
+from .signals import record_slots_changed
+from .versions import get_facility_day_version_key, get_versions
+
+
+class SlotUnavailableError(ValueError):
+    """
+    요청한 슬롯 중 하나라도 예약할 수 없을 때 발생합니다. 뷰에서는 409로 응답합니다.
+    """
+
+
+class BookingBusyError(SlotUnavailableError):
+    """
+    DB 쓰기 잠금을 재시도 횟수 안에 얻지 못했을 때 발생합니다. 뷰에서는 409로 응답합니다.
+    """
+
+
+class BookingQuotaExceededError(Exception):
+    """
+    하루 예약 행동 횟수 제한을 넘었을 때 발생합니다. 뷰에서는 400으로 응답합니다.
+    """
+
+
+def claim_booking_action(facility, user, date, max_booking_actions_per_day):
+    """
+    (사용자, 시설, 날짜) 의 예약 행동 횟수를 제한 안에서만 1 증가시킵니다.
+    반드시 예약 트랜잭션 안에서 호출해야 동시 요청이 함께 제한을 통과하지 못합니다.
+    """
+    booking_action, created = BookingAction.objects.get_or_create(
+        user=user,
+        facility=facility.key,
+        date=date,
+        defaults={"count": 1},
+    )
+    if created:
+        return booking_action
+    updated_count = BookingAction.objects.filter(
+        pk=booking_action.pk,
+        count__lt=max_booking_actions_per_day,
+    ).update(count=F("count") + 1)
+    if not updated_count:
+        raise BookingQuotaExceededError(
+            f"하루에 최대 {max_booking_actions_per_day}번의 예약 행동만 가능합니다."
+        )
+    return booking_action
+
+
+def is_database_locked_error(error):
+    """
+    SQLite 가 다른 연결의 쓰기 잠금 때문에 busy timeout 안에 잠금을 얻지 못했는지 확인합니다.
+    """
+    message = str(error).lower()
+    return "database is locked" in message or "database table is locked" in message
+
+
+def run_with_lock_retry(func):
+    """
+    func 를 실행하고, 잠금 경합으로 실패하면 지터를 준 지수 백오프로 제한된 횟수만큼 재시도합니다.
+    재시도 횟수를 모두 쓰면 BookingBusyError 를 발생시킵니다.
+
+    바깥 트랜잭션 안에서는 재시도해도 같은 잠금을 기다리게 되므로 바로 실패시킵니다.
+    """
+    max_attempts = settings.BOOKING_LOCK_RETRY_ATTEMPTS
+    base_delay = settings.BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except OperationalError as error:
+            if not is_database_locked_error(error):
+                raise
+            if attempt >= max_attempts or transaction.get_connection().in_atomic_block:
+                raise BookingBusyError(
+                    "예약 요청이 몰려 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+                ) from error
+        time.sleep(random.uniform(0, base_delay * 2 ** (attempt - 1)))
+        attempt += 1
+
+
+def get_day_versions(facility, start_times):
+    """
+    start_times 가 걸친 날짜마다 {날짜: 시설-날짜 버전} 을 조회 한 번으로 반환합니다.
+    """
+    days = sorted({get_slot_position(start_time)[0] for start_time in start_times})
+    return dict(
+        zip(
+            days,
+            get_versions([get_facility_day_version_key(facility, day) for day in days]),
+        )
+    )
+
+
+@contextmanager
+def booking_busy_timeout():
+    """
+    SQLite 에서 블록 안의 busy timeout 을 BOOKING_SQLITE_BUSY_TIMEOUT_SECONDS 로 줄였다가 되돌립니다.
+
+    예약은 run_with_lock_retry 가 지터를 준 백오프로 다시 시도하므로, 시도마다 연결의 긴
+    busy timeout(SQLITE_BUSY_TIMEOUT_SECONDS)을 다 기다리지 않고 빨리 실패해야
+    경합이 심해도 409 가 빨리 나갑니다. 바깥 트랜잭션 안에서는 바꾸지 않습니다.
+    """
+    connection = transaction.get_connection()
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA busy_timeout")
+        (previous_timeout_ms,) = cursor.fetchone()
+        cursor.execute(
+            "PRAGMA busy_timeout = %d"
+            % (settings.BOOKING_SQLITE_BUSY_TIMEOUT_SECONDS * 1000)
+        )
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout = %d" % previous_timeout_ms)
+
+
+def book_timeslots(
+    timeslot_model,
+    machine,
+    user,
+    start_time,
+    num_slots,
+    slot_duration_minutes,
+    max_booking_actions_per_day,
+):
+    """
+    start_time 부터 연속된 num_slots 개의 슬롯을 한 트랜잭션에서 예약합니다.
+
+    1. 하루 예약 행동 횟수를 조건부로 증가시킵니다. 제한을 넘으면
+       BookingQuotaExceededError 를 발생시킵니다.
+    2. 요청 범위의 빈 슬롯을 user 가 NULL 인 행만 대상으로 하는 UPDATE 한 번으로 차지합니다.
+       generate_timeslots 명령으로 슬롯을 미리 만들어 두었다면 여기서 예약이 끝납니다.
+    3. 차지하지 못한 슬롯이 있으면 기존 슬롯을 한 번의 SELECT 로 가져와,
+       이미 예약된 슬롯이 있으면 SlotUnavailableError 를 발생시킵니다(트랜잭션은 롤백됩니다).
+    4. 없는 슬롯은 bulk_create 한 번으로 만듭니다.
+    5. 같은 트랜잭션에서 리소스 버전을 올리고, 커밋 이후 slots_changed 를 보냅니다
+       (signals.record_slots_changed).
+
+    트랜잭션이 DB 잠금 경합으로 실패하면 run_with_lock_retry 가 제한된 횟수만큼 다시 실행하고,
+    끝내 실패하면 BookingBusyError(409) 를 발생시킵니다. 시도마다 짧은 busy timeout
+    (booking_busy_timeout) 만 기다립니다.
+
+    (예약된 슬롯 목록, 새로 만든 슬롯이 있는지 여부) 를 반환합니다.
+    """
+    facility = get_facility_for_model(timeslot_model)
+    start_times = [
+        start_time + timedelta(minutes=i * slot_duration_minutes)
+        for i in range(num_slots)
+    ]
+    # 인덱스는 다른 워커(관리자 등)의 예약 해제를 모를 수 있으므로
+    # 예약된 슬롯이 보이면 시설-날짜 버전으로 인덱스가 최신인지 확인한 뒤에만 거절합니다.
+    if not availability_index.is_free(facility, machine.pk, start_times):
+        versions = get_day_versions(facility, start_times)
+        if not availability_index.is_free(facility, machine.pk, start_times, versions):
+            raise SlotUnavailableError("선택한 시간에 이미 예약된 슬롯이 있습니다.")
+
+    booked_at = timezone.now()
+    with booking_busy_timeout():
+        claimed_slots, created_slots = run_with_lock_retry(
+            lambda: _claim_timeslots(
+                timeslot_model,
+                facility,
+                machine,
+                user,
+                start_times,
+                booked_at,
+                slot_duration_minutes,
+                max_booking_actions_per_day,
+            )
+        )
+
+    booked_slots = sorted(
+        claimed_slots + created_slots, key=lambda slot: slot.start_time
+    )
+    return booked_slots, bool(created_slots)
+
+
+def _claim_timeslots(
+    timeslot_model,
+    facility,
+    machine,
+    user,
+    start_times,
+    booked_at,
+    slot_duration_minutes,
+    max_booking_actions_per_day,
+):
+    """
+    book_timeslots 의 트랜잭션 부분입니다. 잠금 경합 시 통째로 다시 실행될 수 있습니다.
+    """
+    start_time = start_times[0]
+    try:
+        with transaction.atomic():
+            booking_action = claim_booking_action(
+                facility,
+                user,
+                timezone.localtime(start_time).date(),
+                max_booking_actions_per_day,
+            )
+            # 미리 만들어 둔 빈 슬롯은 조건부 UPDATE 한 번으로 차지합니다.
+            # 영향받은 행 수가 요청한 슬롯 수와 같으면 읽기 없이 성공이 결정됩니다.
+            slots = timeslot_model.objects.filter(
+                **{facility.machine_fk_field: machine},
+                start_time__in=start_times,
+            )
+            claimed_count = slots.filter(user__isnull=True).update(
+                user=user, booked_at=booked_at, booking_action=booking_action
+            )
+            existing_slots = {slot.start_time: slot for slot in slots}
+            if claimed_count == len(start_times):
+                record_slots_changed(
+                    timeslot_model, machine.pk, start_times, True, [user.pk]
+                )
+                return list(existing_slots.values()), []
+
+            for slot in existing_slots.values():
+                if slot.user_id == user.pk and slot.booked_at == booked_at:
+                    continue
+                slot_time = timezone.localtime(slot.start_time).strftime("%H:%M")
+                if slot.user_id == user.pk:
+                    raise SlotUnavailableError(
+                        f"{slot_time} 슬롯은 이미 본인의 이전 예약에 포함되어 있습니다."
+                    )
+                raise SlotUnavailableError(
+                    f"{slot_time} 슬롯은 이미 다른 사용자가 예약했습니다."
+                )
+
+            # 아직 만들어지지 않은 슬롯은 만들면서 예약합니다.
+            # 동시에 같은 슬롯을 만든 요청이 있으면 유니크 제약으로 IntegrityError 가 납니다.
+            created_slots = timeslot_model.objects.bulk_create(
+                [
+                    timeslot_model(
+                        **{facility.machine_fk_field: machine},
+                        user=user,
+                        start_time=slot_start_time,
+                        end_time=slot_start_time
+                        + timedelta(minutes=slot_duration_minutes),
+                        booked_at=booked_at,
+                        booking_action=booking_action,
+                    )
+                    for slot_start_time in start_times
+                    if slot_start_time not in existing_slots
+                ]
+            )
+            record_slots_changed(
+                timeslot_model, machine.pk, start_times, True, [user.pk]
+            )
+            return list(existing_slots.values()), created_slots
+    except IntegrityError:
+        raise SlotUnavailableError(
+            "데이터 저장 중 충돌이 발생했습니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+def claim_timeslot(timeslot, user):
+    """
+    이미 있는 빈 슬롯 하나를 user 가 NULL 인 행만 대상으로 하는 UPDATE 한 번으로 예약합니다.
+    다른 요청이 먼저 예약했으면 SlotUnavailableError 를 발생시킵니다.
+    """
+    timeslot_model = type(timeslot)
+    machine_fk_field = get_facility_for_model(timeslot_model).machine_fk_field
+    booked_at = timezone.now()
+    with transaction.atomic():
+        updated_count = timeslot_model.objects.filter(
+            pk=timeslot.pk, user__isnull=True
+        ).update(user=user, booked_at=booked_at)
+        if not updated_count:
+            raise SlotUnavailableError("이미 예약된 시간입니다.")
+        record_slots_changed(
+            timeslot_model,
+            getattr(timeslot, f"{machine_fk_field}_id"),
+            [timeslot.start_time],
+            True,
+            [user.pk],
+        )
+    timeslot.user = user
+    timeslot.booked_at = booked_at
+
+
+def release_timeslots(timeslots):
+    """
+    timeslots 중 예약된 슬롯의 예약을 한 트랜잭션에서 해제하고 해제한 슬롯 수를 반환합니다.
+
+    1. 예약된 슬롯을 SELECT 한 번으로 가져와 UPDATE 한 번으로 비웁니다.
+    2. 예약 요청(같은 예약 행동, 같은 booked_at 의 슬롯 묶음)의 슬롯이 모두 해제되었으면
+       그 예약 행동의 count 를 요청 수만큼 UPDATE 한 번으로 줄여 하루 예약 횟수를 되돌립니다.
+    3. 기구마다 record_slots_changed 를 호출합니다.
+
+    관리자의 예약 해제, 사용 불가 처리, 예약된 슬롯 삭제는 모두 이 함수를 거칩니다.
+    """
+    model = timeslots.model
+    machine_id_field = f"{get_facility_for_model(model).machine_fk_field}_id"
+    with transaction.atomic():
+        rows = list(
+            timeslots.filter(user__isnull=False)
+            .order_by()
+            .values_list(
+                "pk",
+                machine_id_field,
+                "start_time",
+                "user_id",
+                "booking_action_id",
+                "booked_at",
+            )
+        )
+        if not rows:
+            return 0
+        model.objects.filter(pk__in=[row[0] for row in rows]).update(
+            user=None, booked_at=None, booking_action=None
+        )
+
+        released_requests = {
+            (booking_action_pk, booked_at)
+            for _, _, _, _, booking_action_pk, booked_at in rows
+            if booking_action_pk is not None
+        }
+        if released_requests:
+            # 일부 슬롯만 해제된 예약 요청은 아직 예약 행동으로 남습니다.
+            remaining_requests = set(
+                model.objects.filter(
+                    booking_action_id__in={pk for pk, _ in released_requests},
+                    booked_at__in={booked_at for _, booked_at in released_requests},
+                ).values_list("booking_action_id", "booked_at")
+            )
+            released_counts = Counter(
+                booking_action_pk
+                for booking_action_pk, _ in released_requests - remaining_requests
+            )
+            if released_counts:
+                BookingAction.objects.filter(pk__in=released_counts).update(
+                    count=Case(
+                        *[
+                            When(pk=booking_action_pk, then=F("count") - released)
+                            for booking_action_pk, released in released_counts.items()
+                        ]
+                    )
+                )
+
+        changes = defaultdict(lambda: ([], set()))
+        for _, machine_pk, start_time, user_pk, _, _ in rows:
+            start_times, user_pks = changes[machine_pk]
+            start_times.append(start_time)
+            user_pks.add(user_pk)
+        for machine_pk, (start_times, user_pks) in changes.items():
+            record_slots_changed(
+                model, machine_pk, start_times, False, sorted(user_pks)
+            )
+    return len(rows)
@@ -0,0 +1,274 @@
+"""
+슬롯 변경 이벤트 전달(Server-Sent Events)
+
+예약 상태나 기구 정보를 바꾼 트랜잭션 안에서 이벤트를 SlotEvent 테이블에 저장하고
+(signals.record_slots_changed/record_machines_changed), 커밋되면
+같은 프로세스의 구독자에게 바로 보냅니다(SlotEventBroadcaster).
+다른 워커가 저장한 이벤트는 구독자가 있는 동안 relay 스레드가
+SLOT_EVENT_RELAY_INTERVAL_SECONDS 마다 테이블에서 읽어 보냅니다.
+
+구독자마다 크기가 SLOT_EVENT_QUEUE_SIZE 인 큐를 두고, 큐가 가득 찰 만큼 느린 구독자는
+이벤트를 더 쌓지 않고 연결을 끊습니다. 클라이언트는 다시 연결하면서 Last-Event-ID 로
+놓친 이벤트를 SlotEvent 테이블에서 이어 받습니다.
+
+SlotEvent 테이블은 SSE 연결을 유지하기 어려운 클라이언트를 위한 변경 목록
+(ChangeListAPIView) 으로도 쓰이며, compact_slot_events 명령으로 오래된 이벤트를 지웁니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .facilities import get_facility_for_model
+from .models import SlotEvent, SlotEventCompaction
+
+logger = logging.getLogger(__name__)
+
+# 이 프로세스가 저장한 이벤트를 relay 에서 다시 보내지 않도록 구분하는 값
+PROCESS_ORIGIN = uuid.uuid4().hex
+
+_datetime_field = serializers.DateTimeField()
+
+
+class Subscription:
+    """
+    시설 하나의 하루치 이벤트를 받는 구독자. 이벤트 루프 스레드에서 만들고 읽습니다.
+    """
+
+    def __init__(self, facility_key, date):
+        self.facility_key = facility_key
+        self.date = date
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=settings.SLOT_EVENT_QUEUE_SIZE)
+        self.dropped = False
+
+    def matches(self, event):
+        return event.facility == self.facility_key and event.date in (None, self.date)
+
+    def offer(self, event):
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped = True
+
+    async def get(self, timeout):
+        """
+        다음 이벤트를 반환합니다. timeout 동안 이벤트가 없으면 None 을,
+        큐가 넘쳐 끊긴 구독자이면 DroppedError 를 일으킵니다.
+        """
+        if self.dropped:
+            raise DroppedError
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class DroppedError(Exception):
+    pass
+
+
+class SlotEventBroadcaster:
+    """
+    프로세스 안의 구독자에게 이벤트를 나눠 주는 브로드캐스터
+
+    publish 는 어느 스레드에서 불러도 되며, 이벤트는 구독자의 이벤트 루프에서 큐에 넣습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+        self._relay_thread = None
+        self._relay_last_id = None
+
+    def subscribe(self, facility_key, date):
+        subscription = Subscription(facility_key, date)
+        with self._lock:
+            self._subscriptions[facility_key].add(subscription)
+        self._start_relay()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.facility_key)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.facility_key]
+
+    def publish(self, event):
+        with self._lock:
+            subscriptions = [
+                subscription
+                for subscription in self._subscriptions.get(event.facility, ())
+                if subscription.matches(event)
+            ]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 구독자
+                self.unsubscribe(subscription)
+
+    def relay_once(self):
+        """
+        다른 프로세스가 마지막으로 읽은 뒤 저장한 이벤트를 구독자에게 보냅니다.
+        """
+        events = SlotEvent.objects.exclude(origin=PROCESS_ORIGIN).order_by("pk")
+        if self._relay_last_id is None:
+            # 처음에는 이미 저장된 이벤트를 건너뛰고 지금부터의 이벤트만 보냅니다.
+            last_event = SlotEvent.objects.order_by("-pk").only("pk").first()
+            self._relay_last_id = last_event.pk if last_event is not None else 0
+            return
+        for event in events.filter(pk__gt=self._relay_last_id):
+            self.publish(event)
+            self._relay_last_id = event.pk
+
+    def _start_relay(self):
+        interval = settings.SLOT_EVENT_RELAY_INTERVAL_SECONDS
+        if interval is None:
+            return
+        with self._lock:
+            if self._relay_thread is not None:
+                return
+            self._relay_thread = threading.Thread(
+                target=self._run_relay, args=(interval,), daemon=True
+            )
+        self._relay_thread.start()
+
+    def _run_relay(self, interval):
+        while True:
+            with self._lock:
+                # 구독자 확인과 정리를 한 잠금 안에서 해야
+                # 그 사이에 구독한 클라이언트가 relay 없이 남지 않습니다.
+                if not self._subscriptions:
+                    self._relay_thread = None
+                    self._relay_last_id = None
+                    return
+            try:
+                self.relay_once()
+            except Exception:
+                logger.exception("슬롯 이벤트 relay 실패")
+            finally:
+                connection.close()
+            time.sleep(interval)
+
+
+slot_event_broadcaster = SlotEventBroadcaster()
+
+
+def save_events(events):
+    """
+    호출한 트랜잭션 안에서 이벤트를 저장하고, 커밋되면 이 프로세스의 구독자에게 보냅니다.
+    """
+    saved_events = SlotEvent.objects.bulk_create(events)
+
+    def publish():
+        for event in saved_events:
+            slot_event_broadcaster.publish(event)
+
+    transaction.on_commit(publish)
+
+
+def get_compacted_event_id():
+    """
+    compact_events 로 지운 마지막 이벤트 pk. 지운 적이 없으면 0 입니다.
+    """
+    return (
+        SlotEventCompaction.objects.values_list("last_deleted_id", flat=True).first()
+        or 0
+    )
+
+
+def compact_events(before, batch_size):
+    """
+    before 이전에 저장한 이벤트를 오래된 것부터 batch_size 개씩 지우고 지운 수를 반환합니다.
+
+    지운 마지막 이벤트 pk 를 SlotEventCompaction 에 남겨 두어, 그보다 앞선 cursor 로
+    변경 목록을 요청한 클라이언트에게 목록 전체를 다시 받아야 한다고 알려줍니다.
+    """
+    deleted_count = 0
+    while True:
+        with transaction.atomic():
+            pks = list(
+                SlotEvent.objects.filter(created_at__lt=before)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            SlotEvent.objects.filter(pk__in=pks).delete()
+            SlotEventCompaction.objects.update_or_create(
+                pk=1,
+                defaults={"last_deleted_id": max(pks[-1], get_compacted_event_id())},
+            )
+        deleted_count += len(pks)
+        if len(pks) < batch_size:
+            break
+    return deleted_count
+
+
+def record_slot_events(sender, machine_pk, start_times, booked):
+    """
+    슬롯 예약 상태 변경을 날짜별 slots 이벤트로 저장합니다. 예약한 사용자는 포함하지 않습니다.
+    """
+    facility = get_facility_for_model(sender)
+    start_times_by_date = defaultdict(list)
+    for start_time in sorted(start_times):
+        start_times_by_date[timezone.localtime(start_time).date()].append(start_time)
+    save_events(
+        [
+            SlotEvent(
+                facility=facility.key,
+                date=date,
+                event_type=SlotEvent.EventType.SLOTS,
+                data={
+                    facility.machine_fk_field: machine_pk,
+                    "booked": booked,
+                    "start_times": [
+                        _datetime_field.to_representation(start_time)
+                        for start_time in date_start_times
+                    ],
+                },
+                origin=PROCESS_ORIGIN,
+            )
+            for date, date_start_times in start_times_by_date.items()
+        ]
+    )
+
+
+def record_machine_events(sender, machine_pks):
+    """
+    기구 정보 변경을 모든 날짜의 구독자에게 가는 machines 이벤트로 저장합니다.
+    삭제된 기구는 deleted 에 담습니다.
+    """
+    facility = get_facility_for_model(sender)
+    machines = list(
+        sender.objects.filter(pk__in=machine_pks)
+        .order_by("pk")
+        .values("pk", "is_available")
+    )
+    existing_pks = {machine["pk"] for machine in machines}
+    save_events(
+        [
+            SlotEvent(
+                facility=facility.key,
+                event_type=SlotEvent.EventType.MACHINES,
+                data={
+                    "machines": machines,
+                    "deleted": sorted(set(machine_pks) - existing_pks),
+                },
+                origin=PROCESS_ORIGIN,
+            )
+        ]
+    )
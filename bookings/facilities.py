@@ -0,0 +1,67 @@
+from django.apps import apps
+
+
+class Facility:
+    """
+    예약 가능한 기구 종류 하나에 대한 메타데이터
+
+    기구 모델, 타임슬롯 모델, 타임슬롯에서 기구를 가리키는 필드 이름을 묶어
+    여러 시설을 한꺼번에 다루는 기능(현재 사용 현황, 캐시 무효화 등)에서 사용합니다.
+    """
+
+    def __init__(
+        self, key, machine_model_label, timeslot_model_label, machine_fk_field
+    ):
+        self.key = key
+        self.machine_model_label = machine_model_label
+        self.timeslot_model_label = timeslot_model_label
+        self.machine_fk_field = machine_fk_field
+
+    def __repr__(self):
+        return f"<Facility {self.key}>"
+
+    @property
+    def machine_model(self):
+        return apps.get_model(self.machine_model_label)
+
+    @property
+    def timeslot_model(self):
+        return apps.get_model(self.timeslot_model_label)
+
+
+FACILITIES = {
+    facility.key: facility
+    for facility in [
+        Facility("treadmill", "gym.Treadmill", "gym.TreadmillTimeSlot", "treadmill"),
+        Facility("cycle", "gym.Cycle", "gym.CycleTimeSlot", "cycle"),
+        Facility(
+            "ping_pong_table",
+            "lounge.PingPongTable",
+            "lounge.PingPongTableTimeSlot",
+            "ping_pong_table",
+        ),
+        Facility(
+            "arcade_machine",
+            "lounge.ArcadeMachine",
+            "lounge.ArcadeMachineTimeSlot",
+            "arcade_machine",
+        ),
+        Facility(
+            "induction",
+            "kitchen.Induction",
+            "kitchen.InductionTimeSlot",
+            "induction",
+        ),
+    ]
+}
+
+
+def get_facility_for_model(model):
+    """
+    기구 모델 또는 타임슬롯 모델로 Facility 를 찾습니다.
+    """
+    label = model._meta.label
+    for facility in FACILITIES.values():
+        if label in (facility.machine_model_label, facility.timeslot_model_label):
+            return facility
+    raise LookupError(f"{label} 에 해당하는 시설이 없습니다.")
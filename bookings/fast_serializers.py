@@ -0,0 +1,96 @@
+"""
+목록 조회용 가벼운 직렬화
+
+슬롯 목록 API 는 모델 인스턴스를 만들어 ModelSerializer 로 직렬화하는 대신
+values_list() 로 필요한 열만 튜플로 가져와 같은 모양의 dict 로 바로 바꿉니다.
+출력 필드와 순서는 각 시설의 List*TimeSlotSerializer 를 그대로 따르므로 JSON 은 같습니다.
+"""
+
+from django.utils import timezone
+
+# values_list() 로 가져오는 열 순서. 기구 열은 시설마다 이름이 달라 get_timeslot_row_columns 로 만듭니다.
+PK, MACHINE_ID, USER_ID, START_TIME, END_TIME, BOOKED_AT = range(6)
+
+_field_plans = {}
+
+
+def get_timeslot_row_columns(machine_fk_field):
+    return [
+        "pk",
+        f"{machine_fk_field}_id",
+        "user_id",
+        "start_time",
+        "end_time",
+        "booked_at",
+    ]
+
+
+def get_timeslot_rows(queryset, machine_fk_field):
+    """
+    queryset 의 슬롯을 (pk, 기구 pk, 사용자 pk, start_time, end_time, booked_at) 튜플로 가져옵니다.
+    """
+    return queryset.values_list(*get_timeslot_row_columns(machine_fk_field))
+
+
+def _format_datetime(index):
+    """
+    DRF DateTimeField 의 ISO 8601 출력과 같게, 현재 시간대로 바꾼 뒤 isoformat() 으로 만듭니다.
+    시간대는 직렬화 호출마다 한 번만 구합니다.
+    """
+
+    def format_datetime(row, tz):
+        value = row[index]
+        if value is None:
+            return None
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return format_datetime
+
+
+def _get_pk(row, tz):
+    return row[PK]
+
+
+def _get_machine_id(row, tz):
+    return row[MACHINE_ID]
+
+
+def _is_booked(row, tz):
+    return row[USER_ID] is not None
+
+
+def _get_field_plan(serializer_class, machine_fk_field):
+    """
+    직렬화기의 출력 필드 순서대로 (필드 이름, 튜플에서 값을 꺼내는 함수) 목록을 만듭니다.
+    """
+    key = (serializer_class, machine_fk_field)
+    if key not in _field_plans:
+        getters = {
+            "pk": _get_pk,
+            machine_fk_field: _get_machine_id,
+            "is_booked": _is_booked,
+            "start_time": _format_datetime(START_TIME),
+            "end_time": _format_datetime(END_TIME),
+            "booked_at": _format_datetime(BOOKED_AT),
+        }
+        field_names = list(serializer_class().fields)
+        unsupported = set(field_names) - set(getters)
+        if unsupported:
+            raise ValueError(
+                f"{serializer_class.__name__} 의 {sorted(unsupported)} 필드는 "
+                "가벼운 직렬화를 지원하지 않습니다."
+            )
+        _field_plans[key] = [(name, getters[name]) for name in field_names]
+    return _field_plans[key]
+
+
+def serialize_timeslot_rows(serializer_class, machine_fk_field, rows):
+    """
+    get_timeslot_rows 의 튜플 목록을 serializer_class(many=True).data 와 같은 dict 목록으로 바꿉니다.
+    """
+    plan = _get_field_plan(serializer_class, machine_fk_field)
+    tz = timezone.get_current_timezone()
+    return [{name: getter(row, tz) for name, getter in plan} for row in rows]
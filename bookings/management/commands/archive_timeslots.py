@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from bookings.archive import archive_timeslots
+from bookings.facilities import FACILITIES
+from bookings.utils import get_day_range
+
+
+class Command(BaseCommand):
+    help = (
+        "보관 기간이 지난 슬롯을 시설별 타임슬롯 테이블에서 보관 테이블로 옮깁니다. "
+        "예약된 슬롯만 보관하고 빈 슬롯은 삭제하며, 배치 단위로 나누어 처리합니다. "
+        "스케줄러에서 매일 반복 실행해도 됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TIMESLOT_ARCHIVE_AFTER_DAYS,
+            help="오늘보다 이 날짜 수 이전에 시작한 슬롯을 보관합니다",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TIMESLOT_ARCHIVE_BATCH_SIZE,
+            help="트랜잭션 하나에서 옮길 최대 슬롯 수",
+        )
+        parser.add_argument(
+            "--facility",
+            choices=[*FACILITIES, "all"],
+            default="all",
+            help="대상 시설 (기본값: 모든 시설)",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--days 와 --batch-size 는 1 이상이어야 합니다.")
+        facilities = (
+            FACILITIES.values()
+            if options["facility"] == "all"
+            else [FACILITIES[options["facility"]]]
+        )
+        before, _ = get_day_range(
+            timezone.localdate() - timedelta(days=options["days"])
+        )
+
+        for facility in facilities:
+            archived_count, deleted_count = archive_timeslots(
+                facility, before, options["batch_size"]
+            )
+            self.stdout.write(
+                f"{facility.key}: {archived_count} bookings archived, "
+                f"{deleted_count - archived_count} empty slots deleted"
+            )
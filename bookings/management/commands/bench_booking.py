@@ -0,0 +1,188 @@
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from bookings.benchmarks import (
+    BOOK_URL_NAMES,
+    allow_test_client_host,
+    format_summary,
+    summarize,
+    timed_request,
+)
+from bookings.facilities import FACILITIES
+from users.models import User
+
+# 벤치마크용 사용자 학번 접두사. 실제 학번과 겹치지 않도록 0 으로 시작합니다.
+BENCH_STUDENT_ID_PREFIX = "0000"
+
+SUCCESS_STATUSES = (200, 201)
+
+
+def post_booking(args):
+    """
+    풀 작업자에서 예약 요청 하나를 보냅니다.
+    실제 요청 처리처럼 요청이 끝나면 DB 연결을 닫습니다.
+    """
+    token_key, path, payload = args
+    try:
+        return timed_request("post", path, token_key, payload)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "여러 사용자가 같은 기구의 같은 슬롯을 동시에 예약하도록 요청을 보내 "
+        "지연 시간 백분위수, 처리량, 상태 코드 분포를 보고하고 이중 예약이 없는지 확인합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=50, help="동시에 예약을 시도할 사용자 수"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=16, help="스레드/프로세스 풀 크기"
+        )
+        parser.add_argument(
+            "--facility",
+            choices=[*FACILITIES, "all"],
+            default="all",
+            help="대상 시설 (기본값: 모든 시설)",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["thread", "process", "both"],
+            default="both",
+            help="요청을 보낼 풀 종류",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="벤치마크용 사용자, 기구, 슬롯을 지우지 않고 남겨둡니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["workers"] < 1:
+            raise CommandError("--users 와 --workers 는 1 이상이어야 합니다.")
+        if options["facility"] == "all":
+            facilities = list(FACILITIES.values())
+        else:
+            facilities = [FACILITIES[options["facility"]]]
+        modes = (
+            ["thread", "process"] if options["mode"] == "both" else [options["mode"]]
+        )
+
+        # 409 응답마다 찍히는 요청 경고 로그를 숨깁니다. 500 오류는 그대로 보입니다.
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+
+        allow_test_client_host()
+        token_keys = self.create_users(options["users"])
+        machines = []
+        failures = []
+        try:
+            for facility in facilities:
+                machine = facility.machine_model.objects.create()
+                machines.append(machine)
+                path = reverse(BOOK_URL_NAMES[facility.key], kwargs={"pk": machine.pk})
+                for round_index, mode in enumerate(modes):
+                    # 시설별 하루 예약 횟수 제한에 걸리지 않도록 라운드마다 날짜를 바꿉니다.
+                    start_time = timezone.make_aware(
+                        datetime.combine(
+                            timezone.localdate() + timedelta(days=round_index + 1),
+                            dt_time(10, 0),
+                        )
+                    )
+                    payload = {"start_time": start_time.isoformat()}
+                    tasks = [(token_key, path, payload) for token_key in token_keys]
+                    results, elapsed = self.run_pool(mode, options["workers"], tasks)
+                    self.stdout.write(
+                        format_summary(
+                            f"{facility.key}/{mode}", summarize(results, elapsed)
+                        )
+                    )
+                    failures.extend(
+                        self.check_slot(facility, machine, start_time, results, mode)
+                    )
+        finally:
+            if not options["keep"]:
+                for machine in machines:
+                    machine.delete()
+                User.objects.filter(
+                    student_id_number__startswith=BENCH_STUDENT_ID_PREFIX
+                ).delete()
+
+        if failures:
+            raise CommandError("\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("이중 예약 없음"))
+
+    def create_users(self, count):
+        """
+        벤치마크용 사용자와 토큰을 만들고 토큰 키 목록을 반환합니다.
+        이전 실행에서 남은 벤치마크 사용자는 먼저 지웁니다.
+        """
+        User.objects.filter(
+            student_id_number__startswith=BENCH_STUDENT_ID_PREFIX
+        ).delete()
+        users = User.objects.bulk_create(
+            [
+                User(
+                    student_id_number=f"{BENCH_STUDENT_ID_PREFIX}{index:06d}",
+                    password=make_password(None),
+                )
+                for index in range(count)
+            ]
+        )
+        tokens = Token.objects.bulk_create(
+            [Token(user=user, key=Token.generate_key()) for user in users]
+        )
+        return [token.key for token in tokens]
+
+    def run_pool(self, mode, workers, tasks):
+        """
+        모든 요청을 풀에 한꺼번에 넣고 (결과 목록, 걸린 시간(초)) 를 반환합니다.
+        프로세스 풀은 fork 로 만들기 때문에 부모의 DB 연결을 먼저 닫습니다.
+        """
+        if mode == "process":
+            connections.close_all()
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("fork")
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        with executor:
+            started = time.perf_counter()
+            results = list(executor.map(post_booking, tasks))
+            elapsed = time.perf_counter() - started
+        return results, elapsed
+
+    def check_slot(self, facility, machine, start_time, results, mode):
+        """
+        한 슬롯에 대한 동시 요청 결과와 DB 상태를 비교해 이중 예약 여부를 확인합니다.
+        성공 응답은 최대 하나여야 하고, DB 에 예약된 슬롯 수와 같아야 합니다.
+        """
+        label = f"{facility.key}/{mode}"
+        success_count = sum(1 for status, _ in results if status in SUCCESS_STATUSES)
+        booked_count = facility.timeslot_model.objects.filter(
+            **{facility.machine_fk_field: machine},
+            start_time=start_time,
+            user__isnull=False,
+        ).count()
+        failures = []
+        if success_count > 1:
+            failures.append(
+                f"{label}: 같은 슬롯에 {success_count}건의 예약이 성공했습니다."
+            )
+        if success_count != booked_count:
+            failures.append(
+                f"{label}: 성공 응답 {success_count}건, DB 에 예약된 슬롯 {booked_count}건"
+            )
+        return failures
@@ -0,0 +1,194 @@
+import asyncio
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from bookings.benchmarks import (
+    allow_test_client_host,
+    async_timed_request,
+    format_summary,
+    summarize,
+    timed_request,
+)
+from bookings.utils import get_day_range
+from gym.models import Treadmill, TreadmillTimeSlot
+from users.models import User
+
+# 벤치마크용 사용자 학번 접두사. 실제 학번과 겹치지 않도록 0 으로 시작합니다.
+BENCH_STUDENT_ID_PREFIX = "0002"
+
+# 모드별 (기구 목록, 슬롯 목록, 내 예약 목록) URL 이름
+READ_URL_NAMES = {
+    "wsgi": ("treadmill-list", "treadmill-timeslot-list", "my-all-bookings"),
+    "asgi": (
+        "async-treadmill-list",
+        "async-treadmill-timeslot-list",
+        "async-my-all-bookings",
+    ),
+}
+
+
+def get_read(args):
+    """
+    스레드 풀 작업자에서 조회 요청 하나를 보냅니다.
+    실제 요청 처리처럼 요청이 끝나면 DB 연결을 닫습니다.
+    """
+    token_key, path, params = args
+    try:
+        return timed_request("get", path, token_key, params)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "기구 목록, 슬롯 목록, 내 예약 목록 조회 요청을 같은 동시 연결 수로 보내, "
+        "요청마다 스레드 하나를 쓰는 WSGI 동기 뷰와 이벤트 루프에서 처리하는 ASGI 비동기 뷰의 "
+        "초당 요청 수와 동시 연결당 메모리를 비교합니다. "
+        "메모리는 tracemalloc 으로 잰 Python 할당 최대치이며 스레드 스택(OS 메모리)은 포함하지 않으므로 "
+        "WSGI 쪽 값은 실제보다 작게 나옵니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300, help="요청 수")
+        parser.add_argument(
+            "--concurrency", type=int, default=32, help="동시에 열려 있는 연결 수"
+        )
+        parser.add_argument(
+            "--machines", type=int, default=10, help="벤치마크용 런닝머신 수"
+        )
+        parser.add_argument(
+            "--mode",
+            choices=["wsgi", "asgi", "both"],
+            default="both",
+            help="비교할 실행 방식",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["requests"], options["concurrency"], options["machines"]) < 1:
+            raise CommandError(
+                "--requests, --concurrency, --machines 는 1 이상이어야 합니다."
+            )
+        modes = ["wsgi", "asgi"] if options["mode"] == "both" else [options["mode"]]
+
+        allow_test_client_host()
+        token_key, machines = self.create_data(options["machines"])
+        try:
+            for mode in modes:
+                caches[settings.TIMESLOT_LIST_CACHE_ALIAS].clear()
+                tasks = self.build_tasks(mode, token_key, machines, options["requests"])
+                tracemalloc.start()
+                try:
+                    if mode == "wsgi":
+                        results, elapsed = self.run_threads(
+                            tasks, options["concurrency"]
+                        )
+                    else:
+                        results, elapsed = asyncio.run(
+                            self.run_event_loop(tasks, options["concurrency"])
+                        )
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                self.stdout.write(format_summary(mode, summarize(results, elapsed)))
+                self.stdout.write(
+                    f"{mode} memory: peak {peak / 1024:.1f}KiB "
+                    f"({peak / options['concurrency'] / 1024:.1f}KiB per connection)"
+                )
+        finally:
+            Treadmill.objects.filter(
+                pk__in=[machine.pk for machine in machines]
+            ).delete()
+            User.objects.filter(
+                student_id_number__startswith=BENCH_STUDENT_ID_PREFIX
+            ).delete()
+
+    def create_data(self, machine_count):
+        """
+        벤치마크용 사용자와 토큰, 런닝머신을 만들고 내일 슬롯을 기구마다 몇 개씩 예약해 둡니다.
+        (토큰 키, 기구 목록) 을 반환합니다.
+        """
+        User.objects.filter(
+            student_id_number__startswith=BENCH_STUDENT_ID_PREFIX
+        ).delete()
+        user = User.objects.create(
+            student_id_number=f"{BENCH_STUDENT_ID_PREFIX}000000",
+            password=make_password(None),
+        )
+        token_key = Token.objects.create(user=user).key
+        machines = Treadmill.objects.bulk_create(
+            [Treadmill() for _ in range(machine_count)]
+        )
+        day_start, _ = get_day_range(timezone.localdate() + timedelta(days=1))
+        TreadmillTimeSlot.objects.bulk_create(
+            [
+                TreadmillTimeSlot(
+                    treadmill=machine,
+                    user=user,
+                    start_time=day_start + timedelta(hours=hour),
+                    end_time=day_start + timedelta(hours=hour, minutes=30),
+                    booked_at=day_start,
+                )
+                for machine in machines
+                for hour in range(0, 24, 4)
+            ]
+        )
+        return token_key, machines
+
+    def build_tasks(self, mode, token_key, machines, count):
+        """
+        세 가지 조회 요청을 번갈아 count 개 만듭니다.
+        슬롯 목록은 두 방식 모두 응답 캐시를 거치지 않도록 date_from/date_to 로 조회합니다.
+        """
+        machine_list_name, timeslot_list_name, my_bookings_name = READ_URL_NAMES[mode]
+        day = (timezone.localdate() + timedelta(days=1)).isoformat()
+        tasks = []
+        for index in range(count):
+            kind = index % 3
+            if kind == 0:
+                path, params = reverse(machine_list_name), None
+            elif kind == 1:
+                machine = machines[index % len(machines)]
+                path = reverse(timeslot_list_name, args=[machine.pk])
+                params = {"date_from": day, "date_to": day}
+            else:
+                path, params = reverse(my_bookings_name), None
+            tasks.append((token_key, path, params))
+        return tasks
+
+    def run_threads(self, tasks, concurrency):
+        """
+        WSGI 서버처럼 동시 연결마다 스레드 하나가 요청을 처리합니다.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            started = time.perf_counter()
+            results = list(executor.map(get_read, tasks))
+            elapsed = time.perf_counter() - started
+        return results, elapsed
+
+    async def run_event_loop(self, tasks, concurrency):
+        """
+        ASGI 핸들러로 최대 concurrency 개의 요청을 동시에 보냅니다.
+        """
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(token_key, path, params):
+            async with semaphore:
+                return await async_timed_request(client, "get", path, token_key, params)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(send(*task) for task in tasks))
+        elapsed = time.perf_counter() - started
+        return results, elapsed
@@ -0,0 +1,109 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from bookings.facilities import FACILITIES
+from bookings.fast_serializers import get_timeslot_rows, serialize_timeslot_rows
+from bookings.utils import get_day_range
+from gym.serializers import ListCycleTimeSlotSerializer, ListTreadmillTimeSlotSerializer
+from kitchen.serializers import ListInductionTimeSlotSerializer
+from lounge.serializers import (
+    ListArcadeMachineTimeSlotSerializer,
+    ListPingPongTableTimeSlotSerializer,
+)
+
+LIST_SERIALIZER_CLASSES = {
+    "treadmill": ListTreadmillTimeSlotSerializer,
+    "cycle": ListCycleTimeSlotSerializer,
+    "ping_pong_table": ListPingPongTableTimeSlotSerializer,
+    "arcade_machine": ListArcadeMachineTimeSlotSerializer,
+    "induction": ListInductionTimeSlotSerializer,
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "슬롯 목록을 모델 인스턴스 + ModelSerializer 로 직렬화할 때와 "
+        "values_list() 튜플 + bookings.fast_serializers 로 직렬화할 때의 "
+        "조회/직렬화 시간을 비교합니다. 만든 슬롯은 끝나면 롤백합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="직렬화할 슬롯 수")
+        parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+        parser.add_argument(
+            "--facility",
+            choices=list(FACILITIES),
+            default="treadmill",
+            help="대상 시설",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["rows"], options["repeat"]) < 1:
+            raise CommandError("--rows 와 --repeat 는 1 이상이어야 합니다.")
+        facility = FACILITIES[options["facility"]]
+        try:
+            with transaction.atomic():
+                queryset = self.create_timeslots(facility, options["rows"])
+                self.compare(facility, queryset, options["repeat"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def create_timeslots(self, facility, count):
+        """
+        기구 하나에 count 개의 슬롯을 만들고 그 슬롯을 조회하는 쿼리셋을 반환합니다.
+        짝수 번째 슬롯만 예약된 것처럼 booked_at 을 채웁니다.
+        """
+        timeslot_model = facility.timeslot_model
+        machine = facility.machine_model.objects.create()
+        day_start, _ = get_day_range(timezone.localdate() + timedelta(days=1))
+        timeslot_model.objects.bulk_create(
+            [
+                timeslot_model(
+                    **{facility.machine_fk_field: machine},
+                    start_time=day_start + timedelta(minutes=30 * index),
+                    end_time=day_start + timedelta(minutes=30 * (index + 1)),
+                    booked_at=day_start if index % 2 == 0 else None,
+                )
+                for index in range(count)
+            ]
+        )
+        return timeslot_model.objects.filter(
+            **{facility.machine_fk_field: machine}
+        ).order_by("start_time")
+
+    def compare(self, facility, queryset, repeat):
+        serializer_class = LIST_SERIALIZER_CLASSES[facility.key]
+        variants = {
+            "model serializer": lambda: serializer_class(
+                list(queryset.all()), many=True
+            ).data,
+            "fast rows": lambda: serialize_timeslot_rows(
+                serializer_class,
+                facility.machine_fk_field,
+                list(get_timeslot_rows(queryset.all(), facility.machine_fk_field)),
+            ),
+        }
+        outputs = {name: build() for name, build in variants.items()}
+        if len({repr(list(map(dict, data))) for data in outputs.values()}) != 1:
+            raise CommandError("두 직렬화 결과가 다릅니다.")
+
+        baseline = None
+        for name, build in variants.items():
+            started = time.perf_counter()
+            for _ in range(repeat):
+                build()
+            per_call_ms = (time.perf_counter() - started) * 1000 / repeat
+            baseline = baseline or per_call_ms
+            self.stdout.write(
+                f"{facility.key} {name}: {per_call_ms:.2f}ms per "
+                f"{len(outputs[name])} rows (x{baseline / per_call_ms:.1f})"
+            )
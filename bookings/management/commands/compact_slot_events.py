@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from bookings.events import compact_events
+
+
+class Command(BaseCommand):
+    help = (
+        "보관 기간이 지난 슬롯 변경 이벤트(SSE, 변경 목록)를 배치 단위로 지웁니다. "
+        "지운 구간의 cursor 로 변경 목록을 요청하면 410 으로 응답합니다. "
+        "스케줄러에서 매일 반복 실행해도 됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.SLOT_EVENT_RETENTION_DAYS,
+            help="이 날짜 수보다 오래된 이벤트를 지웁니다",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.SLOT_EVENT_COMPACT_BATCH_SIZE,
+            help="트랜잭션 하나에서 지울 최대 이벤트 수",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 0 or options["batch_size"] < 1:
+            raise CommandError("--days 는 0 이상, --batch-size 는 1 이상이어야 합니다.")
+        before = timezone.now() - timedelta(days=options["days"])
+        deleted_count = compact_events(before, options["batch_size"])
+        self.stdout.write(f"{deleted_count} events deleted")
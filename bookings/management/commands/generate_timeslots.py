@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from bookings.availability import SLOT_DURATION_MINUTES, SLOTS_PER_DAY
+from bookings.facilities import FACILITIES
+from bookings.utils import get_day_range
+
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "사용 가능한 모든 기구에 대해 오늘부터 --days 일 동안의 빈 슬롯 행을 미리 만듭니다. "
+        "예약 요청은 슬롯을 새로 만들지 않고 빈 행을 조건부 UPDATE 한 번으로 차지합니다. "
+        "이미 있는 슬롯은 건너뛰므로 스케줄러에서 매일 반복 실행해도 됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=7, help="오늘부터 슬롯을 만들 날짜 수"
+        )
+        parser.add_argument(
+            "--facility",
+            choices=[*FACILITIES, "all"],
+            default="all",
+            help="대상 시설 (기본값: 모든 시설)",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 1:
+            raise CommandError("--days 는 1 이상이어야 합니다.")
+        facilities = (
+            FACILITIES.values()
+            if options["facility"] == "all"
+            else [FACILITIES[options["facility"]]]
+        )
+        today = timezone.localdate()
+        days = [today + timedelta(days=offset) for offset in range(options["days"])]
+
+        for facility in facilities:
+            created_count = self.generate(facility, days)
+            self.stdout.write(f"{facility.key}: {created_count} slots created")
+
+    def generate(self, facility, days):
+        """
+        facility 의 사용 가능한 기구마다 days 의 모든 슬롯을 만들고, 새로 만든 슬롯 수를 반환합니다.
+        """
+        timeslot_model = facility.timeslot_model
+        machine_pks = list(
+            facility.machine_model.objects.filter(is_available=True).values_list(
+                "pk", flat=True
+            )
+        )
+        start_times = [
+            get_day_range(day)[0] + timedelta(minutes=SLOT_DURATION_MINUTES * index)
+            for day in days
+            for index in range(SLOTS_PER_DAY)
+        ]
+        slot_duration = timedelta(minutes=SLOT_DURATION_MINUTES)
+        machine_id_field = f"{facility.machine_fk_field}_id"
+
+        existing_count = self.count_slots(facility, machine_pks, days)
+        timeslot_model.objects.bulk_create(
+            (
+                timeslot_model(
+                    **{machine_id_field: machine_pk},
+                    start_time=start_time,
+                    end_time=start_time + slot_duration,
+                )
+                for machine_pk in machine_pks
+                for start_time in start_times
+            ),
+            batch_size=BULK_CREATE_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        return self.count_slots(facility, machine_pks, days) - existing_count
+
+    def count_slots(self, facility, machine_pks, days):
+        return facility.timeslot_model.objects.filter(
+            **{f"{facility.machine_fk_field}__in": machine_pks},
+            start_time__gte=get_day_range(days[0])[0],
+            start_time__lt=get_day_range(days[-1])[1],
+        ).count()
@@ -0,0 +1,63 @@
+# Generated by Django 5.2 on 2026-10-18 12:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingAction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facility",
+                    models.CharField(
+                        choices=[
+                            ("treadmill", "treadmill"),
+                            ("cycle", "cycle"),
+                            ("ping_pong_table", "ping_pong_table"),
+                            ("arcade_machine", "arcade_machine"),
+                            ("induction", "induction"),
+                        ],
+                        max_length=20,
+                        verbose_name="시설",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="예약 행동 횟수"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="예약자",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "facility", "date")},
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+TIMESLOT_MODELS = [
+    ("treadmill", "gym", "TreadmillTimeSlot"),
+    ("cycle", "gym", "CycleTimeSlot"),
+    ("ping_pong_table", "lounge", "PingPongTableTimeSlot"),
+    ("arcade_machine", "lounge", "ArcadeMachineTimeSlot"),
+    ("induction", "kitchen", "InductionTimeSlot"),
+]
+
+
+def backfill_booking_actions(apps, schema_editor):
+    """
+    기존 예약 슬롯에서 (사용자, 시설, 날짜) 별 예약 행동 횟수를 계산해 채웁니다.
+    예전과 같이 서로 다른 booked_at 의 개수를 예약 행동 횟수로 봅니다.
+    """
+    BookingAction = apps.get_model("bookings", "BookingAction")
+    for facility, app_label, model_name in TIMESLOT_MODELS:
+        timeslot_model = apps.get_model(app_label, model_name)
+        daily_counts = (
+            timeslot_model.objects.filter(user__isnull=False)
+            .annotate(date=TruncDate("start_time"))
+            .values("user_id", "date")
+            .annotate(count=Count("booked_at", distinct=True))
+            .order_by()
+        )
+        for row in daily_counts:
+            booking_action = BookingAction.objects.create(
+                user_id=row["user_id"],
+                facility=facility,
+                date=row["date"],
+                count=row["count"],
+            )
+            day_start = timezone.make_aware(
+                datetime.combine(row["date"], datetime.min.time()),
+                timezone.get_default_timezone(),
+            )
+            timeslot_model.objects.filter(
+                user_id=row["user_id"],
+                start_time__gte=day_start,
+                start_time__lt=day_start + timedelta(days=1),
+            ).update(booking_action=booking_action)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0001_initial"),
+        ("gym", "0004_cycletimeslot_booking_action_and_more"),
+        ("kitchen", "0003_inductiontimeslot_booking_action"),
+        ("lounge", "0004_arcademachinetimeslot_booking_action_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_booking_actions, migrations.RunPython.noop),
+    ]
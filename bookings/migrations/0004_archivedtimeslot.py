@@ -0,0 +1,73 @@
+# Generated by Django 5.2 on 2026-10-18 13:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0003_resourceversion"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTimeSlot",
+            fields=[
+                (
+                    "pk",
+                    models.CompositePrimaryKey(
+                        "facility",
+                        "id",
+                        blank=True,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "facility",
+                    models.CharField(
+                        choices=[
+                            ("treadmill", "treadmill"),
+                            ("cycle", "cycle"),
+                            ("ping_pong_table", "ping_pong_table"),
+                            ("arcade_machine", "arcade_machine"),
+                            ("induction", "induction"),
+                        ],
+                        max_length=20,
+                        verbose_name="시설",
+                    ),
+                ),
+                ("id", models.PositiveBigIntegerField(verbose_name="슬롯 pk")),
+                ("machine_id", models.PositiveBigIntegerField(verbose_name="기구 pk")),
+                ("start_time", models.DateTimeField(verbose_name="시작 시간")),
+                ("end_time", models.DateTimeField(verbose_name="종료 시간")),
+                (
+                    "booked_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="예약 확정 시간"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="예약자",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "start_time"], name="archived_user_start_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2 on 2026-10-18 13:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0004_archivedtimeslot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlotEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facility",
+                    models.CharField(
+                        choices=[
+                            ("treadmill", "treadmill"),
+                            ("cycle", "cycle"),
+                            ("ping_pong_table", "ping_pong_table"),
+                            ("arcade_machine", "arcade_machine"),
+                            ("induction", "induction"),
+                        ],
+                        max_length=20,
+                        verbose_name="시설",
+                    ),
+                ),
+                ("date", models.DateField(blank=True, null=True, verbose_name="날짜")),
+                (
+                    "event_type",
+                    models.CharField(
+                        choices=[
+                            ("slots", "슬롯 예약/해제"),
+                            ("machines", "기구 변경"),
+                        ],
+                        max_length=20,
+                        verbose_name="종류",
+                    ),
+                ),
+                ("data", models.JSONField(verbose_name="내용")),
+                (
+                    "origin",
+                    models.CharField(max_length=32, verbose_name="보낸 프로세스"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="생성 시간"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["facility", "date", "id"],
+                        name="slot_event_facility_date_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-18 13:57
+
+from django.db import migrations, models
+
+SLOT_EVENTS_COMPACTED_KEY = "slot-events:compacted"
+
+
+def move_compaction_cursor(apps, schema_editor):
+    """
+    ResourceVersion 에 버전처럼 저장하던 지운 마지막 이벤트 pk 를 SlotEventCompaction 으로 옮깁니다.
+    """
+    ResourceVersion = apps.get_model("bookings", "ResourceVersion")
+    SlotEventCompaction = apps.get_model("bookings", "SlotEventCompaction")
+    resource_version = ResourceVersion.objects.filter(
+        key=SLOT_EVENTS_COMPACTED_KEY
+    ).first()
+    if resource_version is None:
+        return
+    SlotEventCompaction.objects.create(pk=1, last_deleted_id=resource_version.version)
+    resource_version.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0005_slotevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlotEventCompaction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_deleted_id",
+                    models.PositiveBigIntegerField(
+                        default=0, verbose_name="지운 마지막 이벤트 pk"
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(move_compaction_cursor, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,151 @@
+from django.db import models
+from users.models import User
+from .facilities import FACILITIES
+
+
+class BookingActionManager(models.Manager):
+    def get_count(self, user, facility_key, date):
+        """
+        (사용자, 시설, 날짜) 의 예약 행동 횟수를 유니크 인덱스 조회 한 번으로 반환
+        """
+        count = (
+            self.filter(user=user, facility=facility_key, date=date)
+            .values_list("count", flat=True)
+            .first()
+        )
+        return count or 0
+
+
+class BookingAction(models.Model):
+    """
+    사용자가 하루에 한 시설에서 한 예약 행동 횟수
+
+    (사용자, 시설, 날짜) 마다 한 행이 있으며, 그날 예약한 슬롯은 이 행을 가리킵니다.
+    하루 예약 횟수 제한은 이 행의 count 를 조건부로 증가시켜 확인합니다.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        verbose_name="예약자",
+    )
+    facility = models.CharField(
+        "시설",
+        max_length=20,
+        choices=[(key, key) for key in FACILITIES],
+    )
+    date = models.DateField("날짜")
+    count = models.PositiveIntegerField("예약 행동 횟수", default=0)
+
+    objects = BookingActionManager()
+
+    class Meta:
+        unique_together = ["user", "facility", "date"]
+
+    def __str__(self) -> str:
+        return f"{self.user} - {self.facility} {self.date} ({self.count})"
+
+
+class ResourceVersion(models.Model):
+    """
+    조회 API 의 ETag 를 만드는 리소스별 버전
+
+    예약, 예약 해제, 관리자 변경이 있을 때마다 해당 리소스의 버전을 1 올립니다.
+    키 형식은 bookings.versions 를 참고하세요.
+    """
+
+    key = models.CharField("키", max_length=100, primary_key=True)
+    version = models.PositiveBigIntegerField("버전", default=0)
+
+    def __str__(self) -> str:
+        return f"{self.key} (v{self.version})"
+
+
+class ArchivedTimeSlot(models.Model):
+    """
+    보관 기간이 지나 시설별 타임슬롯 테이블에서 옮겨 온 지난 예약
+
+    다섯 시설의 예약을 한 테이블에 모으고, 원래 슬롯 pk 를 그대로 보관해
+    내 예약 목록의 (start_time, 시설, pk) cursor 가 보관 전후로 같게 유지됩니다.
+    예약되지 않은 빈 슬롯은 보관하지 않고 삭제합니다. bookings.archive 를 참고하세요.
+    """
+
+    pk = models.CompositePrimaryKey("facility", "id")
+    facility = models.CharField(
+        "시설",
+        max_length=20,
+        choices=[(key, key) for key in FACILITIES],
+    )
+    id = models.PositiveBigIntegerField("슬롯 pk")
+    machine_id = models.PositiveBigIntegerField("기구 pk")
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="예약자",
+    )
+    start_time = models.DateTimeField("시작 시간")
+    end_time = models.DateTimeField("종료 시간")
+    booked_at = models.DateTimeField("예약 확정 시간", null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "start_time"],
+                name="archived_user_start_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.facility} #{self.id} {self.start_time} ({self.user})"
+
+
+class SlotEvent(models.Model):
+    """
+    슬롯 변경 이벤트 스트림(Server-Sent Events)으로 보낸 이벤트
+
+    워커 사이에 이벤트를 전달하고, 다시 연결한 클라이언트가 Last-Event-ID 이후의
+    이벤트를 이어 받을 수 있도록 보관합니다. 변경 목록(/changes/?since=) 도 이 테이블을
+    읽습니다. 자세한 내용은 bookings.events 를 참고하세요.
+    """
+
+    class EventType(models.TextChoices):
+        SLOTS = "slots", "슬롯 예약/해제"
+        MACHINES = "machines", "기구 변경"
+
+    facility = models.CharField(
+        "시설",
+        max_length=20,
+        choices=[(key, key) for key in FACILITIES],
+    )
+    # 기구 변경처럼 모든 날짜에 해당하는 이벤트는 비워 둡니다.
+    date = models.DateField("날짜", null=True, blank=True)
+    event_type = models.CharField("종류", max_length=20, choices=EventType.choices)
+    data = models.JSONField("내용")
+    origin = models.CharField("보낸 프로세스", max_length=32)
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["facility", "date", "id"],
+                name="slot_event_facility_date_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.pk} {self.facility} {self.date} {self.event_type}"
+
+
+class SlotEventCompaction(models.Model):
+    """
+    compact_slot_events 로 이벤트를 어디까지 지웠는지 남기는 한 행짜리 테이블
+
+    변경 목록(/changes/?since=) 은 이 값보다 앞선 cursor 에 410 으로 응답합니다.
+    """
+
+    last_deleted_id = models.PositiveBigIntegerField("지운 마지막 이벤트 pk", default=0)
+
+    def __str__(self) -> str:
+        return f"~#{self.last_deleted_id}"
@@ -0,0 +1,111 @@
+from datetime import datetime
+
+from django.db.models import CharField, F, Q, Value
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .facilities import FACILITIES
+from .models import ArchivedTimeSlot
+from .pagination import INVALID_CURSOR_MESSAGE, decode_cursor, encode_cursor
+
+BOOKING_COLUMNS = ["id", "machine_id", "start_time", "end_time", "booked_at"]
+
+WHEN_CHOICES = ("upcoming", "past")
+
+
+def encode_booking_cursor(row):
+    """
+    (start_time, 시설, pk) 키를 다음 페이지 조회용 cursor 문자열로 만듭니다.
+    """
+    return encode_cursor([row["start_time"].isoformat(), row["facility"], row["id"]])
+
+
+def decode_booking_cursor(cursor):
+    values = decode_cursor(cursor)
+    try:
+        start_time, facility_key, pk = values
+        start_time = datetime.fromisoformat(start_time)
+    except (ValueError, TypeError):
+        raise ValidationError(INVALID_CURSOR_MESSAGE)
+    if facility_key not in FACILITIES or not isinstance(pk, int):
+        raise ValidationError(INVALID_CURSOR_MESSAGE)
+    return start_time, facility_key, pk
+
+
+def get_keyset_filter(facility_key, cursor, descending):
+    """
+    (start_time, 시설, pk) 가 cursor 다음에 오는 행만 고르는 조건을 만듭니다.
+    시설은 테이블마다 고정된 값이라 테이블별로 start_time/pk 조건만 남습니다.
+    """
+    start_time, cursor_facility_key, pk = cursor
+    after = "lt" if descending else "gt"
+    if facility_key == cursor_facility_key:
+        return Q(**{f"start_time__{after}": start_time}) | Q(
+            start_time=start_time, **{f"pk__{after}": pk}
+        )
+    if (facility_key > cursor_facility_key) != descending:
+        return Q(**{f"start_time__{after}e": start_time})
+    return Q(**{f"start_time__{after}": start_time})
+
+
+def get_archive_keyset_filter(cursor, descending):
+    """
+    보관 테이블은 시설이 행마다 다르므로 (start_time, 시설, pk) 전체를 비교합니다.
+    """
+    start_time, facility_key, pk = cursor
+    after = "lt" if descending else "gt"
+    return (
+        Q(**{f"start_time__{after}": start_time})
+        | Q(start_time=start_time, **{f"facility__{after}": facility_key})
+        | Q(start_time=start_time, facility=facility_key, **{f"id__{after}": pk})
+    )
+
+
+def get_user_bookings(user, when=None, cursor=None, limit=None, include_archived=False):
+    """
+    다섯 시설의 사용자 예약을 UNION ALL 쿼리 한 번으로 가져옵니다.
+
+    필요한 열만 가져오고 (start_time, 시설, pk) 순으로 정렬합니다.
+    when="upcoming" 이면 끝나지 않은 예약을 오래된 순으로,
+    when="past" 이면 끝난 예약을 최근 순으로 가져옵니다.
+    cursor 를 주면 그 다음 행부터, limit 를 주면 최대 limit 개를 가져옵니다.
+    include_archived 가 True 이면 보관 테이블(ArchivedTimeSlot)의 지난 예약도 함께 가져옵니다.
+    """
+    descending = when == "past"
+    now = timezone.now()
+    querysets = []
+    for facility in FACILITIES.values():
+        queryset = facility.timeslot_model.objects.filter(user=user)
+        if when == "upcoming":
+            queryset = queryset.filter(end_time__gt=now)
+        elif when == "past":
+            queryset = queryset.filter(end_time__lte=now)
+        if cursor is not None:
+            queryset = queryset.filter(
+                get_keyset_filter(facility.key, cursor, descending)
+            )
+        querysets.append(
+            queryset.annotate(
+                machine_id=F(f"{facility.machine_fk_field}_id"),
+                facility=Value(facility.key, output_field=CharField()),
+            )
+            .values(*BOOKING_COLUMNS, "facility")
+            .order_by()
+        )
+
+    if include_archived and when != "upcoming":
+        archived = ArchivedTimeSlot.objects.filter(user=user)
+        if when == "past":
+            archived = archived.filter(end_time__lte=now)
+        if cursor is not None:
+            archived = archived.filter(get_archive_keyset_filter(cursor, descending))
+        querysets.append(archived.values(*BOOKING_COLUMNS, "facility").order_by())
+
+    bookings = querysets[0].union(*querysets[1:], all=True)
+    if descending:
+        bookings = bookings.order_by("-start_time", "-facility", "-id")
+    else:
+        bookings = bookings.order_by("start_time", "facility", "id")
+    if limit is not None:
+        bookings = bookings[:limit]
+    return bookings
@@ -0,0 +1,66 @@
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .facilities import FACILITIES
+from .utils import get_next_slot_boundary
+
+
+class OccupancySnapshot:
+    """
+    모든 시설의 현재 사용 현황을 프로세스 메모리에 잠시 보관하는 스냅샷
+
+    사용 현황은 슬롯 경계(매 시 정각과 30분)에만 바뀌므로 다음 경계까지 재사용하고,
+    예약이나 관리자 변경이 있으면 즉시 무효화합니다.
+    다른 워커 프로세스의 변경은 알 수 없으므로 최대 보관 시간을 따로 둡니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (데이터, 만료 시각) 튜플 하나로 보관해 잠금 없이 읽어도 두 값이 항상 짝이 맞습니다.
+        self._snapshot = None
+
+    def get(self):
+        now = timezone.now()
+        snapshot = self._snapshot
+        if snapshot is not None and now < snapshot[1]:
+            return snapshot[0]
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or now >= snapshot[1]:
+                expires_at = min(
+                    get_next_slot_boundary(now),
+                    now
+                    + timedelta(seconds=settings.OCCUPANCY_SNAPSHOT_MAX_AGE_SECONDS),
+                )
+                snapshot = (self._build(now), expires_at)
+                self._snapshot = snapshot
+            return snapshot[0]
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+
+    def _build(self, now):
+        data = {"generated_at": now}
+        for facility in FACILITIES.values():
+            data[f"{facility.key}s"] = [
+                {
+                    "pk": machine["pk"],
+                    "is_using": machine["using_now"],
+                    "is_available": machine["is_available"],
+                }
+                for machine in facility.machine_model.objects.with_is_using()
+                .order_by("pk")
+                .values("pk", "is_available", "using_now")
+            ]
+        return data
+
+
+occupancy_snapshot = OccupancySnapshot()
+
+
+def invalidate_occupancy_snapshot(sender, **kwargs):
+    occupancy_snapshot.invalidate()
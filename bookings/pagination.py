@@ -0,0 +1,184 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+INVALID_CURSOR_MESSAGE = "cursor 형식이 잘못되었습니다."
+
+
+def encode_cursor(values):
+    """
+    정렬 키 값 목록을 URL 에 그대로 넣을 수 있는 cursor 문자열로 만듭니다.
+    """
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    encode_cursor 로 만든 문자열을 값 목록으로 되돌립니다. 잘못된 cursor 는 400 으로 응답합니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationError(INVALID_CURSOR_MESSAGE)
+    if not isinstance(values, list):
+        raise ValidationError(INVALID_CURSOR_MESSAGE)
+    return values
+
+
+def get_keyset_filter(ordering, position):
+    """
+    ordering 필드 순서로 position 보다 뒤에 오는 행만 고르는 조건을 만듭니다.
+    (a, b) 이면 a > a0 OR (a = a0 AND b > b0) 가 되어 인덱스 범위 조회로 처리됩니다.
+    """
+    condition = Q()
+    for index, field_name in enumerate(ordering):
+        equal = {name: value for name, value in zip(ordering[:index], position)}
+        condition |= Q(**equal, **{f"{field_name}__gt": position[index]})
+    return condition
+
+
+class KeysetPagination(BasePagination):
+    """
+    ordering 필드의 값(keyset)으로 다음 페이지를 가리키는 페이지네이션
+
+    OFFSET 없이 마지막 행의 키보다 뒤에 오는 행만 조회하므로 몇 번째 페이지든 비용이 같습니다.
+    응답 본문은 기존처럼 배열 그대로 두고, 다음 페이지 주소는 Link 헤더(rel="next")로 알려줍니다.
+    limit 를 주지 않으면 LIST_PAGE_SIZE 개씩 반환합니다.
+
+    뷰에서 get_keyset_position(item) 을 정의하면 모델 인스턴스가 아닌 행(튜플 등)에서
+    ordering 순서의 키 값을 꺼낼 때 사용합니다.
+    """
+
+    ordering = ("pk",)
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset, limit = self.get_page_queryset(queryset, request, view)
+        return self.get_page(list(page_queryset), limit)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset 의 비동기 버전
+        """
+        page_queryset, limit = self.get_page_queryset(queryset, request, view)
+        return self.get_page([item async for item in page_queryset], limit)
+
+    def get_page_queryset(self, queryset, request, view):
+        self.request = request
+        self.view = view
+        limit = self.get_limit(request)
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor is not None:
+            position = self.decode_position(queryset.model, cursor)
+            queryset = queryset.filter(get_keyset_filter(self.ordering, position))
+        # 다음 페이지가 있는지 알기 위해 하나 더 가져옵니다.
+        return queryset[: limit + 1], limit
+
+    def get_page(self, items, limit):
+        self.next_cursor = None
+        if len(items) > limit:
+            self.next_cursor = self.encode_position(self.get_position(items[limit - 1]))
+        return items[:limit]
+
+    def get_paginated_response(self, data):
+        response = Response(data)
+        self.add_link_header(response)
+        return response
+
+    def add_link_header(self, response):
+        next_link = self.get_next_link()
+        if next_link is not None:
+            response["Link"] = f'<{next_link}>; rel="next"'
+
+    def get_paginated_response_schema(self, schema):
+        return schema
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_limit(self, request):
+        limit = request.query_params.get(self.limit_query_param)
+        if limit is None:
+            return settings.LIST_PAGE_SIZE
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError("limit 은 정수여야 합니다.")
+        if not 1 <= limit <= settings.LIST_MAX_PAGE_SIZE:
+            raise ValidationError(
+                f"limit 은 1 이상 {settings.LIST_MAX_PAGE_SIZE} 이하여야 합니다."
+            )
+        return limit
+
+    def get_position(self, item):
+        get_keyset_position = getattr(self.view, "get_keyset_position", None)
+        if get_keyset_position is not None:
+            return get_keyset_position(item)
+        return [getattr(item, field_name) for field_name in self.ordering]
+
+    def encode_position(self, position):
+        return encode_cursor(
+            [
+                value.isoformat() if hasattr(value, "isoformat") else value
+                for value in position
+            ]
+        )
+
+    def decode_position(self, model, cursor):
+        values = decode_cursor(cursor)
+        if len(values) != len(self.ordering):
+            raise ValidationError(INVALID_CURSOR_MESSAGE)
+        try:
+            return [
+                self.get_field(model, field_name).to_python(value)
+                for field_name, value in zip(self.ordering, values)
+            ]
+        except (DjangoValidationError, TypeError):
+            raise ValidationError(INVALID_CURSOR_MESSAGE)
+
+    def get_field(self, model, field_name):
+        if field_name == "pk":
+            return model._meta.pk
+        return model._meta.get_field(field_name)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "이전 응답 Link 헤더(rel=next)의 cursor",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.limit_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"한 페이지의 최대 항목 수 (기본값 {settings.LIST_PAGE_SIZE})",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class MachineKeysetPagination(KeysetPagination):
+    ordering = ("pk",)
+
+
+class TimeSlotKeysetPagination(KeysetPagination):
+    # TimeSlot.Meta.ordering(start_time) 에 pk 를 더해 순서가 항상 정해지도록 합니다.
+    ordering = ("start_time", "pk")
@@ -0,0 +1,26 @@
+from django.db import models
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+
+class MachineQuerySet(models.QuerySet):
+    """
+    기구(Machine) 모델 공통 QuerySet
+
+    기구 모델은 timeslot_relation 속성에 타임슬롯 모델로의 역참조 이름을 지정해야 합니다.
+    """
+
+    def with_is_using(self):
+        """
+        현재 사용 중 여부를 Exists 서브쿼리로 함께 조회합니다.
+        모델의 is_using 프로퍼티는 이 값이 있으면 추가 쿼리 없이 사용합니다.
+        """
+        relation = self.model._meta.get_field(self.model.timeslot_relation)
+        now = timezone.now()
+        current_timeslots = relation.related_model.objects.filter(
+            **{relation.field.name: OuterRef("pk")},
+            start_time__lte=now,
+            end_time__gt=now,
+            user__isnull=False,
+        )
+        return self.annotate(using_now=Exists(current_timeslots))
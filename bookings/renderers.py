@@ -0,0 +1,110 @@
+"""
+목록 응답용 렌더러
+
+FastJSONRenderer 는 orjson 이 설치되어 있으면 orjson 으로, 없으면 DRF JSONRenderer 로 인코딩합니다.
+MessagePackRenderer 는 msgpack 이 설치되어 있을 때만 LIST_RENDERER_CLASSES 에 포함되며,
+Accept: application/msgpack 으로 요청한 모바일 클라이언트에 더 작은 바이너리 응답을 줍니다.
+큰 목록은 iter_json_array 로 항목마다 인코딩해 StreamingHttpResponse 로 바로 내보냅니다.
+ASGI 에서는 aiter_json_array 로 같은 조각을 비동기로 내보냅니다.
+"""
+
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_json_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """
+    orjson/msgpack 이 직접 다루지 않는 값은 DRF 인코더와 같은 방식으로 바꿉니다.
+    """
+    return _json_encoder.default(obj)
+
+
+def dumps_json(data):
+    """
+    data 를 DRF JSONRenderer 의 기본 출력(공백 없음, 유니코드 그대로)과 같은 바이트로 인코딩합니다.
+    """
+    if orjson is None:
+        return JSONRenderer().render(data)
+    # 날짜/시간은 DRF 인코더의 형식(밀리초까지)을 따르도록 _default 로 넘깁니다.
+    content = orjson.dumps(
+        data,
+        default=_default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+    )
+    # JSONRenderer 처럼 U+2028, U+2029 는 JavaScript 에서도 안전하도록 이스케이프합니다.
+    if b"\xe2\x80" in content:
+        content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+    return content
+
+
+def iter_json_array(items):
+    """
+    items 를 하나씩 인코딩해 JSON 배열 조각을 차례로 만듭니다.
+    전체 목록을 메모리에 만들지 않으므로 응답 크기와 상관없이 항목 하나만큼의 메모리만 씁니다.
+    """
+    yield b"["
+    separator = b""
+    for item in items:
+        yield separator + dumps_json(item)
+        separator = b","
+    yield b"]"
+
+
+async def aiter_json_array(items, batch_size):
+    """
+    iter_json_array 의 비동기 버전. ASGI 에서 StreamingHttpResponse 에 동기 iterator 를 주면
+    Django 가 sync_to_async(list) 로 전부 모은 뒤에 보내므로 스트리밍되지 않습니다.
+
+    DB 를 읽는 items 는 요청을 처리한 스레드(thread_sensitive)에서 batch_size 개씩 꺼내
+    인코딩하고, 배치마다 한 조각으로 내보냅니다.
+    """
+    chunks = iter_json_array(items)
+    next_batch = sync_to_async(lambda: b"".join(islice(chunks, batch_size)))
+    while batch := await next_batch():
+        yield batch
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # 들여쓰기를 요청한 경우(브라우저 등)에는 DRF 기본 동작을 따릅니다.
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps_json(data)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_default)
+
+
+LIST_RENDERER_CLASSES = [
+    FastJSONRenderer,
+    *([MessagePackRenderer] if msgpack is not None else []),
+    BrowsableAPIRenderer,
+]
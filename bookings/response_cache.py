@@ -0,0 +1,82 @@
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+HIT = "hit"
+STALE = "stale"
+MISS = "miss"
+
+
+class TimeSlotListCache:
+    """
+    (시설, 기구, 날짜) 하루치 슬롯 목록 응답 데이터의 읽기 캐시
+
+    항목은 만들 때의 리소스 버전(bookings.versions 의 기구-날짜 버전)과 함께 저장됩니다.
+    예약/예약 해제/관리자 변경으로 버전이 오르면 그 기구와 날짜의 항목만 오래된 것이 됩니다.
+
+    오래된 항목은 한 요청만 잠금을 잡고 다시 만들고, 그동안 다른 요청은 오래된 데이터를
+    그대로 받습니다(stale-while-revalidate). 적중/오래된 적중/실패 횟수는 프로세스마다 셉니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {HIT: 0, STALE: 0, MISS: 0}
+
+    def get_key(self, facility, machine_pk, day):
+        return f"timeslot-list:{facility.key}:{machine_pk}:{day.isoformat()}"
+
+    def get_refresh_lock_key(self, key):
+        return f"{key}:refresh"
+
+    def get_or_build(self, facility, machine_pk, day, version, build):
+        """
+        (데이터, 데이터의 버전, 결과) 를 반환합니다. 결과는 HIT, STALE, MISS 중 하나이며
+        STALE 이면 데이터의 버전이 요청한 version 보다 오래된 것입니다.
+        """
+        cache = caches[settings.TIMESLOT_LIST_CACHE_ALIAS]
+        key = self.get_key(facility, machine_pk, day)
+        entry = cache.get(key)
+        if entry is not None and entry["version"] == version:
+            return entry["data"], version, self._count(HIT)
+
+        lock_key = self.get_refresh_lock_key(key)
+        refreshing = not cache.add(
+            lock_key, True, settings.TIMESLOT_LIST_CACHE_REFRESH_LOCK_SECONDS
+        )
+        if entry is not None and refreshing:
+            return entry["data"], entry["version"], self._count(STALE)
+
+        try:
+            data = build()
+            cache.set(
+                key,
+                {"version": version, "data": data},
+                settings.TIMESLOT_LIST_CACHE_TIMEOUT_SECONDS,
+            )
+        finally:
+            if not refreshing:
+                cache.delete(lock_key)
+        return data, version, self._count(MISS)
+
+    def get_stats(self):
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = sum(counters.values())
+        counters["hit_ratio"] = (
+            (counters[HIT] + counters[STALE]) / lookups if lookups else 0.0
+        )
+        return counters
+
+    def reset_stats(self):
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+
+    def _count(self, result):
+        with self._lock:
+            self._counters[result] += 1
+        return result
+
+
+timeslot_list_cache = TimeSlotListCache()
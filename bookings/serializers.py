@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from .models import SlotEvent
+
+
+class ChangeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SlotEvent
+        fields = [
+            "id",
+            "facility",
+            "date",
+            "event_type",
+            "data",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
+class ChangeListResponseSerializer(serializers.Serializer):
+    changes = ChangeSerializer(many=True, read_only=True, help_text="변경 목록")
+    next_cursor = serializers.CharField(
+        read_only=True, help_text="다음 요청의 since 로 넘길 cursor"
+    )
+    has_more = serializers.BooleanField(
+        read_only=True, help_text="true 이면 next_cursor 로 바로 이어서 요청합니다"
+    )
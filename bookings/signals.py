@@ -0,0 +1,84 @@
+import logging
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from .events import record_machine_events, record_slot_events
+from .facilities import get_facility_for_model
+from .versions import bump_machine_versions, bump_slot_versions
+
+logger = logging.getLogger(__name__)
+
+# 타임슬롯 예약 상태가 바뀐 뒤(커밋 이후) record_slots_changed 가 전송합니다.
+# sender: 타임슬롯 모델, machine_pk: 기구 pk, start_times: 바뀐 슬롯의 시작 시간 목록,
+# booked: 예약되었으면 True, 예약이 해제되었으면 False,
+# user_pks: 예약하거나 예약이 해제된 사용자 pk 목록
+slots_changed = Signal()
+
+# 관리자가 기구 정보(사용 가능 여부 등)를 바꾼 뒤(커밋 이후) record_machines_changed 가 전송합니다.
+# sender: 기구 모델, machine_pks: 바뀐 기구 pk 목록
+machines_changed = Signal()
+
+
+def send_after_commit(signal, sender, **kwargs):
+    """
+    커밋 이후 signal 을 send_robust 로 보냅니다.
+    수신자(메모리 캐시 갱신 등)가 실패해도 로그만 남기고, 이미 커밋된 예약을 실패로 만들지 않습니다.
+    """
+
+    def send():
+        for receiver, result in signal.send_robust(sender=sender, **kwargs):
+            if isinstance(result, Exception):
+                logger.error("%r 수신자가 실패했습니다.", receiver, exc_info=result)
+
+    transaction.on_commit(send)
+
+
+def record_slots_changed(sender, machine_pk, start_times, booked, user_pks):
+    """
+    슬롯 예약 상태를 바꾼 트랜잭션 안에서 호출합니다.
+    리소스 버전과 슬롯 이벤트는 같은 트랜잭션에서 저장해 예약과 함께 커밋(또는 잠금 경합 시 재시도)되고,
+    slots_changed 는 커밋 이후에 보냅니다.
+    """
+    bump_slot_versions(sender, machine_pk, start_times, user_pks)
+    record_slot_events(sender, machine_pk, start_times, booked)
+    send_after_commit(
+        slots_changed,
+        sender,
+        machine_pk=machine_pk,
+        start_times=start_times,
+        booked=booked,
+        user_pks=user_pks,
+    )
+
+
+def record_machines_changed(sender, machine_pks):
+    """
+    기구 정보를 바꾼 트랜잭션 안에서 호출합니다. record_slots_changed 와 같은 방식입니다.
+    """
+    bump_machine_versions(sender)
+    record_machine_events(sender, machine_pks)
+    send_after_commit(machines_changed, sender, machine_pks=machine_pks)
+
+
+def notify_timeslot_deleted(sender, instance, **kwargs):
+    """
+    관리자 화면 등에서 예약된 슬롯이 삭제되면 삭제 트랜잭션 안에서 record_slots_changed 를 호출합니다.
+    """
+    if instance.user_id is None:
+        return
+    machine_fk_field = get_facility_for_model(sender).machine_fk_field
+    record_slots_changed(
+        sender,
+        machine_pk=getattr(instance, f"{machine_fk_field}_id"),
+        start_times=[instance.start_time],
+        booked=False,
+        user_pks=[instance.user_id],
+    )
+
+
+def notify_machine_deleted(sender, instance, **kwargs):
+    """
+    기구가 삭제되면 삭제 트랜잭션 안에서 record_machines_changed 를 호출합니다.
+    """
+    record_machines_changed(sender, machine_pks=[instance.pk])
@@ -0,0 +1,1387 @@
+import asyncio
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import skipIf
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, OperationalError
+from django.core.management import call_command
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from gym.models import Treadmill, TreadmillTimeSlot
+from kitchen.models import Induction
+from lounge.models import PingPongTable, PingPongTableTimeSlot
+from users.models import User
+from .availability import availability_index
+from .events import DroppedError, slot_event_broadcaster
+from .engine import (
+    BookingBusyError,
+    release_timeslots,
+    run_with_lock_retry,
+    book_timeslots,
+    SlotUnavailableError,
+    BookingQuotaExceededError,
+)
+from .facilities import FACILITIES, get_facility_for_model
+from .fast_serializers import get_timeslot_rows, serialize_timeslot_rows
+from .management.commands.bench_serializers import LIST_SERIALIZER_CLASSES
+from .models import ArchivedTimeSlot, BookingAction, SlotEvent
+from .occupancy import occupancy_snapshot
+from .renderers import dumps_json, msgpack
+from .response_cache import timeslot_list_cache
+from .utils import get_day_range
+from .signals import machines_changed, record_machines_changed, slots_changed
+from .versions import bump_slot_versions, get_user_version_key, get_versions
+
+
+class TreadmillTestDataMixin:
+    """
+    사용자 한 명, 런닝머신 한 대, 내일 날짜(day)와 그날 10시(start_time)를 만드는 테스트 데이터
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.treadmill = Treadmill.objects.create()
+        cls.day = timezone.localdate() + timedelta(days=1)
+        cls.start_time = get_day_range(cls.day)[0] + timedelta(hours=10)
+
+
+class OccupancyNowTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.treadmill = Treadmill.objects.create()
+        cls.induction = Induction.objects.create(is_available=False)
+
+    def setUp(self):
+        occupancy_snapshot.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_one_query_per_facility_then_served_from_snapshot(self):
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse("occupancy-now"))
+        self.assertEqual(
+            response.data["treadmills"],
+            [{"pk": self.treadmill.pk, "is_using": False, "is_available": True}],
+        )
+        self.assertEqual(
+            response.data["inductions"],
+            [{"pk": self.induction.pk, "is_using": False, "is_available": False}],
+        )
+        with self.assertNumQueries(0):
+            self.client.get(reverse("occupancy-now"))
+
+    def test_booking_invalidates_snapshot(self):
+        self.client.get(reverse("occupancy-now"))
+        now = timezone.now()
+        slot = TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmill,
+            user=self.user,
+            start_time=now - timedelta(minutes=5),
+            end_time=now + timedelta(minutes=25),
+            booked_at=now,
+        )
+        slots_changed.send(
+            sender=TreadmillTimeSlot,
+            machine_pk=self.treadmill.pk,
+            start_times=[slot.start_time],
+            booked=True,
+        )
+        response = self.client.get(reverse("occupancy-now"))
+        self.assertTrue(response.data["treadmills"][0]["is_using"])
+
+
+class AvailabilityIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.treadmills = [Treadmill.objects.create() for _ in range(2)]
+        cls.day = timezone.localdate() + timedelta(days=1)
+        cls.day_start, _ = get_day_range(cls.day)
+        TreadmillTimeSlot.objects.create(
+            treadmill=cls.treadmills[0],
+            user=cls.user,
+            start_time=cls.day_start + timedelta(hours=1),
+            end_time=cls.day_start + timedelta(hours=1, minutes=30),
+            booked_at=timezone.now(),
+        )
+
+    def setUp(self):
+        availability_index.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_day_is_loaded_once(self):
+        # ETag 버전 조회 1번 + 하루치 인덱스 적재 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("treadmill-availability"), {"date": self.day.isoformat()}
+            )
+        self.assertEqual(
+            response.data["machines"],
+            [{"treadmill": self.treadmills[0].pk, "booked_mask": 1 << 2}],
+        )
+        # 두 번째부터는 ETag 버전 조회만 실행됩니다.
+        with self.assertNumQueries(1):
+            self.client.get(
+                reverse("treadmill-availability"), {"date": self.day.isoformat()}
+            )
+
+    def test_booking_updates_loaded_masks(self):
+        self.client.get(
+            reverse("treadmill-availability"), {"date": self.day.isoformat()}
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("treadmill-timeslot-book", args=[self.treadmills[1].pk]),
+                {
+                    "start_time": (self.day_start + timedelta(hours=23, minutes=30)),
+                    "duration_minutes": 30,
+                },
+            )
+        self.assertEqual(response.status_code, 201)
+        # 예약 후에도 인덱스를 다시 적재하지 않고 ETag 버전 조회만 실행됩니다.
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("treadmill-availability"), {"date": self.day.isoformat()}
+            )
+        self.assertEqual(
+            response.data["machines"][1],
+            {"treadmill": self.treadmills[1].pk, "booked_mask": 1 << 47},
+        )
+
+    def test_booking_by_another_worker_reloads_masks(self):
+        url = reverse("treadmill-availability")
+        etag = self.client.get(url, {"date": self.day.isoformat()})["ETag"]
+        # 다른 워커의 예약: 이 프로세스의 인덱스에는 반영되지 않고 버전만 오릅니다.
+        TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmills[1],
+            user=self.user,
+            start_time=self.day_start,
+            end_time=self.day_start + timedelta(minutes=30),
+            booked_at=timezone.now(),
+        )
+        bump_slot_versions(
+            TreadmillTimeSlot, self.treadmills[1].pk, [self.day_start], [self.user.pk]
+        )
+
+        response = self.client.get(
+            url, {"date": self.day.isoformat()}, headers={"if_none_match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["machines"][1],
+            {"treadmill": self.treadmills[1].pk, "booked_mask": 1},
+        )
+
+    def test_booked_slot_is_rejected_before_the_transaction(self):
+        self.client.get(
+            reverse("treadmill-availability"), {"date": self.day.isoformat()}
+        )
+        # 기구 조회, 하루 예약 횟수 검증, 시설-날짜 버전 확인만 실행되고
+        # 트랜잭션은 시작되지 않습니다.
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                reverse("treadmill-timeslot-book", args=[self.treadmills[0].pk]),
+                {"start_time": self.day_start + timedelta(hours=1)},
+            )
+        self.assertEqual(response.status_code, 409)
+
+    def test_slot_released_by_another_worker_can_be_booked(self):
+        self.client.get(
+            reverse("treadmill-availability"), {"date": self.day.isoformat()}
+        )
+        # 다른 워커(관리자)의 예약 해제: 이 프로세스의 인덱스에는 아직 예약된 것으로 남습니다.
+        slot = TreadmillTimeSlot.objects.get()
+        TreadmillTimeSlot.objects.filter(pk=slot.pk).update(user=None, booked_at=None)
+        bump_slot_versions(
+            TreadmillTimeSlot, self.treadmills[0].pk, [slot.start_time], [self.user.pk]
+        )
+        response = self.client.post(
+            reverse("treadmill-timeslot-book", args=[self.treadmills[0].pk]),
+            {"start_time": slot.start_time},
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_update_during_load_is_not_overwritten(self):
+        facility = get_facility_for_model(TreadmillTimeSlot)
+
+        def update_during_load(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            availability_index.update(
+                facility, self.treadmills[1].pk, [self.day_start], True
+            )
+            return result
+
+        with connection.execute_wrapper(update_during_load):
+            availability_index.get_day_masks(facility, self.day)
+        # 읽는 동안 변경이 있었으므로 읽은 마스크를 보관하지 않고 다음 조회 때 다시 읽습니다.
+        with self.assertNumQueries(1):
+            availability_index.get_day_masks(facility, self.day)
+
+
+class BookTimeslotsTests(TreadmillTestDataMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_user = User.objects.create_user("2024000002", "password")
+
+    def setUp(self):
+        availability_index.invalidate()
+
+    def create_slot(self, offset_minutes, user=None):
+        start_time = self.start_time + timedelta(minutes=offset_minutes)
+        return TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmill,
+            user=user,
+            start_time=start_time,
+            end_time=start_time + timedelta(minutes=30),
+            booked_at=timezone.now() if user else None,
+        )
+
+    def test_claims_and_creates_with_one_statement_each(self):
+        empty_slot = self.create_slot(30)
+        availability_index.get_day_masks(
+            get_facility_for_model(TreadmillTimeSlot), self.start_time.date()
+        )
+        # 예약 행동: SELECT, INSERT (+ SAVEPOINT 2개)
+        # 슬롯: UPDATE, SELECT, INSERT (+ 바깥 SAVEPOINT 2개)
+        # 트랜잭션 안: 리소스 버전 UPSERT, 슬롯 이벤트 INSERT
+        with self.assertNumQueries(11):
+            booked_slots, created = book_timeslots(
+                TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 3, 30, 2
+            )
+        self.assertTrue(created)
+        self.assertEqual(
+            [slot.start_time for slot in booked_slots],
+            [self.start_time + timedelta(minutes=30 * i) for i in range(3)],
+        )
+        self.assertEqual(booked_slots[1].pk, empty_slot.pk)
+        self.assertEqual(
+            TreadmillTimeSlot.objects.filter(user=self.user).count(),
+            3,
+        )
+
+    def test_booked_slot_rolls_back_whole_request(self):
+        # 다른 워커에서 예약되어 인덱스에는 아직 반영되지 않은 상황
+        availability_index.get_day_masks(
+            get_facility_for_model(TreadmillTimeSlot), self.start_time.date()
+        )
+        self.create_slot(60, user=self.other_user)
+        with self.assertRaisesMessage(SlotUnavailableError, "다른 사용자"):
+            book_timeslots(
+                TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 3, 30, 2
+            )
+        self.assertFalse(TreadmillTimeSlot.objects.filter(user=self.user).exists())
+        # 이벤트는 예약 트랜잭션 안에서 저장되므로 함께 롤백됩니다.
+        self.assertFalse(SlotEvent.objects.exists())
+
+    def test_pregenerated_slots_are_claimed_by_update_alone(self):
+        call_command(
+            "generate_timeslots", days=2, facility="treadmill", stdout=StringIO()
+        )
+        availability_index.get_day_masks(
+            get_facility_for_model(TreadmillTimeSlot), self.start_time.date()
+        )
+        # 예약 행동: SELECT, INSERT (+ SAVEPOINT 2개)
+        # 슬롯: UPDATE, SELECT (+ 바깥 SAVEPOINT 2개)
+        # 트랜잭션 안: 리소스 버전 UPSERT, 슬롯 이벤트 INSERT
+        with self.assertNumQueries(10):
+            booked_slots, created = book_timeslots(
+                TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 2, 30, 2
+            )
+        self.assertFalse(created)
+        self.assertEqual([slot.user for slot in booked_slots], [self.user] * 2)
+
+    def test_model_book_is_compare_and_set(self):
+        table = PingPongTable.objects.create()
+        slot = PingPongTableTimeSlot.objects.create(
+            ping_pong_table=table,
+            start_time=self.start_time,
+            end_time=self.start_time + timedelta(minutes=30),
+        )
+        stale_copy = PingPongTableTimeSlot.objects.get(pk=slot.pk)
+        slot.book(self.user)
+        with self.assertRaises(SlotUnavailableError):
+            stale_copy.book(self.other_user)
+        slot.refresh_from_db()
+        self.assertEqual(slot.user, self.user)
+
+
+class GenerateTimeslotsCommandTests(TestCase):
+    def test_creates_missing_slots_for_available_machines_only(self):
+        treadmill = Treadmill.objects.create()
+        Treadmill.objects.create(is_available=False)
+        stdout = StringIO()
+        call_command("generate_timeslots", days=2, facility="treadmill", stdout=stdout)
+        self.assertIn("treadmill: 96 slots created", stdout.getvalue())
+        self.assertEqual(
+            TreadmillTimeSlot.objects.filter(treadmill=treadmill).count(), 96
+        )
+
+        stdout = StringIO()
+        call_command("generate_timeslots", days=3, facility="treadmill", stdout=stdout)
+        self.assertIn("treadmill: 48 slots created", stdout.getvalue())
+
+
+class ArchiveTimeslotsCommandTests(TestCase):
+    def test_moves_old_bookings_and_deletes_old_empty_slots(self):
+        user = User.objects.create_user("2024000001", "password")
+        treadmill = Treadmill.objects.create()
+        day_start, _ = get_day_range(timezone.localdate() - timedelta(days=30))
+        for offset_days, hours, booked in [
+            (0, 10, True),
+            (0, 11, False),
+            (1, 10, True),
+            (29, 10, True),
+        ]:
+            start_time = day_start + timedelta(days=offset_days, hours=hours)
+            TreadmillTimeSlot.objects.create(
+                treadmill=treadmill,
+                user=user if booked else None,
+                start_time=start_time,
+                end_time=start_time + timedelta(minutes=30),
+                booked_at=start_time if booked else None,
+            )
+        old_booking = TreadmillTimeSlot.objects.filter(user=user).first()
+        (user_version,) = get_versions([get_user_version_key(user.pk)])
+
+        stdout = StringIO()
+        call_command(
+            "archive_timeslots",
+            days=28,
+            batch_size=1,
+            facility="treadmill",
+            stdout=stdout,
+        )
+        self.assertIn(
+            "treadmill: 2 bookings archived, 1 empty slots deleted", stdout.getvalue()
+        )
+        self.assertEqual(TreadmillTimeSlot.objects.count(), 1)
+        archived = ArchivedTimeSlot.objects.get(facility="treadmill", id=old_booking.pk)
+        self.assertEqual(archived.machine_id, treadmill.pk)
+        self.assertEqual(archived.user, user)
+        self.assertEqual(archived.start_time, old_booking.start_time)
+        # 보관된 예약이 목록에서 빠지므로 사용자 버전이 올라야 합니다.
+        self.assertGreater(
+            get_versions([get_user_version_key(user.pk)])[0], user_version
+        )
+        # 보관은 예약 해제가 아니므로 해제 이벤트를 남기지 않습니다.
+        self.assertFalse(SlotEvent.objects.exists())
+
+
+class FastSerializationTests(TestCase):
+    def setUp(self):
+        availability_index.invalidate()
+
+    def test_rows_match_list_serializers(self):
+        user = User.objects.create_user("2024000001", "password")
+        start_time = get_day_range(timezone.localdate())[0] + timedelta(hours=10)
+        for facility_key, serializer_class in LIST_SERIALIZER_CLASSES.items():
+            with self.subTest(facility=facility_key):
+                facility = FACILITIES[facility_key]
+                machine = facility.machine_model.objects.create()
+                for offset, booked_user in enumerate([user, None]):
+                    slot_start_time = start_time + timedelta(minutes=30 * offset)
+                    facility.timeslot_model.objects.create(
+                        **{facility.machine_fk_field: machine},
+                        user=booked_user,
+                        start_time=slot_start_time,
+                        end_time=slot_start_time + timedelta(minutes=30),
+                        booked_at=timezone.now() if booked_user else None,
+                    )
+                queryset = facility.timeslot_model.objects.order_by("start_time")
+                self.assertEqual(
+                    serialize_timeslot_rows(
+                        serializer_class,
+                        facility.machine_fk_field,
+                        get_timeslot_rows(queryset, facility.machine_fk_field),
+                    ),
+                    serializer_class(queryset, many=True).data,
+                )
+
+    def test_list_endpoint_output_is_unchanged(self):
+        user = User.objects.create_user("2024000001", "password")
+        treadmill = Treadmill.objects.create()
+        day = timezone.localdate() + timedelta(days=1)
+        start_time = get_day_range(day)[0] + timedelta(hours=10)
+        book_timeslots(TreadmillTimeSlot, treadmill, user, start_time, 2, 30, 2)
+        client = APIClient()
+        client.force_authenticate(user)
+        url = reverse("treadmill-timeslot-list", args=[treadmill.pk])
+        params = {"date_from": day.isoformat(), "date_to": day.isoformat()}
+        responses = []
+        for enabled in (True, False):
+            with override_settings(TIMESLOT_LIST_FAST_SERIALIZATION=enabled):
+                responses.append(client.get(url, params).getvalue())
+        self.assertEqual(responses[0], responses[1])
+
+
+class ListRendererTests(TestCase):
+    def setUp(self):
+        availability_index.invalidate()
+        self.user = User.objects.create_user("2024000001", "password")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.day = timezone.localdate() + timedelta(days=1)
+        start_time = get_day_range(self.day)[0] + timedelta(hours=10)
+        for _ in range(2):
+            book_timeslots(
+                TreadmillTimeSlot,
+                Treadmill.objects.create(),
+                self.user,
+                start_time,
+                2,
+                30,
+                2,
+            )
+
+    def test_dumps_json_matches_json_renderer(self):
+        data = {
+            "name": "런닝머신\u2028",
+            "at": timezone.now(),
+            "items": [1, None, True],
+        }
+        self.assertEqual(dumps_json(data), JSONRenderer().render(data))
+
+    def test_streamed_grid_matches_rendered_grid(self):
+        url = reverse("treadmill-timeslot-grid")
+        params = {"date": self.day.isoformat()}
+        streamed = self.client.get(url, params)
+        self.assertTrue(streamed.streaming)
+        with override_settings(LIST_RESPONSE_STREAMING=False):
+            rendered = self.client.get(url, params)
+        self.assertFalse(rendered.streaming)
+        self.assertEqual(streamed.getvalue(), rendered.content)
+        self.assertEqual(streamed["Content-Type"], rendered["Content-Type"])
+
+    @override_settings(LIST_RESPONSE_STREAMING_ASGI_BATCH_SIZE=2)
+    async def test_asgi_streams_with_async_iterator(self):
+        url = reverse("treadmill-timeslot-grid")
+        params = {"date": self.day.isoformat()}
+        expected = await sync_to_async(
+            lambda: self.client.get(url, params).getvalue()
+        )()
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(url, params)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), expected)
+
+    @skipIf(msgpack is None, "msgpack 이 설치되어 있지 않습니다.")
+    def test_msgpack_is_negotiated_by_accept(self):
+        url = reverse("treadmill-timeslot-grid")
+        params = {"date": self.day.isoformat()}
+        json_response = self.client.get(url, params)
+        response = self.client.get(
+            url, params, headers={"accept": "application/msgpack"}
+        )
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertNotEqual(response["ETag"], json_response["ETag"])
+        self.assertEqual(
+            msgpack.unpackb(response.content), json.loads(json_response.getvalue())
+        )
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.treadmills = [Treadmill.objects.create() for _ in range(5)]
+        cls.day = timezone.localdate() + timedelta(days=1)
+        day_start = get_day_range(cls.day)[0]
+        for index in range(3):
+            start_time = day_start + timedelta(minutes=30 * index)
+            TreadmillTimeSlot.objects.create(
+                treadmill=cls.treadmills[0],
+                user=cls.user,
+                start_time=start_time,
+                end_time=start_time + timedelta(minutes=30),
+                booked_at=start_time,
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def collect_pages(self, url, params, num_queries):
+        pages = []
+        while url:
+            # 뒤 페이지도 OFFSET 없이 첫 페이지와 같은 쿼리 수, 같은 비용입니다.
+            with self.assertNumQueries(num_queries):
+                response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            params = None
+            url = response.get("Link", "").partition(">")[0].lstrip("<")
+        return pages
+
+    def test_machine_list_pages_by_pk(self):
+        # ETag 버전 조회 1번 + 목록 쿼리 1번
+        pages = self.collect_pages(reverse("treadmill-list"), {"limit": 2}, 2)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(
+            [machine["pk"] for page in pages for machine in page],
+            [treadmill.pk for treadmill in self.treadmills],
+        )
+
+    def test_day_timeslot_list_pages_by_start_time(self):
+        url = reverse("treadmill-timeslot-list", args=[self.treadmills[0].pk])
+        # ETag 버전 조회 1번 + 기구 확인 1번 + 목록 쿼리 1번
+        pages = self.collect_pages(url, {"date": self.day.isoformat(), "limit": 2}, 3)
+        start_times = [slot["start_time"] for page in pages for slot in page]
+        self.assertEqual([len(page) for page in pages], [2, 1])
+        self.assertEqual(start_times, sorted(start_times))
+
+    def test_invalid_cursor_and_limit(self):
+        for params in ({"cursor": "nope"}, {"cursor": "WyJ4Il0"}, {"limit": "0"}):
+            response = self.client.get(reverse("treadmill-list"), params)
+            self.assertEqual(response.status_code, 400)
+
+
+class AsyncReadViewsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.token = Token.objects.create(user=cls.user)
+        cls.treadmills = [Treadmill.objects.create() for _ in range(3)]
+        cls.day = timezone.localdate() + timedelta(days=1)
+        day_start = get_day_range(cls.day)[0]
+        for index in range(3):
+            start_time = day_start + timedelta(hours=index + 1)
+            TreadmillTimeSlot.objects.create(
+                treadmill=cls.treadmills[0],
+                user=cls.user,
+                start_time=start_time,
+                end_time=start_time + timedelta(minutes=30),
+                booked_at=start_time,
+            )
+
+    def setUp(self):
+        caches[settings.TIMESLOT_LIST_CACHE_ALIAS].clear()
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+
+    def get_both(self, url_name, args=(), params=None, **headers):
+        """
+        같은 요청을 동기 뷰와 비동기 뷰에 보내고 (동기 응답, 비동기 응답) 을 반환합니다.
+        """
+        headers = {**self.headers, **headers}
+        sync_response = self.client.get(
+            reverse(url_name, args=args), params, headers=headers
+        )
+        async_response = async_to_sync(self.async_client.get)(
+            reverse(f"async-{url_name}", args=args), params, headers=headers
+        )
+        return sync_response, async_response
+
+    def assertSameResponse(self, url_name, args=(), params=None):
+        sync_response, async_response = self.get_both(url_name, args, params)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(
+            json.loads(async_response.content), json.loads(sync_response.getvalue())
+        )
+        # ETag 와 Link 는 요청 경로를 포함하므로 있는지만 비교합니다.
+        for header in ("ETag", "Link"):
+            self.assertEqual(header in async_response, header in sync_response)
+        return async_response
+
+    def test_responses_match_sync_views(self):
+        timeslot_list_args = [self.treadmills[0].pk]
+        self.assertSameResponse("treadmill-list")
+        self.assertSameResponse("treadmill-list", params={"limit": 2})
+        for params in (
+            {"date": self.day.isoformat()},
+            {"date": self.day.isoformat(), "limit": 2},
+            {"date_from": self.day.isoformat(), "date_to": self.day.isoformat()},
+        ):
+            response = self.assertSameResponse(
+                "treadmill-timeslot-list", timeslot_list_args, params
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_errors_match_sync_views(self):
+        self.assertSameResponse(
+            "treadmill-timeslot-list", [0], {"date": self.day.isoformat()}
+        )
+        self.assertSameResponse("treadmill-timeslot-list", [self.treadmills[0].pk])
+        self.assertSameResponse("treadmill-list", params={"cursor": "nope"})
+
+    def test_matching_etag_returns_304(self):
+        url = reverse("async-treadmill-list")
+        etag = async_to_sync(self.async_client.get)(url, headers=self.headers)["ETag"]
+        response = async_to_sync(self.async_client.get)(
+            url, headers={**self.headers, "If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_requires_token(self):
+        response = async_to_sync(self.async_client.get)(reverse("async-treadmill-list"))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["WWW-Authenticate"], "Token")
+
+
+@override_settings(SLOT_EVENT_RELAY_INTERVAL_SECONDS=None)
+class SlotEventStreamTests(TreadmillTestDataMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        availability_index.invalidate()
+        slot_event_broadcaster._relay_last_id = None
+        self.headers = {"Authorization": f"Token {self.token.key}"}
+
+    async def open_stream(self, **headers):
+        response = await self.async_client.get(
+            reverse("treadmill-events"),
+            {"date": self.day.isoformat()},
+            headers={**self.headers, **headers},
+        )
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        return response.streaming_content
+
+    def book(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            book_timeslots(
+                TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+            )
+
+    async def test_booking_is_pushed_to_subscribers(self):
+        stream = await self.open_stream()
+        next_chunk = asyncio.ensure_future(anext(stream))
+        # 스트림이 구독을 마칠 때까지 기다립니다.
+        await asyncio.sleep(0.05)
+        await sync_to_async(self.book)()
+        chunk = await asyncio.wait_for(next_chunk, 1)
+        await stream.aclose()
+
+        header, _, data = chunk.decode().partition("data: ")
+        self.assertIn("event: slots\n", header)
+        self.assertEqual(
+            json.loads(data),
+            {
+                "treadmill": self.treadmill.pk,
+                "booked": True,
+                "start_times": [timezone.localtime(self.start_time).isoformat()],
+            },
+        )
+
+    async def test_last_event_id_replays_missed_events(self):
+        await sync_to_async(record_machines_changed)(Treadmill, [self.treadmill.pk])
+        stream = await self.open_stream(last_event_id="0")
+        chunk = await asyncio.wait_for(anext(stream), 1)
+        await stream.aclose()
+        self.assertIn(b"event: machines\n", chunk)
+        self.assertIn(f'"pk":{self.treadmill.pk}'.encode(), chunk)
+
+    @override_settings(SLOT_EVENT_QUEUE_SIZE=1)
+    async def test_slow_subscriber_is_dropped(self):
+        subscription = slot_event_broadcaster.subscribe("treadmill", self.day)
+        try:
+            event = SlotEvent(pk=1, facility="treadmill", date=self.day, data={})
+            subscription.offer(event)
+            subscription.offer(event)
+            with self.assertRaises(DroppedError):
+                await subscription.get(0.01)
+        finally:
+            slot_event_broadcaster.unsubscribe(subscription)
+
+    async def test_relay_forwards_events_saved_by_other_processes(self):
+        subscription = slot_event_broadcaster.subscribe("treadmill", self.day)
+        try:
+            await sync_to_async(slot_event_broadcaster.relay_once)()
+            event = await SlotEvent.objects.acreate(
+                facility="treadmill",
+                date=self.day,
+                event_type=SlotEvent.EventType.SLOTS,
+                data={},
+                origin="other-worker",
+            )
+            await sync_to_async(slot_event_broadcaster.relay_once)()
+            self.assertEqual(await subscription.get(1), event)
+        finally:
+            slot_event_broadcaster.unsubscribe(subscription)
+
+    def test_rejects_missing_token_and_date(self):
+        url = reverse("treadmill-events")
+        response = async_to_sync(self.async_client.get)(url, {"date": "2024-01-01"})
+        self.assertEqual(response.status_code, 401)
+        response = async_to_sync(self.async_client.get)(url, headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+
+
+class ChangeListTests(TreadmillTestDataMixin, TestCase):
+    def setUp(self):
+        availability_index.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_changes(self, **params):
+        return self.client.get(reverse("change-list"), params)
+
+    def test_returns_changes_since_cursor(self):
+        cursor = self.get_changes().data["next_cursor"]
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+        )
+        record_machines_changed(Treadmill, [self.treadmill.pk])
+
+        response = self.get_changes(since=cursor, limit=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["has_more"])
+        self.assertEqual(
+            [change["event_type"] for change in response.data["changes"]], ["slots"]
+        )
+        response = self.get_changes(since=response.data["next_cursor"])
+        self.assertFalse(response.data["has_more"])
+        self.assertEqual(
+            [change["event_type"] for change in response.data["changes"]],
+            ["machines"],
+        )
+        response = self.get_changes(since=response.data["next_cursor"])
+        self.assertEqual(response.data["changes"], [])
+
+        other_day = (self.day + timedelta(days=1)).isoformat()
+        response = self.get_changes(since=cursor, facility="cycle")
+        self.assertEqual(response.data["changes"], [])
+        response = self.get_changes(since=cursor, date=other_day)
+        self.assertEqual(
+            [change["event_type"] for change in response.data["changes"]],
+            ["machines"],
+        )
+
+    def test_compacted_cursor_returns_410(self):
+        cursor = self.get_changes().data["next_cursor"]
+        record_machines_changed(Treadmill, [self.treadmill.pk])
+        out = StringIO()
+        call_command("compact_slot_events", days=0, stdout=out)
+        self.assertIn("1 events deleted", out.getvalue())
+        self.assertFalse(SlotEvent.objects.exists())
+        self.assertEqual(self.get_changes(since=cursor).status_code, 410)
+
+        cursor = self.get_changes().data["next_cursor"]
+        response = self.get_changes(since=cursor)
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_parameters(self):
+        for params in ({"since": "nope"}, {"since": "WyJ4Il0"}, {"facility": "x"}):
+            self.assertEqual(self.get_changes(**params).status_code, 400)
+
+
+class AdminBulkActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.admin = User.objects.create_superuser("2024000002", "password")
+        cls.treadmills = Treadmill.objects.bulk_create(
+            [Treadmill(), Treadmill(is_available=False)]
+        )
+        cls.day = timezone.localdate() + timedelta(days=1)
+        cls.start_time = get_day_range(cls.day)[0] + timedelta(hours=10)
+
+    def setUp(self):
+        availability_index.invalidate()
+        self.client.force_login(self.admin)
+
+    def run_action(self, url_name, action, pks, **data):
+        """
+        관리자 변경 목록 화면에서 pks 를 선택해 action 을 실행합니다.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse(url_name),
+                {"action": action, "_selected_action": pks, **data},
+            )
+
+    def book(self, treadmill, hours=0):
+        book_timeslots(
+            TreadmillTimeSlot,
+            treadmill,
+            self.user,
+            self.start_time + timedelta(hours=hours),
+            1,
+            30,
+            10,
+        )
+
+    def test_toggle_availability_updates_in_one_statement(self):
+        pks = [treadmill.pk for treadmill in self.treadmills]
+        received = []
+
+        def receiver(sender, machine_pks, **kwargs):
+            received.append(machine_pks)
+
+        machines_changed.connect(receiver)
+        self.addCleanup(machines_changed.disconnect, receiver)
+        with CaptureQueriesContext(connection) as queries:
+            self.run_action(
+                "admin:gym_treadmill_changelist", "toggle_availability", pks
+            )
+        machine_updates = [
+            query
+            for query in queries
+            if query["sql"].startswith('UPDATE "gym_treadmill"')
+        ]
+        self.assertEqual(len(machine_updates), 1)
+        self.assertEqual(
+            list(
+                Treadmill.objects.order_by("pk").values_list("is_available", flat=True)
+            ),
+            [False, True],
+        )
+        self.assertEqual(len(received), 1)
+        self.assertCountEqual(received[0], pks)
+
+    def test_change_form_save_sends_machines_changed(self):
+        treadmill = self.treadmills[0]
+        received = []
+
+        def receiver(sender, machine_pks, **kwargs):
+            received.append(machine_pks)
+
+        machines_changed.connect(receiver)
+        self.addCleanup(machines_changed.disconnect, receiver)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("admin:gym_treadmill_change", args=[treadmill.pk]), {}
+            )
+        self.assertEqual(response.status_code, 302)
+        treadmill.refresh_from_db()
+        self.assertFalse(treadmill.is_available)
+        self.assertEqual(received, [[treadmill.pk]])
+        self.assertTrue(
+            SlotEvent.objects.filter(
+                event_type=SlotEvent.EventType.MACHINES, facility="treadmill"
+            ).exists()
+        )
+
+    def test_release_selected_timeslots(self):
+        self.book(self.treadmills[0])
+        self.book(self.treadmills[0], hours=1)
+        TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmills[0],
+            start_time=self.start_time + timedelta(hours=2),
+            end_time=self.start_time + timedelta(hours=2, minutes=30),
+        )
+        pks = list(TreadmillTimeSlot.objects.values_list("pk", flat=True))
+        self.run_action(
+            "admin:gym_treadmilltimeslot_changelist", "release_selected_timeslots", pks
+        )
+        self.assertFalse(TreadmillTimeSlot.objects.filter(user__isnull=False).exists())
+        # 기구 하나의 같은 날 슬롯이므로 slots 이벤트 하나로 알립니다.
+        event = SlotEvent.objects.get(
+            event_type=SlotEvent.EventType.SLOTS, data__booked=False
+        )
+        self.assertEqual(len(event.data["start_times"]), 2)
+        facility = get_facility_for_model(Treadmill)
+        self.assertEqual(
+            availability_index.get_mask(facility, self.treadmills[0].pk, self.day), 0
+        )
+
+    def test_disable_and_release_date_range(self):
+        self.book(self.treadmills[0])
+        self.book(self.treadmills[0], hours=48)
+        day = self.day.isoformat()
+        self.run_action(
+            "admin:gym_treadmill_changelist",
+            "disable_and_release_date_range",
+            [self.treadmills[0].pk],
+            date_from=day,
+            date_to=day,
+        )
+        self.assertFalse(Treadmill.objects.get(pk=self.treadmills[0].pk).is_available)
+        self.assertEqual(
+            list(
+                TreadmillTimeSlot.objects.filter(user__isnull=False).values_list(
+                    "start_time", flat=True
+                )
+            ),
+            [self.start_time + timedelta(hours=48)],
+        )
+        self.assertEqual(
+            BookingAction.objects.get_count(self.user, "treadmill", self.day), 0
+        )
+
+    def test_disable_and_release_requires_date_range(self):
+        response = self.run_action(
+            "admin:gym_treadmill_changelist",
+            "disable_and_release_date_range",
+            [self.treadmills[0].pk],
+            date_from=self.day.isoformat(),
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Treadmill.objects.get(pk=self.treadmills[0].pk).is_available)
+
+    def test_deleting_booked_slot_restores_quota(self):
+        self.book(self.treadmills[0])
+        self.run_action(
+            "admin:gym_treadmilltimeslot_changelist",
+            "delete_selected",
+            list(TreadmillTimeSlot.objects.values_list("pk", flat=True)),
+            post="yes",
+        )
+        self.assertFalse(TreadmillTimeSlot.objects.exists())
+        self.assertEqual(BookingAction.objects.get(user=self.user).count, 0)
+
+    def test_deleting_booked_slot_from_change_form_records_one_release(self):
+        self.book(self.treadmills[0])
+        slot = TreadmillTimeSlot.objects.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("admin:gym_treadmilltimeslot_delete", args=[slot.pk]),
+                {"post": "yes"},
+            )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(TreadmillTimeSlot.objects.exists())
+        self.assertEqual(BookingAction.objects.get(user=self.user).count, 0)
+        self.assertEqual(SlotEvent.objects.filter(data__booked=False).count(), 1)
+
+    def test_purge_empty_timeslots_keeps_booked_slots(self):
+        self.book(self.treadmills[0])
+        for hours in (1, 2):
+            TreadmillTimeSlot.objects.create(
+                treadmill=self.treadmills[0],
+                start_time=self.start_time + timedelta(hours=hours),
+                end_time=self.start_time + timedelta(hours=hours, minutes=30),
+            )
+        pks = list(TreadmillTimeSlot.objects.values_list("pk", flat=True))
+        self.run_action(
+            "admin:gym_treadmilltimeslot_changelist", "purge_empty_timeslots", pks
+        )
+        self.assertEqual(TreadmillTimeSlot.objects.count(), 1)
+        self.assertTrue(TreadmillTimeSlot.objects.get().is_booked)
+
+
+class BookingActionQuotaTests(TreadmillTestDataMixin, TestCase):
+    def setUp(self):
+        availability_index.invalidate()
+
+    def test_quota_is_enforced_inside_the_transaction(self):
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 1
+        )
+        # 직렬화기 검증을 이미 통과한 동시 요청이라도 트랜잭션 안에서 막힙니다.
+        with self.assertRaises(BookingQuotaExceededError):
+            book_timeslots(
+                TreadmillTimeSlot,
+                self.treadmill,
+                self.user,
+                self.start_time + timedelta(hours=1),
+                1,
+                30,
+                1,
+            )
+        self.assertEqual(
+            TreadmillTimeSlot.objects.filter(user=self.user).count(),
+            1,
+        )
+        booking_action = BookingAction.objects.get(user=self.user)
+        self.assertEqual(booking_action.count, 1)
+        self.assertEqual(
+            booking_action.treadmilltimeslot_set.get().start_time, self.start_time
+        )
+
+    def test_failed_booking_does_not_consume_quota(self):
+        TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmill,
+            user=User.objects.create_user("2024000002", "password"),
+            start_time=self.start_time,
+            end_time=self.start_time + timedelta(minutes=30),
+        )
+        with self.assertRaises(SlotUnavailableError):
+            book_timeslots(
+                TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 1
+            )
+        self.assertEqual(
+            BookingAction.objects.get_count(
+                self.user, "treadmill", self.start_time.date()
+            ),
+            0,
+        )
+
+    def test_release_restores_quota_per_fully_released_request(self):
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 2, 30, 3
+        )
+        book_timeslots(
+            TreadmillTimeSlot,
+            self.treadmill,
+            self.user,
+            self.start_time + timedelta(hours=2),
+            1,
+            30,
+            3,
+        )
+        slots = TreadmillTimeSlot.objects.order_by("start_time")
+        booking_action = BookingAction.objects.get(user=self.user)
+        self.assertEqual(booking_action.count, 2)
+
+        # 첫 요청의 슬롯 하나만 해제하면 그 요청은 아직 남아 있습니다.
+        release_timeslots(slots.filter(pk=slots[0].pk))
+        booking_action.refresh_from_db()
+        self.assertEqual(booking_action.count, 2)
+
+        release_timeslots(TreadmillTimeSlot.objects.all())
+        booking_action.refresh_from_db()
+        self.assertEqual(booking_action.count, 0)
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 1
+        )
+
+
+class QueryPlanTests(TreadmillTestDataMixin, TestCase):
+    """
+    주요 엔드포인트가 실행하는 SELECT 가 타임슬롯 테이블을 전체 스캔하지 않는지 EXPLAIN 으로 확인
+    """
+
+    def setUp(self):
+        availability_index.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertNoFullScan(self, captured_queries):
+        # 기구 목록 조회는 기구 테이블 전체를 읽는 것이 정상입니다.
+        scannable_tables = {
+            facility.machine_model._meta.db_table for facility in FACILITIES.values()
+        }
+        with connection.cursor() as cursor:
+            for query in captured_queries:
+                sql = query["sql"]
+                if not sql.startswith("SELECT"):
+                    continue
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                for row in cursor.fetchall():
+                    detail = row[-1]
+                    if detail.startswith("SCAN "):
+                        self.assertIn(
+                            detail.split()[1], scannable_tables, f"{detail}\n{sql}"
+                        )
+
+    def test_endpoints_use_indexes(self):
+        requests = [
+            ("get", reverse("treadmill-list"), {}),
+            ("get", reverse("ping-pong-table-list"), {}),
+            ("get", reverse("arcade-machine-list"), {}),
+            ("get", reverse("induction list"), {}),
+            ("get", reverse("cycle-list"), {}),
+            (
+                "get",
+                reverse("treadmill-timeslot-list", args=[self.treadmill.pk]),
+                {"date": self.day.isoformat()},
+            ),
+            ("get", reverse("treadmill-timeslot-grid"), {"date": self.day.isoformat()}),
+            ("get", reverse("treadmill-availability"), {"date": self.day.isoformat()}),
+            (
+                "post",
+                reverse("treadmill-timeslot-book", args=[self.treadmill.pk]),
+                {"start_time": self.start_time.isoformat()},
+            ),
+            ("get", reverse("my-all-bookings"), {}),
+            ("get", reverse("occupancy-now"), {}),
+        ]
+        for method, url, data in requests:
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as context:
+                    response = getattr(self.client, method)(url, data)
+                self.assertLess(response.status_code, 300)
+                self.assertNoFullScan(context.captured_queries)
+
+
+@override_settings(
+    BOOKING_LOCK_RETRY_ATTEMPTS=3, BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS=0
+)
+class LockRetryTests(SimpleTestCase):
+    def make_flaky(self, failures, message="database is locked"):
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) <= failures:
+                raise OperationalError(message)
+            return "ok"
+
+        return func, calls
+
+    def test_retries_until_lock_is_acquired(self):
+        func, calls = self.make_flaky(2)
+        self.assertEqual(run_with_lock_retry(func), "ok")
+        self.assertEqual(len(calls), 3)
+
+    def test_exhausted_retries_raise_busy_error(self):
+        func, calls = self.make_flaky(3)
+        with self.assertRaises(BookingBusyError):
+            run_with_lock_retry(func)
+        self.assertEqual(len(calls), 3)
+
+    def test_other_operational_errors_are_not_retried(self):
+        func, calls = self.make_flaky(1, message="no such table: foo")
+        with self.assertRaises(OperationalError):
+            run_with_lock_retry(func)
+        self.assertEqual(len(calls), 1)
+
+
+class BookingLockErrorTests(TreadmillTestDataMixin, TestCase):
+    """
+    예약 요청 중 DB 잠금 오류가 났을 때의 HTTP 응답과 DB 상태
+    """
+
+    def setUp(self):
+        availability_index.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def book(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse("treadmill-timeslot-book", args=[self.treadmill.pk]),
+                {"start_time": self.start_time, "duration_minutes": 60},
+            )
+
+    def test_lock_error_inside_the_claim_rolls_back(self):
+        def locked_slot_update(execute, sql, params, many, context):
+            if sql.startswith('UPDATE "gym_treadmilltimeslot"'):
+                raise OperationalError("database is locked")
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(locked_slot_update):
+            response = self.book()
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(TreadmillTimeSlot.objects.filter(user=self.user).exists())
+        self.assertEqual(
+            BookingAction.objects.get_count(self.user, "treadmill", self.day), 0
+        )
+        self.assertFalse(SlotEvent.objects.exists())
+
+    def test_lock_error_after_commit_keeps_the_booking(self):
+        def locked_receiver(sender, **kwargs):
+            raise OperationalError("database is locked")
+
+        slots_changed.connect(locked_receiver)
+        self.addCleanup(slots_changed.disconnect, locked_receiver)
+        with self.assertLogs("bookings.signals", "ERROR"):
+            response = self.book()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(TreadmillTimeSlot.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(
+            BookingAction.objects.get_count(self.user, "treadmill", self.day), 1
+        )
+        self.assertTrue(SlotEvent.objects.exists())
+
+
+class BenchBookingCommandTests(TransactionTestCase):
+    def setUp(self):
+        availability_index.invalidate()
+
+    def test_only_one_user_books_the_contended_slot(self):
+        out = StringIO()
+        call_command(
+            "bench_booking",
+            users=4,
+            workers=1,
+            facility="treadmill",
+            mode="thread",
+            stdout=out,
+        )
+        self.assertIn("treadmill/thread: 4 req", out.getvalue())
+        self.assertIn("201=1 409=3", out.getvalue())
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(TreadmillTimeSlot.objects.exists())
+
+
+class BookingBusyTimeoutTests(TransactionTestCase):
+    def setUp(self):
+        availability_index.invalidate()
+
+    def get_busy_timeout(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            return cursor.fetchone()[0]
+
+    @override_settings(BOOKING_SQLITE_BUSY_TIMEOUT_SECONDS=0.15)
+    def test_booking_waits_for_the_short_timeout_only(self):
+        user = User.objects.create_user("2024000001", "password")
+        treadmill = Treadmill.objects.create()
+        day_start, _ = get_day_range(timezone.localdate() + timedelta(days=1))
+        start_time = day_start + timedelta(hours=10)
+        connection_timeout = self.get_busy_timeout()
+        timeouts = []
+
+        def record_timeout(execute, sql, params, many, context):
+            if sql.startswith('UPDATE "gym_treadmilltimeslot"'):
+                timeouts.append(self.get_busy_timeout())
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record_timeout):
+            book_timeslots(TreadmillTimeSlot, treadmill, user, start_time, 1, 30, 2)
+        self.assertEqual(timeouts, [150])
+        self.assertEqual(self.get_busy_timeout(), connection_timeout)
+
+
+class VersionETagTests(TreadmillTestDataMixin, TestCase):
+    def setUp(self):
+        availability_index.invalidate()
+        caches[settings.TIMESLOT_LIST_CACHE_ALIAS].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.list_url = reverse("treadmill-timeslot-list", args=[self.treadmill.pk])
+
+    def get_list(self, **headers):
+        return self.client.get(
+            self.list_url, {"date": self.day.isoformat()}, headers=headers
+        )
+
+    def test_matching_etag_returns_304_without_list_query(self):
+        etag = self.get_list()["ETag"]
+        # ETag 버전 조회만 실행되고 기구/슬롯 쿼리는 실행되지 않습니다.
+        with self.assertNumQueries(1):
+            response = self.get_list(if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_booking_changes_etags(self):
+        list_etag = self.get_list()["ETag"]
+        my_bookings_etag = self.client.get(reverse("my-all-bookings"))["ETag"]
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+        )
+        response = self.get_list(if_none_match=list_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], list_etag)
+        response = self.client.get(
+            reverse("my-all-bookings"), headers={"if_none_match": my_bookings_etag}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_admin_machine_change_changes_machine_list_etag(self):
+        etag = self.client.get(reverse("treadmill-list"))["ETag"]
+        record_machines_changed(Treadmill, [self.treadmill.pk])
+        response = self.client.get(
+            reverse("treadmill-list"), headers={"if_none_match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_deleting_booked_slot_changes_etag(self):
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+        )
+        etag = self.get_list()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            TreadmillTimeSlot.objects.get().delete()
+        response = self.get_list(if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
+
+
+class TimeSlotListCacheTests(TreadmillTestDataMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = User.objects.create_superuser("2024000002", "password")
+
+    def setUp(self):
+        availability_index.invalidate()
+        self.cache = caches[settings.TIMESLOT_LIST_CACHE_ALIAS]
+        self.cache.clear()
+        timeslot_list_cache.reset_stats()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.list_url = reverse("treadmill-timeslot-list", args=[self.treadmill.pk])
+
+    def get_list(self):
+        return self.client.get(self.list_url, {"date": self.day.isoformat()})
+
+    def test_repeated_request_is_served_from_cache(self):
+        self.assertEqual(self.get_list()["X-Cache"], "MISS")
+        # ETag 버전 조회만 실행되고 기구/슬롯 쿼리는 실행되지 않습니다.
+        with self.assertNumQueries(1):
+            response = self.get_list()
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data, [])
+
+    def test_booking_invalidates_only_that_day(self):
+        self.get_list()
+        other_day = {"date": (self.day + timedelta(days=1)).isoformat()}
+        self.client.get(self.list_url, other_day)
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+        )
+        response = self.get_list()
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(self.client.get(self.list_url, other_day)["X-Cache"], "HIT")
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        self.get_list()
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+        )
+        key = timeslot_list_cache.get_key(
+            get_facility_for_model(Treadmill), self.treadmill.pk, self.day
+        )
+        self.cache.add(timeslot_list_cache.get_refresh_lock_key(key), True)
+
+        response = self.get_list()
+        self.assertEqual(response["X-Cache"], "STALE")
+        self.assertEqual(response.data, [])
+
+    def test_stale_response_etag_revalidates_to_fresh_data(self):
+        self.get_list()
+        book_timeslots(
+            TreadmillTimeSlot, self.treadmill, self.user, self.start_time, 1, 30, 2
+        )
+        key = timeslot_list_cache.get_key(
+            get_facility_for_model(Treadmill), self.treadmill.pk, self.day
+        )
+        lock_key = timeslot_list_cache.get_refresh_lock_key(key)
+        self.cache.add(lock_key, True)
+        stale_response = self.get_list()
+        self.assertEqual(stale_response.data, [])
+        self.cache.delete(lock_key)
+
+        response = self.client.get(
+            self.list_url,
+            {"date": self.day.isoformat()},
+            headers={"if_none_match": stale_response["ETag"]},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        self.assertNotEqual(response["ETag"], stale_response["ETag"])
+
+    def test_deleted_machine_is_not_served_from_cache(self):
+        self.get_list()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.treadmill.delete()
+        self.assertEqual(self.get_list().status_code, 404)
+
+    def test_stats_are_admin_only(self):
+        self.get_list()
+        self.get_list()
+        url = reverse("response-cache-stats")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["timeslot_list"],
+            {"hit": 1, "stale": 0, "miss": 1, "hit_ratio": 0.5},
+        )
@@ -0,0 +1,16 @@
+from django.urls import path
+from .views import (
+    ChangeListAPIView,
+    OccupancyNowAPIView,
+    ResponseCacheStatsAPIView,
+)
+
+urlpatterns = [
+    path("occupancy/now/", OccupancyNowAPIView.as_view(), name="occupancy-now"),
+    path("changes/", ChangeListAPIView.as_view(), name="change-list"),
+    path(
+        "cache/stats/",
+        ResponseCacheStatsAPIView.as_view(),
+        name="response-cache-stats",
+    ),
+]
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+
+from django.db import connections
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+
+def parse_query_date(date_str, param_name="date"):
+    """
+    쿼리 파라미터로 받은 날짜 문자열(YYYY-MM-DD)을 date 로 변환
+    """
+    if not date_str:
+        raise ValidationError(
+            f"날짜를 '{param_name}' 파라미터로 지정해주세요 (YYYY-MM-DD)."
+        )
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValidationError("날짜 형식이 잘못되었습니다. (YYYY-MM-DD)")
+
+
+def get_day_range(query_date):
+    """
+    해당 날짜의 시작 시각과 다음 날 시작 시각을 기본 시간대 기준으로 반환
+    """
+    start_dt = timezone.make_aware(
+        datetime.combine(query_date, datetime.min.time()),
+        timezone.get_default_timezone(),
+    )
+    return start_dt, start_dt + timedelta(days=1)
+
+
+def parse_date_range(query_params, max_days):
+    """
+    date_from, date_to 쿼리 파라미터를 검증하여 (date_from, date_to) 로 반환
+    두 날짜 모두 포함하며 최대 max_days 일까지 조회할 수 있습니다.
+    """
+    date_from = parse_query_date(query_params.get("date_from"), "date_from")
+    date_to = parse_query_date(query_params.get("date_to"), "date_to")
+    if date_from > date_to:
+        raise ValidationError("date_from 은 date_to 보다 늦을 수 없습니다.")
+    if (date_to - date_from).days + 1 > max_days:
+        raise ValidationError(f"최대 {max_days}일까지만 조회할 수 있습니다.")
+    return date_from, date_to
+
+
+def get_next_slot_boundary(moment, slot_minutes=30):
+    """
+    moment 이후 처음 오는 슬롯 경계(기본: 매 시 정각과 30분)
+    """
+    local_moment = timezone.localtime(moment)
+    slot_start = local_moment.replace(
+        minute=local_moment.minute - local_moment.minute % slot_minutes,
+        second=0,
+        microsecond=0,
+    )
+    return slot_start + timedelta(minutes=slot_minutes)
+
+
+def delete_rows(queryset):
+    """
+    queryset 의 조건을 그대로 담은 DELETE 문 한 번으로 행을 지우고 지운 행 수를 반환합니다.
+
+    QuerySet.delete() 는 post_delete 수신자가 있으면 pk 를 먼저 모은 뒤 pk 로만 지우고
+    행마다 시그널을 보냅니다. 이 함수는 시그널을 보내지 않으며, 모은 뒤에 바뀐 행이
+    조건 밖이면 지우지 않습니다. 연관 객체의 on_delete 도 처리하지 않으므로
+    다른 모델이 참조하지 않는 행에만 씁니다.
+    """
+    connection = connections[queryset.db]
+    quote_name = connection.ops.quote_name
+    meta = queryset.model._meta
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote_name(meta.db_table)} "
+            f"WHERE {quote_name(meta.pk.column)} IN ({sql})",
+            params,
+        )
+        return cursor.rowcount
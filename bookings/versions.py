@@ -0,0 +1,91 @@
+from django.db import connection
+from django.utils import timezone
+
+from .facilities import get_facility_for_model
+from .models import ResourceVersion
+
+
+def get_machine_day_version_key(facility, machine_pk, day):
+    """
+    기구 하나의 하루치 예약 슬롯
+    """
+    return f"{facility.key}:{machine_pk}:{day.isoformat()}"
+
+
+def get_facility_day_version_key(facility, day):
+    """
+    한 시설의 모든 기구의 하루치 예약 슬롯
+    """
+    return f"{facility.key}:*:{day.isoformat()}"
+
+
+def get_machines_version_key(facility):
+    """
+    한 시설의 기구 목록(사용 가능 여부 등)
+    """
+    return f"{facility.key}:machines"
+
+
+def get_user_version_key(user_pk):
+    """
+    사용자 한 명의 예약 목록
+    """
+    return f"user:{user_pk}"
+
+
+def get_versions(keys):
+    """
+    키 순서대로 버전 목록을 쿼리 한 번으로 반환합니다. 한 번도 바뀌지 않은 키는 0 입니다.
+    """
+    versions = dict(
+        ResourceVersion.objects.filter(key__in=keys).values_list("key", "version")
+    )
+    return [versions.get(key, 0) for key in keys]
+
+
+async def aget_versions(keys):
+    """
+    get_versions 의 비동기 버전
+    """
+    versions = {
+        key: version
+        async for key, version in ResourceVersion.objects.filter(
+            key__in=keys
+        ).values_list("key", "version")
+    }
+    return [versions.get(key, 0) for key in keys]
+
+
+def bump_versions(keys):
+    """
+    키마다 버전을 1 올립니다. 없는 키는 버전 1 로 만듭니다.
+    예약 경로에 쓰기를 최소로 더하도록 UPSERT 문 하나로 처리합니다.
+    """
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    quote_name = connection.ops.quote_name
+    table = quote_name(ResourceVersion._meta.db_table)
+    key_column = quote_name("key")
+    version_column = quote_name("version")
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {table} ({key_column}, {version_column}) VALUES (%s, 1) "
+            f"ON CONFLICT ({key_column}) "
+            f"DO UPDATE SET {version_column} = {table}.{version_column} + 1",
+            [(key,) for key in keys],
+        )
+
+
+def bump_slot_versions(sender, machine_pk, start_times, user_pks=()):
+    facility = get_facility_for_model(sender)
+    days = {timezone.localtime(start_time).date() for start_time in start_times}
+    keys = [get_user_version_key(user_pk) for user_pk in user_pks]
+    for day in days:
+        keys.append(get_machine_day_version_key(facility, machine_pk, day))
+        keys.append(get_facility_day_version_key(facility, day))
+    bump_versions(keys)
+
+
+def bump_machine_versions(sender):
+    bump_versions([get_machines_version_key(get_facility_for_model(sender))])
@@ -0,0 +1,649 @@
+import hashlib
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from rest_framework import permissions, generics, views, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from .availability import availability_index, SLOT_DURATION_MINUTES
+from .events import get_compacted_event_id
+from .facilities import FACILITIES, get_facility_for_model
+from .fast_serializers import (
+    MACHINE_ID,
+    PK,
+    START_TIME,
+    get_timeslot_rows,
+    serialize_timeslot_rows,
+)
+from .models import SlotEvent
+from .occupancy import occupancy_snapshot
+from .pagination import (
+    INVALID_CURSOR_MESSAGE,
+    KeysetPagination,
+    MachineKeysetPagination,
+    TimeSlotKeysetPagination,
+    decode_cursor,
+    encode_cursor,
+)
+from .renderers import (
+    LIST_RENDERER_CLASSES,
+    FastJSONRenderer,
+    aiter_json_array,
+    iter_json_array,
+)
+from .response_cache import STALE, timeslot_list_cache
+from .serializers import ChangeListResponseSerializer, ChangeSerializer
+from .utils import (
+    parse_query_date,
+    parse_date_range,
+    get_day_range,
+    get_next_slot_boundary,
+)
+from .versions import (
+    aget_versions,
+    get_facility_day_version_key,
+    get_machine_day_version_key,
+    get_machines_version_key,
+    get_versions,
+)
+
+MAX_DATE_RANGE_DAYS = 31
+
+
+class VersionETagMixin:
+    """
+    리소스 버전으로 강한 ETag 를 만들어 GET 응답에 붙이고,
+    If-None-Match 가 같으면 목록 쿼리와 직렬화 없이 304 로 응답합니다.
+
+    하위 클래스에서 get_version_keys() 로 응답이 의존하는 버전 키 목록을,
+    시간이 지나면 바뀌는 응답이면 get_etag_time_key() 로 시간 구간을 반환합니다.
+    조회한 버전은 self.resource_versions 에 남아 응답 캐시에서 다시 씁니다.
+    """
+
+    resource_versions = None
+
+    def get_version_keys(self):
+        raise NotImplementedError
+
+    def get_etag_time_key(self):
+        return None
+
+    def get_etag(self):
+        keys = self.get_etag_version_keys()
+        if keys is None:
+            return None
+        self.resource_versions = dict(zip(keys, get_versions(keys)))
+        return self.make_etag()
+
+    async def aget_etag(self):
+        """
+        get_etag 의 비동기 버전. 비동기 뷰(bookings.async_views)에서 사용합니다.
+        """
+        keys = self.get_etag_version_keys()
+        if keys is None:
+            return None
+        self.resource_versions = dict(zip(keys, await aget_versions(keys)))
+        return self.make_etag()
+
+    def get_etag_version_keys(self):
+        try:
+            return self.get_version_keys()
+        except ValidationError:
+            # 잘못된 요청은 ETag 없이 본래 처리에서 400 으로 응답합니다.
+            return None
+
+    def make_etag(self):
+        parts = [
+            self.request.get_full_path(),
+            self.request.headers.get("Accept", ""),
+            *(f"{key}={version}" for key, version in self.resource_versions.items()),
+            str(self.get_etag_time_key()),
+        ]
+        digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16)
+        return f'"{digest.hexdigest()}"'
+
+    def get_with_etag(self, handler, request, *args, **kwargs):
+        etag = self.get_etag()
+        if etag is not None:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                return not_modified
+        response = handler(request, *args, **kwargs)
+        if (
+            etag is not None
+            and response.status_code == status.HTTP_200_OK
+            and not response.has_header("ETag")
+        ):
+            response["ETag"] = etag
+        return response
+
+
+class StreamingListMixin:
+    """
+    JSON 으로 응답할 때는 항목을 하나씩 인코딩해 스트리밍하고,
+    다른 형식(MessagePack, 브라우저용 API 화면)은 목록을 모아 일반 Response 로 응답합니다.
+    Accept 에 따라 응답 형식이 달라지므로 ETag 에도 Accept 가 포함됩니다(VersionETagMixin).
+
+    ASGI 로 받은 요청은 비동기 iterator(aiter_json_array)로 스트리밍합니다.
+    """
+
+    renderer_classes = LIST_RENDERER_CLASSES
+
+    def stream_list(self, items):
+        if settings.LIST_RESPONSE_STREAMING and isinstance(
+            self.request.accepted_renderer, FastJSONRenderer
+        ):
+            if isinstance(self.request._request, ASGIRequest):
+                content = aiter_json_array(
+                    items, settings.LIST_RESPONSE_STREAMING_ASGI_BATCH_SIZE
+                )
+            else:
+                content = iter_json_array(items)
+            return StreamingHttpResponse(
+                content, content_type=self.request.accepted_renderer.media_type
+            )
+        return Response(list(items))
+
+
+class TimeSlotRowsMixin:
+    """
+    TIMESLOT_LIST_FAST_SERIALIZATION 이 켜져 있으면 슬롯을 모델 인스턴스 대신
+    필요한 열만 담은 튜플로 가져와 bookings.fast_serializers 로 직렬화합니다.
+    출력은 serializer_class 로 직렬화한 것과 같습니다.
+    """
+
+    def fetch_timeslots(self, queryset):
+        if settings.TIMESLOT_LIST_FAST_SERIALIZATION:
+            return get_timeslot_rows(queryset, self.machine_fk_field)
+        return queryset
+
+    def get_timeslot_start_time(self, timeslot):
+        if settings.TIMESLOT_LIST_FAST_SERIALIZATION:
+            return timeslot[START_TIME]
+        return timeslot.start_time
+
+    def get_keyset_position(self, timeslot):
+        """
+        TimeSlotKeysetPagination 의 (start_time, pk) 키를 꺼냅니다.
+        """
+        if settings.TIMESLOT_LIST_FAST_SERIALIZATION:
+            return [timeslot[START_TIME], timeslot[PK]]
+        return [timeslot.start_time, timeslot.pk]
+
+    def get_timeslot_machine_pk(self, timeslot):
+        if settings.TIMESLOT_LIST_FAST_SERIALIZATION:
+            return timeslot[MACHINE_ID]
+        return getattr(timeslot, f"{self.machine_fk_field}_id")
+
+    def serialize_timeslots(self, timeslots):
+        if settings.TIMESLOT_LIST_FAST_SERIALIZATION:
+            return serialize_timeslot_rows(
+                self.get_serializer_class(), self.machine_fk_field, timeslots
+            )
+        return self.get_serializer(timeslots, many=True).data
+
+
+class BaseMachineListAPIView(VersionETagMixin, generics.ListAPIView):
+    """
+    기구 목록과 각 기구의 현재 사용 여부 조회
+
+    사용 여부는 슬롯 경계마다 바뀔 수 있어 ETag 에 현재 슬롯 구간을 포함합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = MachineKeysetPagination
+
+    def get(self, request, *args, **kwargs):
+        return self.get_with_etag(super().get, request, *args, **kwargs)
+
+    def get_queryset(self):
+        return super().get_queryset().with_is_using()
+
+    def get_version_keys(self):
+        facility = get_facility_for_model(self.queryset.model)
+        return [
+            get_machines_version_key(facility),
+            get_facility_day_version_key(facility, timezone.localdate()),
+        ]
+
+    def get_etag_time_key(self):
+        return get_next_slot_boundary(timezone.now()).isoformat()
+
+
+class BaseTimeSlotListAPIView(
+    StreamingListMixin, TimeSlotRowsMixin, VersionETagMixin, generics.ListAPIView
+):
+    """
+    기구 하나의 예약된 슬롯 목록 조회
+
+    date 로 하루를 조회하거나, date_from/date_to 로 여러 날을 한 번에 조회합니다.
+    여러 날 조회 시에는 한 번의 범위 쿼리 결과를 날짜별로 묶어 반환합니다.
+    하루 조회 결과는 bookings.response_cache 에 리소스 버전과 함께 보관하고,
+    캐시 사용 결과를 X-Cache 헤더로 알려줍니다.
+    하루 조회는 cursor/limit 로 (start_time, pk) keyset 페이지네이션을 할 수 있습니다.
+    여러 날 조회는 MAX_DATE_RANGE_DAYS 로 크기가 제한되어 페이지를 나누지 않습니다.
+    하위 클래스에서 model_class, machine_model_class, machine_fk_field,
+    serializer_class 를 지정합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TimeSlotKeysetPagination
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "date",
+                openapi.IN_QUERY,
+                description="조회할 날짜 (YYYY-MM-DD). date_from/date_to 를 사용하지 않을 때 필수",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            ),
+            openapi.Parameter(
+                "date_from",
+                openapi.IN_QUERY,
+                description=f"조회 시작 날짜 (YYYY-MM-DD). 최대 {MAX_DATE_RANGE_DAYS}일",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            ),
+            openapi.Parameter(
+                "date_to",
+                openapi.IN_QUERY,
+                description="조회 종료 날짜 (YYYY-MM-DD, 포함)",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                description="하루 조회에서 이전 응답 Link 헤더(rel=next)의 cursor",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description="하루 조회에서 한 페이지의 최대 슬롯 수",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+        return self.get_with_etag(super().get, request, *args, **kwargs)
+
+    def get_version_keys(self):
+        facility = get_facility_for_model(self.model_class)
+        machine_pk = self.kwargs.get("pk")
+        if self.is_date_range_request():
+            date_from, date_to = parse_date_range(
+                self.request.query_params, MAX_DATE_RANGE_DAYS
+            )
+            days = [
+                date_from + timedelta(days=offset)
+                for offset in range((date_to - date_from).days + 1)
+            ]
+        else:
+            days = [parse_query_date(self.request.query_params.get("date"))]
+        # 기구가 삭제되면 캐시된 응답 대신 404 가 나가도록 기구 목록 버전도 포함합니다.
+        return [
+            get_machines_version_key(facility),
+            *(get_machine_day_version_key(facility, machine_pk, day) for day in days),
+        ]
+
+    def is_date_range_request(self):
+        query_params = self.request.query_params
+        return "date_from" in query_params or "date_to" in query_params
+
+    def get_time_range(self):
+        query_params = self.request.query_params
+        if self.is_date_range_request():
+            date_from, date_to = parse_date_range(query_params, MAX_DATE_RANGE_DAYS)
+            return get_day_range(date_from)[0], get_day_range(date_to)[1]
+        return get_day_range(parse_query_date(query_params.get("date")))
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return self.model_class.objects.none()
+
+        get_object_or_404(self.machine_model_class, pk=self.kwargs.get("pk"))
+        return self.get_timeslot_queryset()
+
+    def get_timeslot_queryset(self):
+        """
+        기구가 있는지 확인하지 않고 요청한 기간의 예약된 슬롯 쿼리셋을 만듭니다.
+        """
+        start_dt, end_dt = self.get_time_range()
+        return self.model_class.objects.filter(
+            **{f"{self.machine_fk_field}__pk": self.kwargs.get("pk")},
+            start_time__gte=start_dt,
+            start_time__lt=end_dt,
+            user__isnull=False,
+        ).order_by("start_time")
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_date_range_request():
+            return self.list_day(request)
+
+        timeslots = self.fetch_timeslots(self.get_queryset()).iterator()
+        date_from, date_to = parse_date_range(request.query_params, MAX_DATE_RANGE_DAYS)
+        return self.stream_list(self.group_by_day(timeslots, date_from, date_to))
+
+    def list_day(self, request):
+        query_params = request.query_params
+        if "cursor" in query_params or "limit" in query_params:
+            page = self.paginate_queryset(self.fetch_timeslots(self.get_queryset()))
+            return self.get_paginated_response(self.serialize_timeslots(page))
+        if self.resource_versions is None:
+            return super().list(request)
+
+        # 하루치 슬롯 수(SLOTS_PER_DAY)는 LIST_PAGE_SIZE 보다 작아 한 페이지로 끝나므로
+        # 페이지 파라미터가 없는 요청은 하루 전체를 캐시에서 응답합니다.
+        query_date = parse_query_date(request.query_params.get("date"))
+        data, data_versions, result = timeslot_list_cache.get_or_build(
+            get_facility_for_model(self.model_class),
+            self.kwargs.get("pk"),
+            query_date,
+            tuple(self.resource_versions.values()),
+            self.build_day_data,
+        )
+        response = Response(data)
+        response["X-Cache"] = result.upper()
+        if result == STALE:
+            # 오래된 데이터에는 그 데이터의 버전으로 만든 ETag 를 붙여,
+            # 클라이언트가 그 ETag 로 다시 요청하면 304 대신 새 데이터를 받게 합니다.
+            self.resource_versions = dict(zip(self.resource_versions, data_versions))
+            response["ETag"] = self.make_etag()
+        return response
+
+    def build_day_data(self):
+        return list(self.serialize_timeslots(self.fetch_timeslots(self.get_queryset())))
+
+    def group_by_day(self, timeslots, date_from, date_to):
+        """
+        fetch_timeslots 로 가져와 start_time 순으로 정렬된 슬롯을 날짜별로 묶습니다.
+        예약이 없는 날도 포함합니다.
+        """
+        timeslots_by_day = groupby(
+            timeslots,
+            key=lambda timeslot: timezone.localtime(
+                self.get_timeslot_start_time(timeslot)
+            ).date(),
+        )
+        next_day_timeslots = next(timeslots_by_day, None)
+        for offset in range((date_to - date_from).days + 1):
+            day = date_from + timedelta(days=offset)
+            day_timeslots = []
+            if next_day_timeslots is not None and next_day_timeslots[0] == day:
+                day_timeslots = list(next_day_timeslots[1])
+                next_day_timeslots = next(timeslots_by_day, None)
+            yield {
+                "date": day.isoformat(),
+                "timeslots": self.serialize_timeslots(day_timeslots),
+            }
+
+
+class BaseTimeSlotGridAPIView(
+    StreamingListMixin, TimeSlotRowsMixin, VersionETagMixin, generics.GenericAPIView
+):
+    """
+    한 시설의 모든 기구에 대한 하루치 예약 슬롯을 한 번의 범위 쿼리로 조회
+
+    하위 클래스에서 model_class, machine_fk_field, serializer_class 를 지정합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = None
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "date",
+                openapi.IN_QUERY,
+                description="조회할 날짜 (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+                required=True,
+            )
+        ],
+        operation_description="시설의 모든 기구에 대한 하루치 예약 슬롯을 기구별로 묶어 반환합니다.",
+    )
+    def get(self, request, *args, **kwargs):
+        return self.get_with_etag(self.list, request, *args, **kwargs)
+
+    def get_version_keys(self):
+        query_date = parse_query_date(self.request.query_params.get("date"))
+        return [
+            get_facility_day_version_key(
+                get_facility_for_model(self.model_class), query_date
+            )
+        ]
+
+    def list(self, request, *args, **kwargs):
+        timeslots = self.fetch_timeslots(self.get_queryset())
+        return self.stream_list(self.group_by_machine(timeslots))
+
+    def group_by_machine(self, timeslots):
+        """
+        기구, start_time 순으로 정렬된 슬롯을 기구별로 묶습니다. 예약이 없는 기구는 포함하지 않습니다.
+        """
+        for machine_pk, machine_timeslots in groupby(
+            timeslots.iterator(), key=self.get_timeslot_machine_pk
+        ):
+            yield {
+                self.machine_fk_field: machine_pk,
+                "timeslots": self.serialize_timeslots(list(machine_timeslots)),
+            }
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):
+            return self.model_class.objects.none()
+
+        query_date = parse_query_date(self.request.query_params.get("date"))
+        start_dt, end_dt = get_day_range(query_date)
+
+        return self.model_class.objects.filter(
+            start_time__gte=start_dt,
+            start_time__lt=end_dt,
+            user__isnull=False,
+        ).order_by(f"{self.machine_fk_field}_id", "start_time")
+
+
+class BaseAvailabilityAPIView(VersionETagMixin, views.APIView):
+    """
+    한 시설의 하루치 예약 현황을 메모리 인덱스에서 비트마스크로 조회
+
+    하위 클래스에서 model_class, machine_fk_field 를 지정합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = LIST_RENDERER_CLASSES
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "date",
+                openapi.IN_QUERY,
+                description="조회할 날짜 (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+                required=True,
+            )
+        ],
+        operation_description=f"booked_mask 의 n번째 비트는 00:00 부터 n번째 {SLOT_DURATION_MINUTES}분 슬롯이 예약되었음을 뜻합니다. "
+        "예약이 없는 기구는 목록에 포함되지 않습니다.",
+    )
+    def get(self, request, *args, **kwargs):
+        return self.get_with_etag(self.list, request, *args, **kwargs)
+
+    def get_version_keys(self):
+        query_date = parse_query_date(self.request.query_params.get("date"))
+        return [
+            get_facility_day_version_key(
+                get_facility_for_model(self.model_class), query_date
+            )
+        ]
+
+    def list(self, request, *args, **kwargs):
+        query_date = parse_query_date(request.query_params.get("date"))
+        facility = get_facility_for_model(self.model_class)
+        # ETag 를 만든 버전을 넘겨, 다른 워커의 예약으로 버전이 올랐으면 인덱스를 다시 읽습니다.
+        masks = availability_index.get_day_masks(
+            facility,
+            query_date,
+            (self.resource_versions or {}).get(
+                get_facility_day_version_key(facility, query_date)
+            ),
+        )
+        return Response(
+            {
+                "date": query_date.isoformat(),
+                "slot_duration_minutes": SLOT_DURATION_MINUTES,
+                "machines": [
+                    {self.machine_fk_field: machine_pk, "booked_mask": mask}
+                    for machine_pk, mask in sorted(masks.items())
+                ],
+            }
+        )
+
+
+class OccupancyNowAPIView(views.APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="모든 시설의 현재 사용 현황",
+        operation_description="런닝머신, 사이클, 탁구대, 아케이드 머신, 인덕션의 현재 사용 여부를 한 번에 반환합니다. "
+        "결과는 다음 슬롯 경계(매 시 정각과 30분)까지 서버 메모리에 보관됩니다.",
+    )
+    def get(self, request):
+        return Response(occupancy_snapshot.get())
+
+
+class ResponseCacheStatsAPIView(views.APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_summary="응답 캐시 적중 통계",
+        operation_description="하루치 슬롯 목록 응답 캐시의 적중(hit), 오래된 데이터 적중(stale), 실패(miss) 횟수와 적중률을 반환합니다. "
+        "횟수는 서버 프로세스마다 따로 셉니다.",
+    )
+    def get(self, request):
+        return Response({"timeslot_list": timeslot_list_cache.get_stats()})
+
+
+class ChangeListAPIView(views.APIView):
+    """
+    since cursor 이후의 슬롯/기구 변경 목록 (SSE 연결을 유지하기 어려운 클라이언트용)
+
+    since 없이 요청하면 변경 없이 현재 cursor 만 반환합니다. 클라이언트는 목록 전체를 받은 뒤
+    이 cursor 부터 변경만 받아 반영합니다. compact_slot_events 로 지워진 구간의 cursor 이면
+    410 으로 응답하며, 클라이언트는 목록 전체를 다시 받아야 합니다.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = LIST_RENDERER_CLASSES
+
+    @swagger_auto_schema(
+        operation_summary="슬롯/기구 변경 목록",
+        operation_description="since 이후에 예약, 예약 해제, 관리자 변경으로 바뀐 내용을 오래된 순으로 반환합니다. "
+        "event_type 이 slots 이면 data 에 기구, 예약 여부(booked), 슬롯 시작 시간 목록이, "
+        "machines 이면 기구의 사용 가능 여부 목록과 삭제된 기구 pk 목록이 들어 있습니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "since",
+                openapi.IN_QUERY,
+                description="이전 응답의 next_cursor. 생략하면 현재 cursor 만 반환합니다",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "facility",
+                openapi.IN_QUERY,
+                description="이 시설의 변경만 반환합니다",
+                type=openapi.TYPE_STRING,
+                enum=list(FACILITIES),
+            ),
+            openapi.Parameter(
+                "date",
+                openapi.IN_QUERY,
+                description="이 날짜의 슬롯 변경과 날짜와 상관없는 기구 변경만 반환합니다 (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATE,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"한 번에 반환할 최대 변경 수 (기본값 {settings.LIST_PAGE_SIZE})",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: ChangeListResponseSerializer(),
+            status.HTTP_410_GONE: openapi.Response(
+                description="since 이후의 변경 일부가 지워져 목록 전체를 다시 받아야 합니다"
+            ),
+        },
+    )
+    def get(self, request):
+        query_params = request.query_params
+        limit = KeysetPagination().get_limit(request)
+        events = self.filter_events(SlotEvent.objects.all())
+
+        since = query_params.get("since")
+        if since is None:
+            latest_id = (
+                SlotEvent.objects.order_by("-pk").values_list("pk", flat=True).first()
+            )
+            return Response(
+                {
+                    "changes": [],
+                    "next_cursor": encode_cursor(
+                        [max(latest_id or 0, get_compacted_event_id())]
+                    ),
+                    "has_more": False,
+                }
+            )
+
+        since_id = self.decode_since(since)
+        if since_id < get_compacted_event_id():
+            return Response(
+                {"detail": "변경 기록이 지워졌습니다. 목록 전체를 다시 받아주세요."},
+                status=status.HTTP_410_GONE,
+            )
+
+        # 다음 변경이 더 있는지 알기 위해 하나 더 가져옵니다.
+        changes = list(events.filter(pk__gt=since_id).order_by("pk")[: limit + 1])
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        return Response(
+            {
+                "changes": ChangeSerializer(changes, many=True).data,
+                "next_cursor": encode_cursor([changes[-1].pk if changes else since_id]),
+                "has_more": has_more,
+            }
+        )
+
+    def filter_events(self, events):
+        query_params = self.request.query_params
+        facility_key = query_params.get("facility")
+        if facility_key is not None:
+            if facility_key not in FACILITIES:
+                raise ValidationError("facility 값이 잘못되었습니다.")
+            events = events.filter(facility=facility_key)
+        if "date" in query_params:
+            query_date = parse_query_date(query_params.get("date"))
+            events = events.filter(Q(date=query_date) | Q(date__isnull=True))
+        return events
+
+    def decode_since(self, since):
+        values = decode_cursor(since)
+        if len(values) != 1 or type(values[0]) is not int:
+            raise ValidationError(INVALID_CURSOR_MESSAGE)
+        return values[0]
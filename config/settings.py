@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -35,6 +36,7 @@ CUSTOM_APPS = [
     "kitchen.apps.KitchenConfig",
     "lounge.apps.LoungeConfig",
     "gym.apps.GymConfig",
+    "bookings.apps.BookingsConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -97,6 +99,27 @@ DATABASES = {
     }
 }
 
+# SQLite 동시성 모드 (운영용, DORMBOOK_SQLITE_CONCURRENCY_MODE=1 로 켭니다)
+# - 연결을 열 때 WAL 저널을 켜서 읽기와 쓰기가 서로를 막지 않게 합니다.
+# - busy timeout 동안 다른 연결의 쓰기 잠금이 풀리기를 기다립니다.
+# - 트랜잭션을 BEGIN IMMEDIATE 로 시작해 쓰기 잠금을 트랜잭션 시작 시점에 잡습니다.
+#   읽기 잠금을 쓰기 잠금으로 올리다 실패하는 경우가 없어져 busy timeout 이 그대로 적용됩니다.
+#   Django 는 transaction_mode 를 연결의 모든 atomic 블록에 적용하므로, 관리자 화면의
+#   GET 처럼 읽기만 하는 atomic 블록도 쓰기 잠금을 잡아 그동안 다른 쓰기를 기다리게 합니다.
+SQLITE_CONCURRENCY_MODE = os.environ.get("DORMBOOK_SQLITE_CONCURRENCY_MODE") == "1"
+
+SQLITE_BUSY_TIMEOUT_SECONDS = 5
+# 예약 트랜잭션은 재시도(BOOKING_LOCK_RETRY_*)가 기다림을 맡으므로 시도마다 이만큼만 기다립니다.
+# 경합 시 409 까지 최대 약 시도 수 x 이 값 + 백오프 (기본값으로 1초 안쪽) 가 걸립니다.
+BOOKING_SQLITE_BUSY_TIMEOUT_SECONDS = 0.2
+
+if SQLITE_CONCURRENCY_MODE:
+    DATABASES["default"]["OPTIONS"] = {
+        "init_command": "PRAGMA journal_mode=WAL;PRAGMA synchronous=NORMAL",
+        "timeout": SQLITE_BUSY_TIMEOUT_SECONDS,
+        "transaction_mode": "IMMEDIATE",
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -144,12 +167,39 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "bookings.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "users.authentication.CachedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
 }
 
+# 토큰 인증 결과 캐시 (users.authentication.CachedTokenAuthentication)
+# 프로세스마다 최대 AUTH_TOKEN_CACHE_MAX_SIZE 개의 토큰을 TTL 동안 보관합니다.
+# 다른 워커에서 로그아웃/비밀번호 변경이 일어나면 최대 TTL 동안 이전 결과가 쓰일 수 있습니다.
+AUTH_TOKEN_CACHE_MAX_SIZE = 10000
+AUTH_TOKEN_CACHE_TTL_SECONDS = 60
+
+# 워커끼리 토큰 캐시를 공유할 CACHES 별칭. None 이면 프로세스 안 캐시만 사용합니다.
+AUTH_TOKEN_SHARED_CACHE_ALIAS = None
+
+# 토큰 전용 로그인. True 이면 로그인 시 세션을 만들지 않고 토큰만 발급합니다.
+LOGIN_TOKEN_ONLY = False
+
+# 토큰 전용 로그인에서 last_login 을 갱신하는 방식 ("update", "batch", "skip")
+LOGIN_LAST_LOGIN_UPDATE = "batch"
+
+# "batch" 방식에서 모아 둔 last_login 을 저장하는 간격(초)
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = 60
+
+# 비동기 로그인/비밀번호 변경 뷰(users.async_views)의 비밀번호 해시 전용 스레드 수와
+# 대기할 수 있는 최대 해시 작업 수. 넘치면 503 으로 응답합니다.
+PASSWORD_HASHING_WORKERS = 2
+PASSWORD_HASHING_MAX_PENDING = 64
+
 CORS_ORIGIN_WHITELIST = [
     "http://127.0.0.1:3000",
     "http://localhost:3000",
@@ -160,3 +210,53 @@ CORS_ALLOW_CREDENTIALS = True
 CSRF_TRUSTED_ORIGINS = [
     "https://nqw246l5-3000.asse.devtunnels.ms",
 ]
+
+# Bookings
+
+# 현재 사용 현황 스냅샷을 다른 워커의 변경과 상관없이 재사용할 수 있는 최대 시간(초)
+OCCUPANCY_SNAPSHOT_MAX_AGE_SECONDS = 30
+
+# 기구별 예약 비트마스크 인덱스를 DB에서 다시 읽기 전까지 사용하는 시간(초)
+AVAILABILITY_INDEX_TTL_SECONDS = 60
+
+# 예약 트랜잭션이 DB 잠금 경합으로 실패했을 때 시도하는 최대 횟수와 첫 재시도 전 최대 대기 시간(초)
+# 대기 시간은 시도마다 두 배가 되고, 0 부터 그 값 사이에서 무작위로 고릅니다.
+BOOKING_LOCK_RETRY_ATTEMPTS = 3
+BOOKING_LOCK_RETRY_BASE_DELAY_SECONDS = 0.05
+
+# 하루치 슬롯 목록 응답 캐시(bookings.response_cache)에 쓸 CACHES 별칭과 보관 시간(초).
+# 항목은 리소스 버전이 바뀌면 다시 만들고, 다시 만드는 동안 다른 요청에는 이전 응답을 줍니다.
+# 다시 만드는 요청이 실패해도 잠금이 풀리도록 잠금에도 만료 시간(초)을 둡니다.
+TIMESLOT_LIST_CACHE_ALIAS = "default"
+TIMESLOT_LIST_CACHE_TIMEOUT_SECONDS = 300
+TIMESLOT_LIST_CACHE_REFRESH_LOCK_SECONDS = 5
+
+# archive_timeslots 명령이 오늘보다 이 날짜 수 이전에 시작한 슬롯을 보관 테이블로 옮깁니다.
+# 한 트랜잭션에서 옮기는 슬롯 수를 제한해 예약 요청이 쓰기 잠금을 오래 기다리지 않게 합니다.
+TIMESLOT_ARCHIVE_AFTER_DAYS = 28
+TIMESLOT_ARCHIVE_BATCH_SIZE = 500
+
+# 슬롯 목록/그리드/내 예약 목록을 모델 인스턴스와 ModelSerializer 대신
+# 필요한 열만 담은 튜플로 직렬화합니다(bookings.fast_serializers). 응답 JSON 은 같습니다.
+TIMESLOT_LIST_FAST_SERIALIZATION = True
+
+# 여러 날 슬롯 목록과 슬롯 그리드를 JSON 으로 응답할 때 항목을 하나씩 인코딩해 스트리밍합니다.
+LIST_RESPONSE_STREAMING = True
+# ASGI 에서 스트리밍할 때 스레드를 한 번 오갈 때마다 인코딩해 내보내는 항목 수
+LIST_RESPONSE_STREAMING_ASGI_BATCH_SIZE = 100
+
+# 기구 목록/슬롯 목록의 keyset 페이지네이션(bookings.pagination) 기본/최대 페이지 크기
+LIST_PAGE_SIZE = 100
+LIST_MAX_PAGE_SIZE = 500
+
+# 슬롯 변경 이벤트 스트림(bookings.events)
+# 연결마다 쌓아 둘 수 있는 최대 이벤트 수. 넘치면 그 연결을 끊습니다.
+SLOT_EVENT_QUEUE_SIZE = 100
+# 이벤트가 없을 때 연결 유지용 주석 줄을 보내는 간격(초)
+SLOT_EVENT_KEEPALIVE_SECONDS = 15
+# 다른 워커가 저장한 이벤트를 읽는 간격(초). None 이면 읽지 않습니다(워커가 하나일 때).
+SLOT_EVENT_RELAY_INTERVAL_SECONDS = 1
+# compact_slot_events 명령이 이 날짜 수보다 오래된 이벤트를 한 트랜잭션에 배치 크기만큼씩 지웁니다.
+# 그 전까지는 다시 연결한 SSE 클라이언트와 변경 목록(/changes/)을 요청한 클라이언트가 이어 받을 수 있습니다.
+SLOT_EVENT_RETENTION_DAYS = 7
+SLOT_EVENT_COMPACT_BATCH_SIZE = 1000
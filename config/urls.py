@@ -40,6 +40,7 @@ urlpatterns = [
     path("api/v1/kitchen/", include("kitchen.urls")),
     path("api/v1/lounge/", include("lounge.urls")),
     path("api/v1/gym/", include("gym.urls")),
+    path("api/v1/", include("bookings.urls")),
     path(
         "swagger.<format>/", schema_view.without_ui(cache_timeout=0), name="schema-json"
     ),
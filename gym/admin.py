@@ -1,24 +1,29 @@
 from django.contrib import admin
 from django.http import HttpRequest
+from bookings.admin_actions import (
+    DateRangeActionForm,
+    MachineChangeMixin,
+    ReleasingDeleteMixin,
+    disable_and_release_date_range,
+    purge_empty_timeslots,
+    release_selected_timeslots,
+    toggle_availability,
+)
 from .models import Treadmill, TreadmillTimeSlot, Cycle, CycleTimeSlot
 
 
-@admin.action(description="선택된 항목의 사용 가능 여부 반전")
-def toggle_availability(modeladmin, request, queryset):
-    for obj in queryset:
-        obj.is_available = not obj.is_available
-        obj.save()
-
-
-class MachineAdmin(admin.ModelAdmin):
-    actions = [toggle_availability]
+class MachineAdmin(MachineChangeMixin, admin.ModelAdmin):
+    action_form = DateRangeActionForm
+    actions = [toggle_availability, disable_and_release_date_range]
     list_display = (
         "pk",
         "is_available",
     )
 
 
-class TimeSlotAdmin(admin.ModelAdmin):
+class TimeSlotAdmin(ReleasingDeleteMixin, admin.ModelAdmin):
+    actions = [release_selected_timeslots, purge_empty_timeslots]
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
@@ -30,6 +35,7 @@ class TimeSlotAdmin(admin.ModelAdmin):
         "start_time",
         "end_time",
         "booked_at",
+        "booking_action",
     )
     search_fields = ("user__student_id_number",)
 
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 12:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gym", "0002_remove_cycle_name_remove_treadmill_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cycletimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["start_time"],
+                name="cycle_booked_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="treadmilltimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["start_time"],
+                name="treadmill_booked_start_idx",
+            ),
+        ),
+    ]
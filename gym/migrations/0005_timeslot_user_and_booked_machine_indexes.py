@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-18 12:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0002_backfill_booking_actions"),
+        ("gym", "0004_cycletimeslot_booking_action_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cycletimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["cycle", "start_time"],
+                name="cycle_booked_machine_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="cycletimeslot",
+            index=models.Index(
+                fields=["user", "start_time", "booked_at"], name="cycle_user_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="treadmilltimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["treadmill", "start_time"],
+                name="treadmill_booked_machine_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="treadmilltimeslot",
+            index=models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="treadmill_user_start_idx",
+            ),
+        ),
+    ]
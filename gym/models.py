@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils import timezone
 from users.models import User
+from bookings.querysets import MachineQuerySet
 
 
 class Machine(models.Model):
@@ -13,6 +14,8 @@ class Machine(models.Model):
         default=True,
     )
 
+    objects = MachineQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
@@ -35,6 +38,13 @@ class TimeSlot(models.Model):
     start_time = models.DateTimeField("시작 시간")
     end_time = models.DateTimeField("종료 시간")
     booked_at = models.DateTimeField("예약 확정 시간", null=True, blank=True)
+    booking_action = models.ForeignKey(
+        "bookings.BookingAction",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="예약 행동",
+    )
 
     class Meta:
         abstract = True
@@ -42,12 +52,16 @@ class TimeSlot(models.Model):
 
     @property
     def is_booked(self) -> bool:
-        return self.user is not None
+        return self.user_id is not None
 
 
 class Treadmill(Machine):
+    timeslot_relation = "treadmilltimeslot"
+
     @property
     def is_using(self) -> bool:
+        if hasattr(self, "using_now"):
+            return self.using_now
         now = timezone.now()
         return TreadmillTimeSlot.objects.filter(
             treadmill=self, start_time__lte=now, end_time__gt=now, user__isnull=False
@@ -63,6 +77,22 @@ class TreadmillTimeSlot(TimeSlot):
 
     class Meta(TimeSlot.Meta):
         unique_together = ["treadmill", "start_time"]
+        indexes = [
+            models.Index(
+                fields=["start_time"],
+                condition=models.Q(user__isnull=False),
+                name="treadmill_booked_start_idx",
+            ),
+            models.Index(
+                fields=["treadmill", "start_time"],
+                condition=models.Q(user__isnull=False),
+                name="treadmill_booked_machine_idx",
+            ),
+            models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="treadmill_user_start_idx",
+            ),
+        ]
 
     def __str__(self):
         status = "Booked" if self.user else "Available"
@@ -78,8 +108,12 @@ class TreadmillTimeSlot(TimeSlot):
 
 
 class Cycle(Machine):
+    timeslot_relation = "cycletimeslot"
+
     @property
     def is_using(self) -> bool:
+        if hasattr(self, "using_now"):
+            return self.using_now
         now = timezone.now()
         return CycleTimeSlot.objects.filter(
             cycle=self,
@@ -98,6 +132,22 @@ class CycleTimeSlot(TimeSlot):
 
     class Meta(TimeSlot.Meta):
         unique_together = ["cycle", "start_time"]
+        indexes = [
+            models.Index(
+                fields=["start_time"],
+                condition=models.Q(user__isnull=False),
+                name="cycle_booked_start_idx",
+            ),
+            models.Index(
+                fields=["cycle", "start_time"],
+                condition=models.Q(user__isnull=False),
+                name="cycle_booked_machine_idx",
+            ),
+            models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="cycle_user_start_idx",
+            ),
+        ]
 
     def __str__(self):
         status = "Booked" if self.user else "Available"
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from .models import Treadmill, TreadmillTimeSlot, Cycle, CycleTimeSlot
 from django.utils import timezone
-from datetime import datetime, timedelta
-
+from datetime import timedelta
+from bookings.facilities import get_facility_for_model
+from bookings.models import BookingAction
 
 MAX_BOOKING_ACTIONS_PER_DAY_GYM = 2
 SLOT_DURATION_MINUTES_GYM = 30
@@ -71,22 +72,11 @@ class BaseBookTimeSlotSerializer(serializers.Serializer):
         request_user = request.user
         start_time_of_slot_being_booked = data["start_time"]
 
-        query_date_for_slot = start_time_of_slot_being_booked.date()
-        day_start = timezone.make_aware(
-            datetime.combine(query_date_for_slot, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        day_end = day_start + timedelta(days=1)
-
-        user_actions_count_for_slot_day = (
-            self.timeslot_model.objects.filter(
-                user=request_user,
-                start_time__gte=day_start,
-                start_time__lt=day_end,
-            )
-            .values("booked_at")
-            .distinct()
-            .count()
+        query_date_for_slot = timezone.localtime(start_time_of_slot_being_booked).date()
+        user_actions_count_for_slot_day = BookingAction.objects.get_count(
+            request_user,
+            get_facility_for_model(self.timeslot_model).key,
+            query_date_for_slot,
         )
 
         if user_actions_count_for_slot_day >= MAX_BOOKING_ACTIONS_PER_DAY_GYM:
@@ -1,3 +1,161 @@
+import json
+from datetime import timedelta
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from bookings.availability import availability_index
+from bookings.utils import get_day_range
+from .models import Treadmill, TreadmillTimeSlot
+
+
+class TreadmillListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.treadmills = [Treadmill.objects.create() for _ in range(5)]
+        now = timezone.now()
+        TreadmillTimeSlot.objects.create(
+            treadmill=cls.treadmills[0],
+            user=cls.user,
+            start_time=now - timedelta(minutes=10),
+            end_time=now + timedelta(minutes=20),
+            booked_at=now,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_runs_single_query(self):
+        # ETag 버전 조회 1번 + 목록 쿼리 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("treadmill-list"))
+        self.assertEqual(response.status_code, 200)
+        using = {item["pk"]: item["is_using"] for item in response.data}
+        self.assertTrue(using[self.treadmills[0].pk])
+        self.assertFalse(using[self.treadmills[1].pk])
+
+    def test_is_using_without_annotation(self):
+        self.assertTrue(self.treadmills[0].is_using)
+        self.assertFalse(self.treadmills[1].is_using)
+
+
+class TreadmillTimeSlotGridTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.treadmills = [Treadmill.objects.create() for _ in range(3)]
+        cls.day_start, _ = get_day_range(timezone.localdate() + timedelta(days=1))
+        for treadmill in cls.treadmills[:2]:
+            for i in range(2):
+                start_time = cls.day_start + timedelta(hours=9, minutes=30 * i)
+                TreadmillTimeSlot.objects.create(
+                    treadmill=treadmill,
+                    user=cls.user,
+                    start_time=start_time,
+                    end_time=start_time + timedelta(minutes=30),
+                    booked_at=timezone.now(),
+                )
+        TreadmillTimeSlot.objects.create(
+            treadmill=cls.treadmills[2],
+            start_time=cls.day_start,
+            end_time=cls.day_start + timedelta(minutes=30),
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_grid_groups_booked_slots_by_machine_in_one_query(self):
+        # ETag 버전 조회 1번 + 목록 쿼리 1번 (목록 쿼리는 스트리밍 중에 실행됩니다)
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse("treadmill-timeslot-grid"),
+                {"date": self.day_start.date().isoformat()},
+            )
+            grid = json.loads(response.getvalue())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row["treadmill"] for row in grid],
+            [self.treadmills[0].pk, self.treadmills[1].pk],
+        )
+        self.assertEqual(
+            [len(row["timeslots"]) for row in grid],
+            [2, 2],
+        )
+
+    def test_grid_requires_date(self):
+        response = self.client.get(reverse("treadmill-timeslot-grid"))
+        self.assertEqual(response.status_code, 400)
+
+
+class TreadmillTimeSlotBookTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.other_user = User.objects.create_user("2024000002", "password")
+        cls.treadmill = Treadmill.objects.create()
+        day_start, _ = get_day_range(timezone.localdate() + timedelta(days=1))
+        cls.start_time = day_start + timedelta(hours=10)
+
+    def setUp(self):
+        availability_index.invalidate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("treadmill-timeslot-book", args=[self.treadmill.pk])
+
+    def test_book_two_slots(self):
+        response = self.client.post(
+            self.url,
+            {"start_time": self.start_time.isoformat(), "duration_minutes": 60},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(
+            TreadmillTimeSlot.objects.filter(user=self.user).count(),
+            2,
+        )
+
+    def test_slot_booked_by_other_user_conflicts(self):
+        TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmill,
+            user=self.other_user,
+            start_time=self.start_time + timedelta(minutes=30),
+            end_time=self.start_time + timedelta(minutes=60),
+            booked_at=timezone.now(),
+        )
+        response = self.client.post(
+            self.url,
+            {"start_time": self.start_time.isoformat(), "duration_minutes": 60},
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(TreadmillTimeSlot.objects.filter(user=self.user).exists())
+
+    def test_existing_empty_slot_is_claimed(self):
+        TreadmillTimeSlot.objects.create(
+            treadmill=self.treadmill,
+            start_time=self.start_time,
+            end_time=self.start_time + timedelta(minutes=30),
+        )
+        response = self.client.post(
+            self.url, {"start_time": self.start_time.isoformat()}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["is_booked"], True)
 
-# Create your tests here.
+    def test_daily_booking_action_limit(self):
+        for hours in [0, 2]:
+            response = self.client.post(
+                self.url,
+                {"start_time": (self.start_time + timedelta(hours=hours)).isoformat()},
+            )
+            self.assertEqual(response.status_code, 201)
+        response = self.client.post(
+            self.url,
+            {"start_time": (self.start_time + timedelta(hours=4)).isoformat()},
+        )
+        self.assertEqual(response.status_code, 400)
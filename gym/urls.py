@@ -1,10 +1,20 @@
 from django.urls import path
+from bookings.async_views import (
+    AsyncMachineListView,
+    AsyncTimeSlotListView,
+    SlotEventStreamView,
+)
+from .models import CycleTimeSlot, TreadmillTimeSlot
 from .views import (
     TreadmillListAPIView,
     TreadmillTimeSlotListAPIView,
+    TreadmillTimeSlotGridAPIView,
+    TreadmillAvailabilityAPIView,
     TreadmillTimeSlotBookAPIView,
     CycleListAPIView,
     CycleTimeSlotListAPIView,
+    CycleTimeSlotGridAPIView,
+    CycleAvailabilityAPIView,
     CycleTimeSlotBookAPIView,
 )
 
@@ -14,6 +24,16 @@ urlpatterns = [
         TreadmillListAPIView.as_view(),
         name="treadmill-list",
     ),
+    path(
+        "treadmills/timeslots/",
+        TreadmillTimeSlotGridAPIView.as_view(),
+        name="treadmill-timeslot-grid",
+    ),
+    path(
+        "treadmills/availability/",
+        TreadmillAvailabilityAPIView.as_view(),
+        name="treadmill-availability",
+    ),
     path(
         "treadmills/<int:pk>/timeslots/",
         TreadmillTimeSlotListAPIView.as_view(),
@@ -29,6 +49,16 @@ urlpatterns = [
         CycleListAPIView.as_view(),
         name="cycle-list",
     ),
+    path(
+        "cycles/timeslots/",
+        CycleTimeSlotGridAPIView.as_view(),
+        name="cycle-timeslot-grid",
+    ),
+    path(
+        "cycles/availability/",
+        CycleAvailabilityAPIView.as_view(),
+        name="cycle-availability",
+    ),
     path(
         "cycles/<int:pk>/timeslots/",
         CycleTimeSlotListAPIView.as_view(),
@@ -39,4 +69,34 @@ urlpatterns = [
         CycleTimeSlotBookAPIView.as_view(),
         name="cycle-timeslot-book",
     ),
+    path(
+        "async/treadmills/",
+        AsyncMachineListView.as_view(sync_view_class=TreadmillListAPIView),
+        name="async-treadmill-list",
+    ),
+    path(
+        "async/treadmills/<int:pk>/timeslots/",
+        AsyncTimeSlotListView.as_view(sync_view_class=TreadmillTimeSlotListAPIView),
+        name="async-treadmill-timeslot-list",
+    ),
+    path(
+        "async/cycles/",
+        AsyncMachineListView.as_view(sync_view_class=CycleListAPIView),
+        name="async-cycle-list",
+    ),
+    path(
+        "async/cycles/<int:pk>/timeslots/",
+        AsyncTimeSlotListView.as_view(sync_view_class=CycleTimeSlotListAPIView),
+        name="async-cycle-timeslot-list",
+    ),
+    path(
+        "treadmills/events/",
+        SlotEventStreamView.as_view(model_class=TreadmillTimeSlot),
+        name="treadmill-events",
+    ),
+    path(
+        "cycles/events/",
+        SlotEventStreamView.as_view(model_class=CycleTimeSlot),
+        name="cycle-events",
+    ),
 ]
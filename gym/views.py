@@ -1,13 +1,15 @@
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
-from django.db import transaction, IntegrityError
 from rest_framework import permissions, status, generics
 from rest_framework.response import Response
-from rest_framework.exceptions import ValidationError
 from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
-from datetime import datetime, timedelta
 
+from bookings.engine import book_timeslots, BookingQuotaExceededError
+from bookings.views import (
+    BaseMachineListAPIView,
+    BaseTimeSlotListAPIView,
+    BaseTimeSlotGridAPIView,
+    BaseAvailabilityAPIView,
+)
 from .models import Treadmill, TreadmillTimeSlot, Cycle, CycleTimeSlot
 from .serializers import (
     TreadmillSerializer,
@@ -17,65 +19,10 @@ from .serializers import (
     ListCycleTimeSlotSerializer,
     BookCycleTimeSlotSerializer,
     SLOT_DURATION_MINUTES_GYM,
+    MAX_BOOKING_ACTIONS_PER_DAY_GYM,
 )
 
 
-class BaseMachineListAPIView(generics.ListAPIView):
-    permission_classes = [permissions.IsAuthenticated]
-
-
-class BaseTimeSlotListAPIView(generics.ListAPIView):
-    permission_classes = [permissions.IsAuthenticated]
-
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                "date",
-                openapi.IN_QUERY,
-                description="조회할 날짜 (YYYY-MM-DD)",
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_DATE,
-                required=True,
-            )
-        ]
-    )
-    def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
-
-    def get_queryset(self):
-        if getattr(
-            self, "swagger_fake_view", False
-        ) and not self.request.query_params.get("date"):
-            return self.model_class.objects.none()
-
-        machine_pk = self.kwargs.get("pk")
-
-        get_object_or_404(self.machine_model_class, pk=machine_pk)
-
-        date_str = self.request.query_params.get("date")
-        if not date_str:
-            raise ValidationError("날짜를 'date' 파라미터로 지정해주세요 (YYYY-MM-DD).")
-        try:
-            query_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            raise ValidationError("날짜 형식이 잘못되었습니다. (YYYY-MM-DD)")
-
-        start_dt = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time())
-        )
-        end_dt = start_dt + timedelta(days=1)
-
-        filter_kwargs = {
-            f"{self.machine_fk_field}__pk": machine_pk,
-            "start_time__gte": start_dt,
-            "start_time__lt": end_dt,
-            "user__isnull": False,
-        }
-        return self.model_class.objects.filter(**filter_kwargs).select_related(
-            "user", self.machine_fk_field
-        )
-
-
 class BaseTimeSlotBookAPIView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
     # queryset을 None 또는 빈 쿼리셋으로 설정합니다.
@@ -141,55 +88,16 @@ class BaseTimeSlotBookAPIView(generics.GenericAPIView):
         )
         num_slots_to_book = duration_minutes // SLOT_DURATION_MINUTES_GYM
 
-        booked_slot_objects = []
-        any_slot_newly_created_in_db = False
-        timestamp_for_this_booking_action = timezone.now()
-
         try:
-            with transaction.atomic():
-                for i in range(num_slots_to_book):
-                    current_slot_start_time = start_time + timedelta(
-                        minutes=i * SLOT_DURATION_MINUTES_GYM
-                    )
-                    current_slot_end_time = current_slot_start_time + timedelta(
-                        minutes=SLOT_DURATION_MINUTES_GYM
-                    )
-
-                    slot_defaults = {
-                        "end_time": current_slot_end_time,
-                        "user": request.user,
-                        "booked_at": timestamp_for_this_booking_action,
-                    }
-                    slot_filters = {
-                        self.machine_fk_field: machine_instance,
-                        "start_time": current_slot_start_time,
-                    }
-
-                    (
-                        slot,
-                        created,
-                    ) = self.model_class.objects.select_for_update().get_or_create(
-                        **slot_filters, defaults=slot_defaults
-                    )
-
-                    if created:
-                        any_slot_newly_created_in_db = True
-                        booked_slot_objects.append(slot)
-                    else:
-                        if slot.user is None:
-                            slot.user = request.user
-                            slot.booked_at = timestamp_for_this_booking_action
-                            slot.end_time = current_slot_end_time
-                            slot.save()
-                            booked_slot_objects.append(slot)
-                        elif slot.user == request.user:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 본인의 다른 예약에 포함되어 있습니다."
-                            )
-                        else:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 다른 사용자가 예약했습니다."
-                            )
+            booked_slot_objects, any_slot_newly_created_in_db = book_timeslots(
+                self.model_class,
+                machine_instance,
+                request.user,
+                start_time,
+                num_slots_to_book,
+                SLOT_DURATION_MINUTES_GYM,
+                MAX_BOOKING_ACTIONS_PER_DAY_GYM,
+            )
 
             response_serializer_class = self.list_serializer_class
             response_data = response_serializer_class(
@@ -202,15 +110,10 @@ class BaseTimeSlotBookAPIView(generics.GenericAPIView):
             )
             return Response(response_data, status=status_code)
 
+        except BookingQuotaExceededError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
-        except IntegrityError:  # 이미 IntegrityError를 import하고 있습니다.
-            return Response(
-                {
-                    "error": "데이터 저장 중 충돌이 발생했습니다. 잠시 후 다시 시도해주세요."
-                },
-                status=status.HTTP_409_CONFLICT,
-            )
         except Exception as e:
             # machine_fk_field 대신 self.machine_model_class.__name__ 등을 사용하여 로깅
             print(f"Error during {self.machine_model_class.__name__} booking: {e}")
@@ -232,6 +135,17 @@ class TreadmillTimeSlotListAPIView(BaseTimeSlotListAPIView):
     machine_fk_field = "treadmill"
 
 
+class TreadmillTimeSlotGridAPIView(BaseTimeSlotGridAPIView):
+    serializer_class = ListTreadmillTimeSlotSerializer
+    model_class = TreadmillTimeSlot
+    machine_fk_field = "treadmill"
+
+
+class TreadmillAvailabilityAPIView(BaseAvailabilityAPIView):
+    model_class = TreadmillTimeSlot
+    machine_fk_field = "treadmill"
+
+
 @swagger_auto_schema(  # 이 데코레이터는 클래스에 적용되어야 합니다.
     request_body=BookTreadmillTimeSlotSerializer,
     responses={
@@ -261,6 +175,17 @@ class CycleTimeSlotListAPIView(BaseTimeSlotListAPIView):
     machine_fk_field = "cycle"
 
 
+class CycleTimeSlotGridAPIView(BaseTimeSlotGridAPIView):
+    serializer_class = ListCycleTimeSlotSerializer
+    model_class = CycleTimeSlot
+    machine_fk_field = "cycle"
+
+
+class CycleAvailabilityAPIView(BaseAvailabilityAPIView):
+    model_class = CycleTimeSlot
+    machine_fk_field = "cycle"
+
+
 @swagger_auto_schema(  # 이 데코레이터는 클래스에 적용되어야 합니다.
     request_body=BookCycleTimeSlotSerializer,
     responses={
@@ -1,19 +1,22 @@
 from django.contrib import admin
 from django.http import HttpRequest
+from bookings.admin_actions import (
+    DateRangeActionForm,
+    MachineChangeMixin,
+    ReleasingDeleteMixin,
+    disable_and_release_date_range,
+    purge_empty_timeslots,
+    release_selected_timeslots,
+    toggle_availability,
+)
 from .models import Induction, InductionTimeSlot
 
 
-@admin.action(description="사용 가능 여부 바꾸기")
-def change_is_available(modeladmin, request, inductions):
-    for induction in inductions.all():
-        induction.is_available = not induction.is_available
-        induction.save()
-
-
 @admin.register(Induction)
-class InductionAdmin(admin.ModelAdmin):
+class InductionAdmin(MachineChangeMixin, admin.ModelAdmin):
 
-    actions = [change_is_available]
+    action_form = DateRangeActionForm
+    actions = [toggle_availability, disable_and_release_date_range]
 
     list_display = (
         "pk",
@@ -39,7 +42,9 @@ class IsBookedFilter(admin.SimpleListFilter):
 
 
 @admin.register(InductionTimeSlot)
-class InductionTimeSlotAdmin(admin.ModelAdmin):
+class InductionTimeSlotAdmin(ReleasingDeleteMixin, admin.ModelAdmin):
+    actions = [release_selected_timeslots, purge_empty_timeslots]
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
@@ -51,4 +56,5 @@ class InductionTimeSlotAdmin(admin.ModelAdmin):
         "start_time",
         "end_time",
         "booked_at",
+        "booking_action",
     )
@@ -0,0 +1,79 @@
+# Generated by Django 5.2 on 2026-10-18 12:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Induction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "is_available",
+                    models.BooleanField(default=True, verbose_name="사용 가능 여부"),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="InductionTimeSlot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("start_time", models.DateTimeField(verbose_name="시작 시간")),
+                ("end_time", models.DateTimeField(verbose_name="종료 시간")),
+                (
+                    "booked_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="예약 시간"
+                    ),
+                ),
+                (
+                    "induction",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="kitchen.induction",
+                        verbose_name="인덕션",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="예약자",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["start_time"],
+                "unique_together": {("induction", "start_time")},
+            },
+        ),
+    ]
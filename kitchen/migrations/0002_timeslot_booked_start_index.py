@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 12:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("kitchen", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inductiontimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["start_time"],
+                name="induction_booked_start_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 12:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0002_backfill_booking_actions"),
+        ("kitchen", "0003_inductiontimeslot_booking_action"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="inductiontimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["induction", "start_time"],
+                name="induction_booked_machine_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inductiontimeslot",
+            index=models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="induction_user_start_idx",
+            ),
+        ),
+    ]
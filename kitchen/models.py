@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils import timezone
 from users.models import User
+from bookings.engine import claim_timeslot
+from bookings.querysets import MachineQuerySet
 
 
 class Induction(models.Model):
@@ -9,8 +11,13 @@ class Induction(models.Model):
         default=True,
     )
 
+    objects = MachineQuerySet.as_manager()
+    timeslot_relation = "inductiontimeslot"
+
     @property
     def is_using(self) -> bool:
+        if hasattr(self, "using_now"):
+            return self.using_now
         now = timezone.now()
         return InductionTimeSlot.objects.filter(
             induction=self, start_time__lte=now, end_time__gt=now, user__isnull=False
@@ -36,10 +43,33 @@ class InductionTimeSlot(models.Model):
     start_time = models.DateTimeField("시작 시간")
     end_time = models.DateTimeField("종료 시간")
     booked_at = models.DateTimeField("예약 시간", null=True, blank=True)
+    booking_action = models.ForeignKey(
+        "bookings.BookingAction",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="예약 행동",
+    )
 
     class Meta:
         ordering = ["start_time"]
         unique_together = ["induction", "start_time"]
+        indexes = [
+            models.Index(
+                fields=["start_time"],
+                condition=models.Q(user__isnull=False),
+                name="induction_booked_start_idx",
+            ),
+            models.Index(
+                fields=["induction", "start_time"],
+                condition=models.Q(user__isnull=False),
+                name="induction_booked_machine_idx",
+            ),
+            models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="induction_user_start_idx",
+            ),
+        ]
 
     def __str__(self):
         status = "Booked" if self.user else "Available (Created)"
@@ -54,12 +84,8 @@ class InductionTimeSlot(models.Model):
             return f"InductionTimeSlot object (Incomplete)"
 
     def book(self, user):
-        if self.user:
-            raise ValueError("이미 예약된 시간입니다.")
-        self.user = user
-        self.booked_at = timezone.now()
-        self.save()
+        claim_timeslot(self, user)
 
     @property
     def is_booked(self) -> bool:
-        return self.user is not None
+        return self.user_id is not None
@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from .models import Induction, InductionTimeSlot
 from django.utils import timezone
-from datetime import datetime, timedelta
+from datetime import timedelta
+from bookings.facilities import get_facility_for_model
+from bookings.models import BookingAction
 
 MAX_BOOKING_ACTIONS_PER_DAY = 3
 SLOT_DURATION_MINUTES = 30
@@ -77,23 +79,12 @@ class BookInductionTimeSlotSerializer(serializers.Serializer):
 
         start_time = data["start_time"]
 
-        query_date = start_time.date()
+        query_date = timezone.localtime(start_time).date()
 
-        day_start = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        day_end = day_start + timedelta(days=1)
-
-        user_actions_count_today = (
-            InductionTimeSlot.objects.filter(
-                user=request_user,
-                start_time__gte=day_start,
-                start_time__lt=day_end,
-            )
-            .values("booked_at")
-            .distinct()
-            .count()
+        user_actions_count_today = BookingAction.objects.get_count(
+            request_user,
+            get_facility_for_model(InductionTimeSlot).key,
+            query_date,
         )
 
         if user_actions_count_today >= MAX_BOOKING_ACTIONS_PER_DAY:
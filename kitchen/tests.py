@@ -1,3 +1,35 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from .models import Induction, InductionTimeSlot
+
+
+class InductionListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.inductions = [Induction.objects.create() for _ in range(3)]
+        now = timezone.now()
+        InductionTimeSlot.objects.create(
+            induction=cls.inductions[2],
+            user=cls.user,
+            start_time=now - timedelta(minutes=10),
+            end_time=now + timedelta(minutes=20),
+            booked_at=now,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
 
-# Create your tests here.
+    def test_list_runs_single_query(self):
+        # ETag 버전 조회 1번 + 목록 쿼리 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("induction list"))
+        using = [item["is_using"] for item in response.data]
+        self.assertEqual(using, [False, False, True])
@@ -1,8 +1,24 @@
 from django.urls import path
+from bookings.async_views import (
+    AsyncMachineListView,
+    AsyncTimeSlotListView,
+    SlotEventStreamView,
+)
+from .models import InductionTimeSlot
 from .views import *
 
 urlpatterns = [
     path("inductions/", InductionListAPIView.as_view(), name="induction list"),
+    path(
+        "inductions/timeslots/",
+        InductionTimeSlotGridAPIView.as_view(),
+        name="induction-timeslot grid",
+    ),
+    path(
+        "inductions/availability/",
+        InductionAvailabilityAPIView.as_view(),
+        name="induction availability",
+    ),
     path(
         "inductions/<int:pk>/timeslots/",
         InductionTimeSlotListAPIView.as_view(),
@@ -13,4 +29,19 @@ urlpatterns = [
         InductionTimeSlotBookAPIView.as_view(),
         name="induction-timeslot book",
     ),
+    path(
+        "async/inductions/",
+        AsyncMachineListView.as_view(sync_view_class=InductionListAPIView),
+        name="async-induction list",
+    ),
+    path(
+        "async/inductions/<int:pk>/timeslots/",
+        AsyncTimeSlotListView.as_view(sync_view_class=InductionTimeSlotListAPIView),
+        name="async-induction-timeslot list",
+    ),
+    path(
+        "inductions/events/",
+        SlotEventStreamView.as_view(model_class=InductionTimeSlot),
+        name="induction events",
+    ),
 ]
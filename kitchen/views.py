@@ -1,70 +1,40 @@
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
-from django.db import transaction
 from rest_framework import permissions, status, generics
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from .serializers import *
 from .models import *
-from datetime import datetime, timedelta
+from bookings.engine import book_timeslots, BookingQuotaExceededError
+from bookings.views import (
+    BaseMachineListAPIView,
+    BaseTimeSlotListAPIView,
+    BaseTimeSlotGridAPIView,
+    BaseAvailabilityAPIView,
+)
 
 
-class InductionListAPIView(generics.ListAPIView):
+class InductionListAPIView(BaseMachineListAPIView):
     queryset = Induction.objects.all()
     serializer_class = InductionSerializer
-    permission_classes = [permissions.IsAuthenticated]
 
 
-class InductionTimeSlotListAPIView(generics.ListAPIView):
+class InductionTimeSlotListAPIView(BaseTimeSlotListAPIView):
     serializer_class = ListInductionTimeSlotSerializer
-    permission_classes = [permissions.IsAuthenticated]
-
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                "date",
-                openapi.IN_QUERY,
-                description="조회할 날짜 (YYYY-MM-DD 형식)",
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_DATE,
-                required=True,
-            )
-        ]
-    )
-    def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
-
-    def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
-            if not self.request.query_params.get("date"):
-                return InductionTimeSlot.objects.none()
-
-        induction_pk = self.kwargs.get("pk")
-        date_str = self.request.query_params.get("date")
+    model_class = InductionTimeSlot
+    machine_model_class = Induction
+    machine_fk_field = "induction"
 
-        if not date_str:
-            raise serializers.ValidationError("날짜를 지정해주세요.")
 
-        try:
-            query_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            raise serializers.ValidationError("날짜 형식이 잘못되었습니다.")
-
-        start_dt = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        end_dt = start_dt + timedelta(days=1)
+class InductionTimeSlotGridAPIView(BaseTimeSlotGridAPIView):
+    serializer_class = ListInductionTimeSlotSerializer
+    model_class = InductionTimeSlot
+    machine_fk_field = "induction"
 
-        queryset = InductionTimeSlot.objects.filter(
-            induction__pk=induction_pk,
-            start_time__gte=start_dt,
-            start_time__lt=end_dt,
-            user__isnull=False,
-        ).select_related("user", "induction")
 
-        return queryset
+class InductionAvailabilityAPIView(BaseAvailabilityAPIView):
+    model_class = InductionTimeSlot
+    machine_fk_field = "induction"
 
 
 class InductionTimeSlotBookAPIView(generics.GenericAPIView):
@@ -107,54 +77,16 @@ class InductionTimeSlotBookAPIView(generics.GenericAPIView):
             "duration_minutes", SLOT_DURATION_MINUTES
         )
         num_slots_to_book = duration_minutes // SLOT_DURATION_MINUTES
-
-        booked_slot_objects = []
-        any_slot_newly_created_in_db = False
-
-        timestamp_for_this_booking_action = timezone.now()
-
         try:
-            with transaction.atomic():
-                for i in range(num_slots_to_book):
-                    current_slot_start_time = start_time + timedelta(
-                        minutes=i * SLOT_DURATION_MINUTES
-                    )
-                    current_slot_end_time = current_slot_start_time + timedelta(
-                        minutes=SLOT_DURATION_MINUTES
-                    )
-
-                    (
-                        slot,
-                        created,
-                    ) = InductionTimeSlot.objects.select_for_update().get_or_create(
-                        induction=induction,
-                        start_time=current_slot_start_time,
-                        defaults={
-                            "end_time": current_slot_end_time,
-                            "user": request.user,
-                            "booked_at": timestamp_for_this_booking_action,
-                        },
-                    )
-
-                    if created:
-                        any_slot_newly_created_in_db = True
-                        booked_slot_objects.append(slot)
-                    else:
-                        if slot.user is None:
-                            slot.user = request.user
-                            slot.booked_at = timestamp_for_this_booking_action
-                            slot.end_time = current_slot_end_time
-                            slot.save()
-                            booked_slot_objects.append(slot)
-                        elif slot.user == request.user:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 본인의 이전 예약에 포함되어 있습니다. "
-                                "기존 예약을 취소 후 다시 시도해주세요."
-                            )
-                        else:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 다른 사용자가 예약했습니다."
-                            )
+            booked_slot_objects, any_slot_newly_created_in_db = book_timeslots(
+                InductionTimeSlot,
+                induction,
+                request.user,
+                start_time,
+                num_slots_to_book,
+                SLOT_DURATION_MINUTES,
+                MAX_BOOKING_ACTIONS_PER_DAY,
+            )
 
             response_serializer = ListInductionTimeSlotSerializer(
                 booked_slot_objects, many=True
@@ -167,6 +99,8 @@ class InductionTimeSlotBookAPIView(generics.GenericAPIView):
 
             return Response(response_serializer.data, status=status_code)
 
+        except BookingQuotaExceededError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
         except Exception as e:
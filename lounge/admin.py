@@ -1,5 +1,14 @@
 from django.contrib import admin
 from django.http import HttpRequest
+from bookings.admin_actions import (
+    DateRangeActionForm,
+    MachineChangeMixin,
+    ReleasingDeleteMixin,
+    disable_and_release_date_range,
+    purge_empty_timeslots,
+    release_selected_timeslots,
+    toggle_availability,
+)
 from .models import (
     PingPongTable,
     PingPongTableTimeSlot,
@@ -8,17 +17,11 @@ from .models import (
 )
 
 
-@admin.action(description="사용 가능 여부 바꾸기")
-def change_is_available(modeladmin, request, objects):
-    for object in objects.all():
-        object.is_available = not object.is_available
-        object.save()
-
-
 @admin.register(PingPongTable)
-class PingPongTableAdmin(admin.ModelAdmin):
+class PingPongTableAdmin(MachineChangeMixin, admin.ModelAdmin):
 
-    actions = [change_is_available]
+    action_form = DateRangeActionForm
+    actions = [toggle_availability, disable_and_release_date_range]
 
     list_display = (
         "pk",
@@ -44,7 +47,9 @@ class IsBookedFilter(admin.SimpleListFilter):
 
 
 @admin.register(PingPongTableTimeSlot)
-class PingPongTableTimeSlotAdmin(admin.ModelAdmin):
+class PingPongTableTimeSlotAdmin(ReleasingDeleteMixin, admin.ModelAdmin):
+    actions = [release_selected_timeslots, purge_empty_timeslots]
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
@@ -57,6 +62,7 @@ class PingPongTableTimeSlotAdmin(admin.ModelAdmin):
         "start_time",
         "end_time",
         "booked_at",
+        "booking_action",
     )
     list_display = (
         "__str__",
@@ -70,8 +76,9 @@ class PingPongTableTimeSlotAdmin(admin.ModelAdmin):
 
 
 @admin.register(ArcadeMachine)
-class ArcadeMachineAdmin(admin.ModelAdmin):
-    actions = [change_is_available]
+class ArcadeMachineAdmin(MachineChangeMixin, admin.ModelAdmin):
+    action_form = DateRangeActionForm
+    actions = [toggle_availability, disable_and_release_date_range]
     list_display = (
         "pk",
         "is_available",
@@ -79,7 +86,9 @@ class ArcadeMachineAdmin(admin.ModelAdmin):
 
 
 @admin.register(ArcadeMachineTimeSlot)
-class ArcadeMachineTimeSlotAdmin(admin.ModelAdmin):
+class ArcadeMachineTimeSlotAdmin(ReleasingDeleteMixin, admin.ModelAdmin):
+    actions = [release_selected_timeslots, purge_empty_timeslots]
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
@@ -92,6 +101,7 @@ class ArcadeMachineTimeSlotAdmin(admin.ModelAdmin):
         "start_time",
         "end_time",
         "booked_at",
+        "booking_action",
     )
     list_display = (
         "__str__",
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 12:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lounge", "0002_arcademachine_arcademachinetimeslot"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="arcademachinetimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["start_time"],
+                name="arcade_booked_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pingpongtabletimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["start_time"],
+                name="pingpong_booked_start_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-18 12:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0001_initial"),
+        ("lounge", "0003_timeslot_booked_start_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="arcademachinetimeslot",
+            name="booking_action",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to="bookings.bookingaction",
+                verbose_name="예약 행동",
+            ),
+        ),
+        migrations.AddField(
+            model_name="pingpongtabletimeslot",
+            name="booking_action",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to="bookings.bookingaction",
+                verbose_name="예약 행동",
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-18 12:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookings", "0002_backfill_booking_actions"),
+        ("lounge", "0004_arcademachinetimeslot_booking_action_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="arcademachinetimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["arcade_machine", "start_time"],
+                name="arcade_booked_machine_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="arcademachinetimeslot",
+            index=models.Index(
+                fields=["user", "start_time", "booked_at"], name="arcade_user_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pingpongtabletimeslot",
+            index=models.Index(
+                condition=models.Q(("user__isnull", False)),
+                fields=["ping_pong_table", "start_time"],
+                name="pingpong_booked_machine_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pingpongtabletimeslot",
+            index=models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="pingpong_user_start_idx",
+            ),
+        ),
+    ]
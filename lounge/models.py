@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils import timezone
 from users.models import User
+from bookings.engine import claim_timeslot
+from bookings.querysets import MachineQuerySet
 
 
 class PingPongTable(models.Model):
@@ -9,8 +11,13 @@ class PingPongTable(models.Model):
         default=True,
     )
 
+    objects = MachineQuerySet.as_manager()
+    timeslot_relation = "pingpongtabletimeslot"
+
     @property
     def is_using(self) -> bool:
+        if hasattr(self, "using_now"):
+            return self.using_now
         now = timezone.now()
         return PingPongTableTimeSlot.objects.filter(
             ping_pong_table=self,
@@ -39,10 +46,33 @@ class PingPongTableTimeSlot(models.Model):
     start_time = models.DateTimeField("시작 시간")
     end_time = models.DateTimeField("종료 시간")
     booked_at = models.DateTimeField("예약 시간", null=True, blank=True)
+    booking_action = models.ForeignKey(
+        "bookings.BookingAction",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="예약 행동",
+    )
 
     class Meta:
         ordering = ["start_time"]
         unique_together = ["ping_pong_table", "start_time"]
+        indexes = [
+            models.Index(
+                fields=["start_time"],
+                condition=models.Q(user__isnull=False),
+                name="pingpong_booked_start_idx",
+            ),
+            models.Index(
+                fields=["ping_pong_table", "start_time"],
+                condition=models.Q(user__isnull=False),
+                name="pingpong_booked_machine_idx",
+            ),
+            models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="pingpong_user_start_idx",
+            ),
+        ]
 
     def __str__(self):
         status = "Booked" if self.user else "Available (Created)"
@@ -57,15 +87,11 @@ class PingPongTableTimeSlot(models.Model):
             return f"PingPongTableTimeSlot object (Incomplete)"
 
     def book(self, user):
-        if self.user:
-            raise ValueError("이미 예약된 시간입니다.")
-        self.user = user
-        self.booked_at = timezone.now()
-        self.save()
+        claim_timeslot(self, user)
 
     @property
     def is_booked(self) -> bool:
-        return self.user is not None
+        return self.user_id is not None
 
 
 class ArcadeMachine(models.Model):
@@ -74,8 +100,13 @@ class ArcadeMachine(models.Model):
         default=True,
     )
 
+    objects = MachineQuerySet.as_manager()
+    timeslot_relation = "arcademachinetimeslot"
+
     @property
     def is_using(self) -> bool:
+        if hasattr(self, "using_now"):
+            return self.using_now
         now = timezone.now()
         return ArcadeMachineTimeSlot.objects.filter(
             arcade_machine=self,
@@ -104,10 +135,33 @@ class ArcadeMachineTimeSlot(models.Model):
     start_time = models.DateTimeField("시작 시간")
     end_time = models.DateTimeField("종료 시간")
     booked_at = models.DateTimeField("예약 시간", null=True, blank=True)
+    booking_action = models.ForeignKey(
+        "bookings.BookingAction",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name="예약 행동",
+    )
 
     class Meta:
         ordering = ["start_time"]
         unique_together = ["arcade_machine", "start_time"]
+        indexes = [
+            models.Index(
+                fields=["start_time"],
+                condition=models.Q(user__isnull=False),
+                name="arcade_booked_start_idx",
+            ),
+            models.Index(
+                fields=["arcade_machine", "start_time"],
+                condition=models.Q(user__isnull=False),
+                name="arcade_booked_machine_idx",
+            ),
+            models.Index(
+                fields=["user", "start_time", "booked_at"],
+                name="arcade_user_start_idx",
+            ),
+        ]
 
     def __str__(self):
         status = "Booked" if self.user else "Available (Created)"
@@ -123,4 +177,4 @@ class ArcadeMachineTimeSlot(models.Model):
 
     @property
     def is_booked(self) -> bool:
-        return self.user is not None
+        return self.user_id is not None
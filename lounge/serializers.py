@@ -6,7 +6,9 @@ from .models import (
     ArcadeMachineTimeSlot,
 )
 from django.utils import timezone
-from datetime import datetime, timedelta
+from datetime import timedelta
+from bookings.facilities import get_facility_for_model
+from bookings.models import BookingAction
 
 PING_PONG_MAX_BOOKING_ACTIONS_PER_DAY = 1
 PING_PONG_SLOT_DURATION_MINUTES = 30
@@ -82,23 +84,12 @@ class BookPingPongTableTimeSlotSerializer(serializers.Serializer):
         request_user = request.user
 
         start_time = data["start_time"]
-        query_date = start_time.date()
+        query_date = timezone.localtime(start_time).date()
 
-        day_start = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        day_end = day_start + timedelta(days=1)
-
-        user_actions_count_today = (
-            PingPongTableTimeSlot.objects.filter(
-                user=request_user,
-                start_time__gte=day_start,
-                start_time__lt=day_end,
-            )
-            .values("booked_at")
-            .distinct()
-            .count()
+        user_actions_count_today = BookingAction.objects.get_count(
+            request_user,
+            get_facility_for_model(PingPongTableTimeSlot).key,
+            query_date,
         )
 
         if user_actions_count_today >= PING_PONG_MAX_BOOKING_ACTIONS_PER_DAY:
@@ -169,20 +160,12 @@ class BookArcadeMachineTimeSlotSerializer(serializers.Serializer):
             raise serializers.ValidationError("요청 컨텍스트에 사용자가 없습니다.")
         request_user = request.user
         start_time = data["start_time"]
-        query_date = start_time.date()
-        day_start = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        day_end = day_start + timedelta(days=1)
+        query_date = timezone.localtime(start_time).date()
 
-        user_actions_count_today = (
-            ArcadeMachineTimeSlot.objects.filter(
-                user=request_user, start_time__gte=day_start, start_time__lt=day_end
-            )
-            .values("booked_at")
-            .distinct()
-            .count()
+        user_actions_count_today = BookingAction.objects.get_count(
+            request_user,
+            get_facility_for_model(ArcadeMachineTimeSlot).key,
+            query_date,
         )
 
         if user_actions_count_today >= ARCADE_MACHINE_MAX_BOOKING_ACTIONS_PER_DAY:
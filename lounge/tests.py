@@ -1,3 +1,117 @@
+import json
+from datetime import timedelta
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from bookings.utils import get_day_range
+from users.models import User
+from .models import PingPongTable, PingPongTableTimeSlot, ArcadeMachine
+
+
+class MachineListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.tables = [PingPongTable.objects.create() for _ in range(3)]
+        for _ in range(3):
+            ArcadeMachine.objects.create()
+        now = timezone.now()
+        PingPongTableTimeSlot.objects.create(
+            ping_pong_table=cls.tables[1],
+            user=cls.user,
+            start_time=now - timedelta(minutes=10),
+            end_time=now + timedelta(minutes=20),
+            booked_at=now,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_ping_pong_table_list_runs_single_query(self):
+        # ETag 버전 조회 1번 + 목록 쿼리 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("ping-pong-table-list"))
+        using = {item["pk"]: item["is_using"] for item in response.data}
+        self.assertEqual(
+            using,
+            {
+                self.tables[0].pk: False,
+                self.tables[1].pk: True,
+                self.tables[2].pk: False,
+            },
+        )
+
+    def test_arcade_machine_list_runs_single_query(self):
+        # ETag 버전 조회 1번 + 목록 쿼리 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("arcade-machine-list"))
+        self.assertEqual(len(response.data), 3)
+
+
+class PingPongTableTimeSlotListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("2024000001", "password")
+        cls.table = PingPongTable.objects.create()
+        cls.first_day = timezone.localdate() + timedelta(days=1)
+        for day_offset, hour in [(0, 9), (0, 23), (2, 0)]:
+            day_start, _ = get_day_range(cls.first_day + timedelta(days=day_offset))
+            start_time = day_start + timedelta(hours=hour, minutes=30)
+            PingPongTableTimeSlot.objects.create(
+                ping_pong_table=cls.table,
+                user=cls.user,
+                start_time=start_time,
+                end_time=start_time + timedelta(minutes=30),
+                booked_at=timezone.now(),
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("ping-pong-table-timeslot-list", args=[self.table.pk])
+
+    def test_single_day(self):
+        response = self.client.get(self.url, {"date": self.first_day.isoformat()})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+
+    def test_date_range_is_grouped_by_day(self):
+        # ETag 버전 조회 1번 + 기구 확인 1번 + 범위 쿼리 1번 (범위 쿼리는 스트리밍 중에 실행됩니다)
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                self.url,
+                {
+                    "date_from": self.first_day.isoformat(),
+                    "date_to": (self.first_day + timedelta(days=3)).isoformat(),
+                },
+            )
+            days = json.loads(response.getvalue())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(day["date"], len(day["timeslots"])) for day in days],
+            [
+                ((self.first_day + timedelta(days=offset)).isoformat(), count)
+                for offset, count in enumerate([2, 0, 1, 0])
+            ],
+        )
+
+    def test_date_range_span_is_bounded(self):
+        response = self.client.get(
+            self.url,
+            {
+                "date_from": self.first_day.isoformat(),
+                "date_to": (self.first_day + timedelta(days=60)).isoformat(),
+            },
+        )
+        self.assertEqual(response.status_code, 400)
 
-# Create your tests here.
+    def test_unknown_table_returns_404(self):
+        response = self.client.get(
+            reverse("ping-pong-table-timeslot-list", args=[self.table.pk + 1]),
+            {"date": self.first_day.isoformat()},
+        )
+        self.assertEqual(response.status_code, 404)
@@ -1,4 +1,10 @@
 from django.urls import path
+from bookings.async_views import (
+    AsyncMachineListView,
+    AsyncTimeSlotListView,
+    SlotEventStreamView,
+)
+from .models import ArcadeMachineTimeSlot, PingPongTableTimeSlot
 from .views import *
 
 urlpatterns = [
@@ -7,6 +13,16 @@ urlpatterns = [
         PingPongTableListAPIView.as_view(),
         name="ping-pong-table-list",
     ),
+    path(
+        "ping-pong-tables/timeslots/",
+        PingPongTableTimeSlotGridAPIView.as_view(),
+        name="ping-pong-table-timeslot-grid",
+    ),
+    path(
+        "ping-pong-tables/availability/",
+        PingPongTableAvailabilityAPIView.as_view(),
+        name="ping-pong-table-availability",
+    ),
     path(
         "ping-pong-tables/<int:pk>/timeslots/",
         PingPongTableTimeSlotListAPIView.as_view(),
@@ -22,6 +38,16 @@ urlpatterns = [
         ArcadeMachineListAPIView.as_view(),
         name="arcade-machine-list",
     ),
+    path(
+        "arcade-machines/timeslots/",
+        ArcadeMachineTimeSlotGridAPIView.as_view(),
+        name="arcade-machine-timeslot-grid",
+    ),
+    path(
+        "arcade-machines/availability/",
+        ArcadeMachineAvailabilityAPIView.as_view(),
+        name="arcade-machine-availability",
+    ),
     path(
         "arcade-machines/<int:pk>/timeslots/",
         ArcadeMachineTimeSlotListAPIView.as_view(),
@@ -32,4 +58,34 @@ urlpatterns = [
         ArcadeMachineTimeSlotBookAPIView.as_view(),
         name="arcade-machine-timeslot-book",
     ),
+    path(
+        "async/ping-pong-tables/",
+        AsyncMachineListView.as_view(sync_view_class=PingPongTableListAPIView),
+        name="async-ping-pong-table-list",
+    ),
+    path(
+        "async/ping-pong-tables/<int:pk>/timeslots/",
+        AsyncTimeSlotListView.as_view(sync_view_class=PingPongTableTimeSlotListAPIView),
+        name="async-ping-pong-table-timeslot-list",
+    ),
+    path(
+        "async/arcade-machines/",
+        AsyncMachineListView.as_view(sync_view_class=ArcadeMachineListAPIView),
+        name="async-arcade-machine-list",
+    ),
+    path(
+        "async/arcade-machines/<int:pk>/timeslots/",
+        AsyncTimeSlotListView.as_view(sync_view_class=ArcadeMachineTimeSlotListAPIView),
+        name="async-arcade-machine-timeslot-list",
+    ),
+    path(
+        "ping-pong-tables/events/",
+        SlotEventStreamView.as_view(model_class=PingPongTableTimeSlot),
+        name="ping-pong-table-events",
+    ),
+    path(
+        "arcade-machines/events/",
+        SlotEventStreamView.as_view(model_class=ArcadeMachineTimeSlot),
+        name="arcade-machine-events",
+    ),
 ]
@@ -1,9 +1,6 @@
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
-from django.db import transaction
 from rest_framework import permissions, status, generics
 from rest_framework.response import Response
-from rest_framework.exceptions import ValidationError
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from .models import (
@@ -17,63 +14,43 @@ from .serializers import (
     ListPingPongTableTimeSlotSerializer,
     BookPingPongTableTimeSlotSerializer,
     PING_PONG_SLOT_DURATION_MINUTES,
+    PING_PONG_MAX_BOOKING_ACTIONS_PER_DAY,
     ArcadeMachineSerializer,
     ListArcadeMachineTimeSlotSerializer,
     BookArcadeMachineTimeSlotSerializer,
     ARCADE_MACHINE_SLOT_DURATION_MINUTES,
+    ARCADE_MACHINE_MAX_BOOKING_ACTIONS_PER_DAY,
+)
+from bookings.engine import book_timeslots, BookingQuotaExceededError
+from bookings.views import (
+    BaseMachineListAPIView,
+    BaseTimeSlotListAPIView,
+    BaseTimeSlotGridAPIView,
+    BaseAvailabilityAPIView,
 )
-from datetime import datetime, timedelta
 
 
-class PingPongTableListAPIView(generics.ListAPIView):
+class PingPongTableListAPIView(BaseMachineListAPIView):
     queryset = PingPongTable.objects.all()
     serializer_class = PingPongTableSerializer
-    permission_classes = [permissions.IsAuthenticated]
 
 
-class PingPongTableTimeSlotListAPIView(generics.ListAPIView):
+class PingPongTableTimeSlotListAPIView(BaseTimeSlotListAPIView):
     serializer_class = ListPingPongTableTimeSlotSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    model_class = PingPongTableTimeSlot
+    machine_model_class = PingPongTable
+    machine_fk_field = "ping_pong_table"
 
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                "date",
-                openapi.IN_QUERY,
-                description="조회할 날짜 (YYYY-MM-DD 형식)",
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_DATE,
-                required=True,
-            )
-        ]
-    )
-    def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
 
-    def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
-            if not self.request.query_params.get("date"):
-                return PingPongTableTimeSlot.objects.none()
-        ping_pong_table_pk = self.kwargs.get("pk")
-        date_str = self.request.query_params.get("date")
-        if not date_str:
-            raise ValidationError("날짜를 지정해주세요.")
-        try:
-            query_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            raise ValidationError("날짜 형식이 잘못되었습니다. (YYYY-MM-DD)")
-        start_dt = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        end_dt = start_dt + timedelta(days=1)
-        queryset = PingPongTableTimeSlot.objects.filter(
-            ping_pong_table__pk=ping_pong_table_pk,
-            start_time__gte=start_dt,
-            start_time__lt=end_dt,
-            user__isnull=False,
-        ).select_related("user", "ping_pong_table")
-        return queryset
+class PingPongTableTimeSlotGridAPIView(BaseTimeSlotGridAPIView):
+    serializer_class = ListPingPongTableTimeSlotSerializer
+    model_class = PingPongTableTimeSlot
+    machine_fk_field = "ping_pong_table"
+
+
+class PingPongTableAvailabilityAPIView(BaseAvailabilityAPIView):
+    model_class = PingPongTableTimeSlot
+    machine_fk_field = "ping_pong_table"
 
 
 class PingPongTableTimeSlotBookAPIView(generics.GenericAPIView):
@@ -115,48 +92,16 @@ class PingPongTableTimeSlotBookAPIView(generics.GenericAPIView):
             "duration_minutes", PING_PONG_SLOT_DURATION_MINUTES
         )
         num_slots_to_book = duration_minutes // PING_PONG_SLOT_DURATION_MINUTES
-        booked_slot_objects = []
-        any_slot_newly_created_in_db = False
-        timestamp_for_this_booking_action = timezone.now()
         try:
-            with transaction.atomic():
-                for i in range(num_slots_to_book):
-                    current_slot_start_time = start_time + timedelta(
-                        minutes=i * PING_PONG_SLOT_DURATION_MINUTES
-                    )
-                    current_slot_end_time = current_slot_start_time + timedelta(
-                        minutes=PING_PONG_SLOT_DURATION_MINUTES
-                    )
-                    (
-                        slot,
-                        created,
-                    ) = PingPongTableTimeSlot.objects.select_for_update().get_or_create(
-                        ping_pong_table=ping_pong_table,
-                        start_time=current_slot_start_time,
-                        defaults={
-                            "end_time": current_slot_end_time,
-                            "user": request.user,
-                            "booked_at": timestamp_for_this_booking_action,
-                        },
-                    )
-                    if created:
-                        any_slot_newly_created_in_db = True
-                        booked_slot_objects.append(slot)
-                    else:
-                        if slot.user is None:
-                            slot.user = request.user
-                            slot.booked_at = timestamp_for_this_booking_action
-                            slot.end_time = current_slot_end_time
-                            slot.save()
-                            booked_slot_objects.append(slot)
-                        elif slot.user == request.user:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 본인의 이전 예약에 포함되어 있습니다."
-                            )
-                        else:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 다른 사용자가 예약했습니다."
-                            )
+            booked_slot_objects, any_slot_newly_created_in_db = book_timeslots(
+                PingPongTableTimeSlot,
+                ping_pong_table,
+                request.user,
+                start_time,
+                num_slots_to_book,
+                PING_PONG_SLOT_DURATION_MINUTES,
+                PING_PONG_MAX_BOOKING_ACTIONS_PER_DAY,
+            )
             response_serializer = ListPingPongTableTimeSlotSerializer(
                 booked_slot_objects, many=True
             )
@@ -166,6 +111,8 @@ class PingPongTableTimeSlotBookAPIView(generics.GenericAPIView):
                 else status.HTTP_200_OK
             )
             return Response(response_serializer.data, status=status_code)
+        except BookingQuotaExceededError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
         except Exception as e:
@@ -175,58 +122,27 @@ class PingPongTableTimeSlotBookAPIView(generics.GenericAPIView):
             )
 
 
-class ArcadeMachineListAPIView(generics.ListAPIView):
+class ArcadeMachineListAPIView(BaseMachineListAPIView):
     queryset = ArcadeMachine.objects.all()
     serializer_class = ArcadeMachineSerializer
-    permission_classes = [permissions.IsAuthenticated]
 
 
-class ArcadeMachineTimeSlotListAPIView(generics.ListAPIView):
+class ArcadeMachineTimeSlotListAPIView(BaseTimeSlotListAPIView):
     serializer_class = ListArcadeMachineTimeSlotSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    model_class = ArcadeMachineTimeSlot
+    machine_model_class = ArcadeMachine
+    machine_fk_field = "arcade_machine"
 
-    @swagger_auto_schema(
-        manual_parameters=[
-            openapi.Parameter(
-                "date",
-                openapi.IN_QUERY,
-                description="조회할 날짜 (YYYY-MM-DD 형식)",
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_DATE,
-                required=True,
-            )
-        ]
-    )
-    def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
 
-    def get_queryset(self):
-        if getattr(self, "swagger_fake_view", False):
-            if not self.request.query_params.get("date"):
-                return ArcadeMachineTimeSlot.objects.none()
+class ArcadeMachineTimeSlotGridAPIView(BaseTimeSlotGridAPIView):
+    serializer_class = ListArcadeMachineTimeSlotSerializer
+    model_class = ArcadeMachineTimeSlot
+    machine_fk_field = "arcade_machine"
 
-        arcade_machine_pk = self.kwargs.get("pk")
-        date_str = self.request.query_params.get("date")
-        if not date_str:
-            raise ValidationError("날짜를 지정해주세요.")
-        try:
-            query_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            raise ValidationError("날짜 형식이 잘못되었습니다. (YYYY-MM-DD)")
 
-        start_dt = timezone.make_aware(
-            datetime.combine(query_date, datetime.min.time()),
-            timezone.get_default_timezone(),
-        )
-        end_dt = start_dt + timedelta(days=1)
-
-        queryset = ArcadeMachineTimeSlot.objects.filter(
-            arcade_machine__pk=arcade_machine_pk,
-            start_time__gte=start_dt,
-            start_time__lt=end_dt,
-            user__isnull=False,
-        ).select_related("user", "arcade_machine")
-        return queryset
+class ArcadeMachineAvailabilityAPIView(BaseAvailabilityAPIView):
+    model_class = ArcadeMachineTimeSlot
+    machine_fk_field = "arcade_machine"
 
 
 class ArcadeMachineTimeSlotBookAPIView(generics.GenericAPIView):
@@ -270,52 +186,16 @@ class ArcadeMachineTimeSlotBookAPIView(generics.GenericAPIView):
             "duration_minutes", ARCADE_MACHINE_SLOT_DURATION_MINUTES
         )
         num_slots_to_book = duration_minutes // ARCADE_MACHINE_SLOT_DURATION_MINUTES
-
-        booked_slot_objects = []
-        any_slot_newly_created_in_db = False
-        timestamp_for_this_booking_action = timezone.now()
-
         try:
-            with transaction.atomic():
-                for i in range(num_slots_to_book):
-                    current_slot_start_time = start_time + timedelta(
-                        minutes=i * ARCADE_MACHINE_SLOT_DURATION_MINUTES
-                    )
-                    current_slot_end_time = current_slot_start_time + timedelta(
-                        minutes=ARCADE_MACHINE_SLOT_DURATION_MINUTES
-                    )
-
-                    (
-                        slot,
-                        created,
-                    ) = ArcadeMachineTimeSlot.objects.select_for_update().get_or_create(
-                        arcade_machine=arcade_machine,
-                        start_time=current_slot_start_time,
-                        defaults={
-                            "end_time": current_slot_end_time,
-                            "user": request.user,
-                            "booked_at": timestamp_for_this_booking_action,
-                        },
-                    )
-                    if created:
-                        any_slot_newly_created_in_db = True
-                        booked_slot_objects.append(slot)
-                    else:
-                        if slot.user is None:
-                            slot.user = request.user
-                            slot.booked_at = timestamp_for_this_booking_action
-                            slot.end_time = current_slot_end_time
-                            slot.save()
-                            booked_slot_objects.append(slot)
-                        elif slot.user == request.user:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 본인의 이전 예약에 포함되어 있습니다."
-                            )
-                        else:
-                            raise ValueError(
-                                f"{current_slot_start_time.strftime('%H:%M')} 슬롯은 이미 다른 사용자가 예약했습니다."
-                            )
-
+            booked_slot_objects, any_slot_newly_created_in_db = book_timeslots(
+                ArcadeMachineTimeSlot,
+                arcade_machine,
+                request.user,
+                start_time,
+                num_slots_to_book,
+                ARCADE_MACHINE_SLOT_DURATION_MINUTES,
+                ARCADE_MACHINE_MAX_BOOKING_ACTIONS_PER_DAY,
+            )
             response_serializer = ListArcadeMachineTimeSlotSerializer(
                 booked_slot_objects, many=True
             )
@@ -325,6 +205,8 @@ class ArcadeMachineTimeSlotBookAPIView(generics.GenericAPIView):
                 else status.HTTP_200_OK
             )
             return Response(response_serializer.data, status=status_code)
+        except BookingQuotaExceededError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
         except Exception as e:
@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from rest_framework.authtoken.models import Token
+
+        from .authentication import (
+            invalidate_token_cache_for_token,
+            invalidate_token_cache_for_user,
+        )
+        from .models import User
+
+        post_delete.connect(invalidate_token_cache_for_token, sender=Token)
+        post_save.connect(invalidate_token_cache_for_user, sender=User)
@@ -0,0 +1,180 @@
+"""
+비밀번호 해시를 전용 스레드 풀에서 계산하는 비동기 로그인/비밀번호 변경 뷰와
+비동기 ORM 으로 조회하는 내 예약 목록 뷰
+
+config/asgi.py 로 실행할 때 해시 계산이 동기 뷰가 실행되는 스레드를 막지 않습니다.
+DB 조회/저장은 비동기 ORM 으로 하고, 해시 스레드에서는 해시 계산만 합니다.
+요청/응답 형식은 LogInAPIView, ChangePasswordAPIView, MyAllBookingsListAPIView 와 같고,
+비밀번호 변경과 내 예약 목록은 토큰 인증만 지원합니다.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import aauthenticate, alogin
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.signals import user_login_failed
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.authtoken.models import Token
+
+from bookings.async_views import AsyncReadView, json_response
+
+from .authentication import (
+    CachedTokenAuthentication,
+    get_login_token_key,
+    record_last_login,
+)
+from .hashing import PasswordHashingBusyError, password_hashing_executor
+from .models import User
+from .serializers import ChangePasswordSerializer, LoginSerializer
+from .views import MyAllBookingsListAPIView
+
+
+def parse_json_body(request):
+    try:
+        return json.loads(request.body or b"{}")
+    except ValueError:
+        return None
+
+
+DEFAULT_AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.ModelBackend"]
+
+
+async def authenticate_with_password(request, student_id_number, password):
+    """
+    ModelBackend.authenticate 와 같은 규칙으로 사용자를 확인합니다.
+    없는 사용자여도 해시를 한 번 계산해 응답 시간으로 존재 여부를 알 수 없게 합니다.
+    실패하면 django.contrib.auth.authenticate 처럼 user_login_failed 를 보냅니다.
+
+    AUTHENTICATION_BACKENDS 를 바꾼 경우에는 해시 스레드 풀 대신 aauthenticate 를 사용합니다.
+    """
+    if settings.AUTHENTICATION_BACKENDS != DEFAULT_AUTHENTICATION_BACKENDS:
+        return await aauthenticate(
+            request, student_id_number=student_id_number, password=password
+        )
+
+    user = await User.objects.filter(student_id_number=student_id_number).afirst()
+    if user is None:
+        await password_hashing_executor.run(make_password, password)
+    elif (
+        await password_hashing_executor.run(check_password, password, user.password)
+        and user.is_active
+    ):
+        return user
+    await user_login_failed.asend(
+        sender=__name__,
+        credentials={"student_id_number": student_id_number},
+        request=request,
+    )
+    return None
+
+
+def hashing_busy_response(error):
+    response = JsonResponse(
+        {"detail": str(error)}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    response["Retry-After"] = "1"
+    return response
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncLogInView(View):
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        serializer = LoginSerializer(data=parse_json_body(request))
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            user = await authenticate_with_password(
+                request,
+                serializer.validated_data["student_id_number"],
+                serializer.validated_data["password"],
+            )
+        except PasswordHashingBusyError as e:
+            return hashing_busy_response(e)
+
+        if user is None:
+            return JsonResponse(
+                {"detail": "로그인 실패"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        if settings.LOGIN_TOKEN_ONLY:
+            token_key = await sync_to_async(get_login_token_key)(user)
+            await sync_to_async(record_last_login)(user)
+        else:
+            await alogin(request, user)
+            token, created = await Token.objects.aget_or_create(user=user)
+            token_key = token.key
+        return JsonResponse(
+            {"detail": "로그인 성공", "token": token_key}, status=status.HTTP_200_OK
+        )
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncChangePasswordView(View):
+    http_method_names = ["put"]
+
+    async def put(self, request):
+        try:
+            result = await CachedTokenAuthentication().aauthenticate(request)
+        except exceptions.AuthenticationFailed as e:
+            return JsonResponse(
+                {"detail": str(e.detail)}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        if result is None:
+            return JsonResponse(
+                {"detail": str(exceptions.NotAuthenticated.default_detail)},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        serializer = ChangePasswordSerializer(data=parse_json_body(request))
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # 토큰 캐시의 사용자는 다른 워커에서 바뀐 비밀번호를 모를 수 있으므로
+        # 비밀번호 해시는 DB 에서 다시 읽어 확인합니다.
+        user = await User.objects.filter(pk=result[0].pk, is_active=True).afirst()
+        if user is None:
+            return JsonResponse(
+                {"detail": str(exceptions.AuthenticationFailed.default_detail)},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        try:
+            if not await password_hashing_executor.run(
+                check_password,
+                serializer.validated_data["old_password"],
+                user.password,
+            ):
+                return JsonResponse(
+                    {"old_password": ["Wrong password."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            user.password = await password_hashing_executor.run(
+                make_password, serializer.validated_data["new_password"]
+            )
+        except PasswordHashingBusyError as e:
+            return hashing_busy_response(e)
+
+        await user.asave(update_fields=["password"])
+        return JsonResponse(
+            {"detail": "Password updated successfully."}, status=status.HTTP_200_OK
+        )
+
+
+class AsyncMyAllBookingsView(AsyncReadView):
+    """
+    MyAllBookingsListAPIView 의 비동기 버전
+    """
+
+    sync_view_class = MyAllBookingsListAPIView
+
+    async def aget_response(self, view):
+        rows = [row async for row in view.get_bookings_queryset()]
+        return json_response(view.build_response_data(rows))
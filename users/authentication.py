@@ -0,0 +1,339 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.models import Case, When
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+# 캐시하는 사용자 필드가 바뀌면 다른 워커가 남긴 공유 캐시 값과 섞이지 않도록 접두사를 바꿉니다.
+SHARED_CACHE_KEY_PREFIX = "auth-token:v2"
+
+
+class TokenCache:
+    """
+    토큰 키 -> 인증 결과(토큰 생성 시각, 사용자 필드 값) 캐시
+
+    프로세스 안에서는 크기 제한과 TTL 이 있는 LRU 로 보관하고,
+    AUTH_TOKEN_SHARED_CACHE_ALIAS 가 설정되어 있으면 Django 캐시에도 함께 보관해
+    다른 워커와 공유합니다. 모델 인스턴스 대신 필드 값만 저장하고 꺼낼 때마다
+    새 인스턴스를 만들기 때문에 요청끼리 같은 객체를 공유하지 않습니다.
+
+    로그아웃(토큰 삭제), 비밀번호 변경, 사용자 비활성화 시 signal 로 지워지며,
+    다른 워커의 프로세스 캐시는 TTL 이 지나면 DB 에서 다시 읽습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, _, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return value
+                self._remove(key)
+
+        shared_cache = self._get_shared_cache()
+        if shared_cache is None:
+            return None
+        cached = shared_cache.get(self._get_shared_key(key))
+        if cached is None:
+            return None
+        user_pk, value = cached
+        self._set_local(key, user_pk, value)
+        return value
+
+    def set(self, key, user_pk, value):
+        self._set_local(key, user_pk, value)
+        shared_cache = self._get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.set(
+                self._get_shared_key(key),
+                (user_pk, value),
+                settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+            )
+
+    def get_user_key(self, user_pk):
+        """
+        이 프로세스 캐시에 유효한 항목이 있는 사용자의 토큰 키를 반환합니다. 없으면 None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key in self._keys_by_user.get(user_pk, ()):
+                if self._entries[key][0] > now:
+                    return key
+        return None
+
+    def invalidate(self, key):
+        with self._lock:
+            self._remove(key)
+        shared_cache = self._get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.delete(self._get_shared_key(key))
+
+    def invalidate_user(self, user_pk):
+        """
+        사용자의 토큰 캐시를 지웁니다. 다른 워커가 채운 공유 캐시 항목도 지우기 위해
+        토큰 키는 DB 에서 찾습니다.
+        """
+        with self._lock:
+            keys = set(self._keys_by_user.get(user_pk, ()))
+        keys.update(Token.objects.filter(user_id=user_pk).values_list("key", flat=True))
+        for key in keys:
+            self.invalidate(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _set_local(self, key, user_pk, value):
+        expires_at = time.monotonic() + settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, user_pk, value)
+            self._keys_by_user.setdefault(user_pk, set()).add(key)
+            while len(self._entries) > settings.AUTH_TOKEN_CACHE_MAX_SIZE:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_pk = entry[1]
+        keys = self._keys_by_user.get(user_pk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_pk]
+
+    def _get_shared_cache(self):
+        alias = settings.AUTH_TOKEN_SHARED_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    def _get_shared_key(self, key):
+        return f"{SHARED_CACHE_KEY_PREFIX}:{key}"
+
+
+token_cache = TokenCache()
+
+# 인증과 권한 확인에 필요한 필드만 캐시합니다. 비밀번호 해시와 last_login 은 캐시하지 않고
+# 꺼낸 인스턴스에서는 지연 필드가 되어, 접근하면 DB 에서 새로 읽습니다.
+CACHE_EXCLUDED_USER_FIELD_NAMES = {"password", "last_login"}
+USER_FIELD_NAMES = [
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname not in CACHE_EXCLUDED_USER_FIELD_NAMES
+]
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication 과 같지만, 확인한 토큰을 token_cache 에 보관해
+    캐시가 유효한 동안에는 사용자를 찾기 위해 DB 를 조회하지 않습니다.
+    """
+
+    def authenticate(self, request):
+        key = self.get_token_key(request)
+        if key is None:
+            return None
+        return self.authenticate_credentials(key)
+
+    async def aauthenticate(self, request):
+        """
+        authenticate 의 비동기 버전. 캐시에 없는 토큰만 비동기 ORM 으로 조회합니다.
+        """
+        key = self.get_token_key(request)
+        if key is None:
+            return None
+        cached = self.get_cached_credentials(key)
+        if cached is not None:
+            return cached
+
+        try:
+            token = await Token.objects.select_related("user").aget(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        cache_token(token, token.user)
+        return token.user, token
+
+    def get_token_key(self, request):
+        """
+        Authorization 헤더에서 토큰 키를 꺼냅니다. 형식 검사는 TokenAuthentication 과 같습니다.
+        """
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) == 1:
+            msg = _("Invalid token header. No credentials provided.")
+            raise exceptions.AuthenticationFailed(msg)
+        elif len(auth) > 2:
+            msg = _("Invalid token header. Token string should not contain spaces.")
+            raise exceptions.AuthenticationFailed(msg)
+        try:
+            return auth[1].decode()
+        except UnicodeError:
+            msg = _(
+                "Invalid token header. Token string should not contain invalid characters."
+            )
+            raise exceptions.AuthenticationFailed(msg)
+
+    def get_cached_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is None:
+            return None
+        created, user_values = cached
+        user = User.from_db(None, USER_FIELD_NAMES, user_values)
+        token = Token(key=key, user=user, created=created)
+        token._state.adding = False
+        return user, token
+
+    def authenticate_credentials(self, key):
+        cached = self.get_cached_credentials(key)
+        if cached is not None:
+            return cached
+
+        user, token = super().authenticate_credentials(key)
+        cache_token(token, user)
+        return user, token
+
+
+def cache_token(token, user):
+    token_cache.set(
+        token.key,
+        user.pk,
+        (token.created, tuple(getattr(user, name) for name in USER_FIELD_NAMES)),
+    )
+
+
+def get_login_token_key(user):
+    """
+    로그인한 사용자의 토큰 키를 반환합니다.
+    캐시에 토큰이 있으면 토큰이 아직 있는지만 pk 로 확인하고, 없으면 만들거나 가져온 뒤
+    캐시에 넣어 이어지는 인증 요청도 DB 를 거치지 않게 합니다.
+    다른 워커에서 로그아웃해 지워진 토큰은 이 프로세스의 캐시에 TTL 동안 남아 있을 수 있습니다.
+    """
+    key = token_cache.get_user_key(user.pk)
+    if key is not None:
+        if Token.objects.filter(pk=key).exists():
+            return key
+        token_cache.invalidate(key)
+    token, created = Token.objects.get_or_create(user=user)
+    cache_token(token, user)
+    return token.key
+
+
+class LastLoginBatcher:
+    """
+    토큰 전용 로그인의 last_login 갱신을 모아 두었다가
+    LAST_LOGIN_FLUSH_INTERVAL_SECONDS 마다 UPDATE 한 번으로 저장합니다.
+    간격 안에 로그인이 더 없어도 타이머 스레드가 간격이 끝날 때 저장합니다.
+    프로세스가 비정상 종료되면 마지막 간격 동안의 로그인 시각은 저장되지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flushed_at = time.monotonic()
+        self._timer = None
+
+    def record(self, user_pk, logged_in_at):
+        now = time.monotonic()
+        with self._lock:
+            self._pending[user_pk] = logged_in_at
+            wait = settings.LAST_LOGIN_FLUSH_INTERVAL_SECONDS - (
+                now - self._last_flushed_at
+            )
+            if wait > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self._flush_on_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._last_flushed_at = time.monotonic()
+            timer = self._timer
+            self._timer = None
+        if timer is not None:
+            timer.cancel()
+        if not pending:
+            return
+        # QuerySet.update 는 post_save 를 보내지 않으므로 토큰 캐시도 그대로 유지됩니다.
+        User.objects.filter(pk__in=pending).update(
+            last_login=Case(
+                *[
+                    When(pk=user_pk, then=logged_in_at)
+                    for user_pk, logged_in_at in pending.items()
+                ]
+            )
+        )
+
+    def _flush_on_timer(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("last_login 저장 실패")
+        finally:
+            connection.close()
+
+
+last_login_batcher = LastLoginBatcher()
+
+
+def record_last_login(user):
+    """
+    LOGIN_LAST_LOGIN_UPDATE 설정에 따라 토큰 전용 로그인의 last_login 을 갱신합니다.
+    - "update": 바로 저장합니다.
+    - "batch": 모아서 저장합니다.
+    - "skip": 저장하지 않습니다.
+    """
+    mode = settings.LOGIN_LAST_LOGIN_UPDATE
+    if mode == "skip":
+        return
+    now = timezone.now()
+    if mode == "batch":
+        last_login_batcher.record(user.pk, now)
+    else:
+        User.objects.filter(pk=user.pk).update(last_login=now)
+
+
+def invalidate_token_cache_for_token(sender, instance, **kwargs):
+    """
+    토큰이 삭제되면 (로그아웃, 사용자 삭제) 캐시에서 지웁니다.
+    """
+    token_cache.invalidate(instance.key)
+
+
+def invalidate_token_cache_for_user(sender, instance, update_fields=None, **kwargs):
+    """
+    사용자가 저장되면 (비밀번호 변경, 비활성화 등) 캐시에서 지웁니다.
+    로그인 시각만 갱신하는 저장은 캐시에 영향을 주지 않으므로 건너뜁니다.
+    """
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    token_cache.invalidate_user(instance.pk)
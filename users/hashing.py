@@ -0,0 +1,51 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+
+class PasswordHashingBusyError(Exception):
+    """
+    대기 중인 비밀번호 해시 작업이 PASSWORD_HASHING_MAX_PENDING 을 넘었을 때 발생합니다.
+    뷰에서는 503으로 응답합니다.
+    """
+
+
+class PasswordHashingExecutor:
+    """
+    비밀번호 해시(PBKDF2) 전용 스레드 풀
+
+    비동기 로그인/비밀번호 변경 뷰에서 해시 계산을 요청 이벤트 루프와
+    동기 뷰가 실행되는 스레드 밖으로 옮깁니다. 동시에 계산하는 수는 풀 크기로,
+    대기할 수 있는 수는 PASSWORD_HASHING_MAX_PENDING 으로 제한해 로그인이 몰려도
+    예약/조회 요청이 쓰는 스레드와 CPU 를 모두 차지하지 못하게 합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = 0
+
+    async def run(self, func, *args, **kwargs):
+        with self._lock:
+            if self._pending >= settings.PASSWORD_HASHING_MAX_PENDING:
+                raise PasswordHashingBusyError(
+                    "로그인 요청이 많아 처리하지 못했습니다. 잠시 후 다시 시도해주세요."
+                )
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASHING_WORKERS,
+                    thread_name_prefix="password-hashing",
+                )
+            executor = self._executor
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, lambda: func(*args, **kwargs))
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+password_hashing_executor = PasswordHashingExecutor()
@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from bookings.benchmarks import (
+    allow_test_client_host,
+    async_timed_request,
+    format_summary,
+    summarize,
+)
+from users.authentication import token_cache
+from users.models import User
+
+# 벤치마크용 사용자 학번 접두사. 실제 학번과 겹치지 않도록 0 으로 시작합니다.
+BENCH_STUDENT_ID_PREFIX = "0001"
+BENCH_PASSWORD = "bench-password"
+
+LOGIN_URL_NAMES = {
+    "sync": "login",
+    "async": "async-login",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "ASGI 핸들러로 로그인 요청과 기구 목록 조회 요청을 섞어 보내, "
+        "동기 로그인 뷰와 해시 계산을 전용 스레드 풀로 옮긴 비동기 로그인 뷰에서 "
+        "조회 요청의 꼬리 지연 시간이 어떻게 다른지 비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=20, help="로그인 요청 수")
+        parser.add_argument("--reads", type=int, default=200, help="조회 요청 수")
+        parser.add_argument(
+            "--concurrency", type=int, default=32, help="동시에 처리 중인 최대 요청 수"
+        )
+        parser.add_argument(
+            "--variant",
+            choices=["sync", "async", "both"],
+            default="both",
+            help="비교할 로그인 뷰",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["logins"], options["reads"], options["concurrency"]) < 1:
+            raise CommandError(
+                "--logins, --reads, --concurrency 는 1 이상이어야 합니다."
+            )
+        variants = (
+            ["sync", "async"] if options["variant"] == "both" else [options["variant"]]
+        )
+
+        allow_test_client_host()
+        student_ids = self.create_users(options["logins"])
+        reader_token_key = Token.objects.create(
+            user=User.objects.get(student_id_number=student_ids[0])
+        ).key
+        try:
+            for variant in variants:
+                token_cache.clear()
+                login_results, read_results, elapsed = asyncio.run(
+                    self.run_mixed_load(
+                        reverse(LOGIN_URL_NAMES[variant]),
+                        student_ids,
+                        reader_token_key,
+                        options["reads"],
+                        options["concurrency"],
+                    )
+                )
+                self.stdout.write(
+                    format_summary(
+                        f"{variant} login", summarize(login_results, elapsed)
+                    )
+                )
+                self.stdout.write(
+                    format_summary(f"{variant} reads", summarize(read_results, elapsed))
+                )
+        finally:
+            User.objects.filter(
+                student_id_number__startswith=BENCH_STUDENT_ID_PREFIX
+            ).delete()
+
+    def create_users(self, count):
+        """
+        같은 비밀번호의 벤치마크용 사용자를 만들고 학번 목록을 반환합니다.
+        비밀번호 해시는 한 번만 계산해 모든 사용자에게 씁니다.
+        """
+        User.objects.filter(
+            student_id_number__startswith=BENCH_STUDENT_ID_PREFIX
+        ).delete()
+        password = make_password(BENCH_PASSWORD)
+        users = User.objects.bulk_create(
+            [
+                User(
+                    student_id_number=f"{BENCH_STUDENT_ID_PREFIX}{index:06d}",
+                    password=password,
+                )
+                for index in range(count)
+            ]
+        )
+        return [user.student_id_number for user in users]
+
+    async def run_mixed_load(
+        self, login_path, student_ids, reader_token_key, reads, concurrency
+    ):
+        """
+        로그인 요청과 조회 요청을 번갈아 섞어 concurrency 개씩 동시에 보냅니다.
+        (로그인 결과, 조회 결과, 걸린 시간(초)) 를 반환합니다.
+        """
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(concurrency)
+        read_path = reverse("treadmill-list")
+
+        async def send(method, path, token_key=None, data=None):
+            async with semaphore:
+                return await async_timed_request(client, method, path, token_key, data)
+
+        login_tasks = [
+            send(
+                "post",
+                login_path,
+                data={"student_id_number": student_id, "password": BENCH_PASSWORD},
+            )
+            for student_id in student_ids
+        ]
+        read_tasks = [send("get", read_path, reader_token_key) for _ in range(reads)]
+
+        # 조회 요청 사이사이에 로그인 요청이 고르게 끼도록 섞습니다.
+        step = max(len(read_tasks) // len(login_tasks), 1)
+        tasks = []
+        for index, read_task in enumerate(read_tasks):
+            if index % step == 0 and login_tasks:
+                tasks.append(("login", login_tasks.pop()))
+            tasks.append(("read", read_task))
+        tasks.extend(("login", login_task) for login_task in login_tasks)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(task for _, task in tasks))
+        elapsed = time.perf_counter() - started
+
+        login_results = [
+            result for (kind, _), result in zip(tasks, results) if kind == "login"
+        ]
+        read_results = [
+            result for (kind, _), result in zip(tasks, results) if kind == "read"
+        ]
+        return login_results, read_results, elapsed
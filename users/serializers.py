@@ -43,3 +43,8 @@ class MyAllBookingsResponseSerializer(serializers.Serializer):
     cycle_bookings = ListCycleTimeSlotSerializer(
         many=True, read_only=True, help_text="사용자의 사이클 예약 목록"
     )
+    next_cursor = serializers.CharField(
+        allow_null=True,
+        read_only=True,
+        help_text="다음 페이지 조회용 cursor. 마지막 페이지면 null",
+    )
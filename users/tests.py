@@ -1,3 +1,355 @@
-from django.test import TestCase
+import json
+import time
+from datetime import timedelta
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.signals import user_login_failed
+from django.contrib.sessions.models import Session
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .authentication import (
+    CachedTokenAuthentication,
+    cache_token,
+    last_login_batcher,
+    token_cache,
+)
+from bookings.archive import archive_timeslots
+from bookings.facilities import FACILITIES
+from gym.models import Treadmill, TreadmillTimeSlot
+from kitchen.models import Induction, InductionTimeSlot
+from .models import User
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user("2024000001", "password")
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_cached_token_skips_db(self):
+        authentication = CachedTokenAuthentication()
+        with self.assertNumQueries(1):
+            authentication.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            user, token = authentication.authenticate_credentials(self.token.key)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.student_id_number, "2024000001")
+        self.assertEqual(token.key, self.token.key)
+
+    def test_password_hash_is_not_cached(self):
+        cache_token(self.token, self.user)
+        _, value = token_cache.get(self.token.key)
+        self.assertNotIn(self.user.password, value)
+        User.objects.filter(pk=self.user.pk).update(password="changed-hash")
+        user, _ = CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        # 지연 필드이므로 접근할 때 DB 에서 읽습니다.
+        with self.assertNumQueries(1):
+            self.assertEqual(user.password, "changed-hash")
+
+    def test_logout_invalidates_token(self):
+        self.client.post(reverse("logout"))
+        response = self.client.get(reverse("my-all-bookings"))
+        self.assertEqual(response.status_code, 401)
+
+    def test_password_change_invalidates_cache(self):
+        CachedTokenAuthentication().authenticate_credentials(self.token.key)
+        response = self.client.put(
+            reverse("change-password"),
+            {"old_password": "password", "new_password": "new-password-1234"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(token_cache.get(self.token.key))
+
+    def test_deactivated_user_is_rejected(self):
+        self.assertEqual(self.client.get(reverse("my-all-bookings")).status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(reverse("my-all-bookings"))
+        self.assertEqual(response.status_code, 401)
+
+
+@override_settings(LOGIN_TOKEN_ONLY=True)
+class TokenOnlyLoginTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        last_login_batcher.flush()
+        self.addCleanup(last_login_batcher.flush)
+        self.user = User.objects.create_user("2024000002", "password")
+        self.client = APIClient()
+
+    def log_in(self):
+        return self.client.post(
+            reverse("login"),
+            {"student_id_number": "2024000002", "password": "password"},
+            format="json",
+        )
+
+    def test_login_issues_token_without_session(self):
+        response = self.log_in()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["token"], Token.objects.get(user=self.user).key)
+        self.assertFalse(Session.objects.exists())
+
+    def test_issued_token_is_cached(self):
+        token_key = self.log_in().data["token"]
+        self.assertIsNotNone(token_cache.get(token_key))
+        self.assertEqual(self.log_in().data["token"], token_key)
+
+    def test_token_deleted_by_another_worker_is_not_reused(self):
+        token_key = self.log_in().data["token"]
+        token = Token.objects.get(key=token_key)
+        token.delete()
+        # 다른 워커의 로그아웃은 이 프로세스의 캐시를 지우지 않습니다.
+        cache_token(token, self.user)
+
+        new_token_key = self.log_in().data["token"]
+        self.assertNotEqual(new_token_key, token_key)
+        self.assertTrue(Token.objects.filter(key=new_token_key).exists())
+
+    @override_settings(LOGIN_LAST_LOGIN_UPDATE="batch")
+    def test_last_login_is_batched(self):
+        self.log_in()
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+        last_login_batcher.flush()
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+
+    @override_settings(LOGIN_LAST_LOGIN_UPDATE="skip")
+    def test_last_login_can_be_skipped(self):
+        self.log_in()
+        last_login_batcher.flush()
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.last_login)
+
+
+class LastLoginBatcherTests(TransactionTestCase):
+    @override_settings(LAST_LOGIN_FLUSH_INTERVAL_SECONDS=0.05)
+    def test_pending_last_login_is_flushed_without_another_login(self):
+        user = User.objects.create_user("2024000004", "password")
+        self.addCleanup(last_login_batcher.flush)
+        last_login_batcher.flush()
+        logged_in_at = timezone.now()
+        last_login_batcher.record(user.pk, logged_in_at)
+
+        for _ in range(100):
+            user.refresh_from_db()
+            if user.last_login is not None:
+                break
+            time.sleep(0.02)
+        self.assertEqual(user.last_login, logged_in_at)
+
+
+class AsyncPasswordViewsTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user("2024000003", "password")
+
+    async def test_async_login_returns_token(self):
+        response = await self.async_client.post(
+            reverse("async-login"),
+            {"student_id_number": "2024000003", "password": "password"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        token = await Token.objects.aget(user=self.user)
+        self.assertEqual(response.json()["token"], token.key)
+
+    async def test_async_login_rejects_wrong_password(self):
+        response = await self.async_client.post(
+            reverse("async-login"),
+            {"student_id_number": "2024000003", "password": "wrong"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 401)
+
+    async def test_async_login_failure_sends_user_login_failed(self):
+        received = []
+
+        def receiver(sender, credentials, **kwargs):
+            received.append(credentials)
+
+        user_login_failed.connect(receiver)
+        self.addCleanup(user_login_failed.disconnect, receiver)
+        await self.async_client.post(
+            reverse("async-login"),
+            {"student_id_number": "2024000003", "password": "wrong"},
+            content_type="application/json",
+        )
+        self.assertEqual(received, [{"student_id_number": "2024000003"}])
+
+    async def test_async_change_password_checks_password_in_db(self):
+        token = await Token.objects.acreate(user=self.user)
+        await sync_to_async(cache_token)(token, self.user)
+        # 다른 워커에서 비밀번호가 바뀌어 이 프로세스의 토큰 캐시에는 옛 해시가 남아 있습니다.
+        await User.objects.filter(pk=self.user.pk).aupdate(
+            password=await sync_to_async(make_password)("changed-password-1234")
+        )
+        headers = {"Authorization": f"Token {token.key}"}
+        for old_password, status_code in [
+            ("password", 400),
+            ("changed-password-1234", 200),
+        ]:
+            response = await self.async_client.put(
+                reverse("async-change-password"),
+                {"old_password": old_password, "new_password": "new-password-1234"},
+                content_type="application/json",
+                headers=headers,
+            )
+            self.assertEqual(response.status_code, status_code)
+
+    async def test_async_change_password(self):
+        token = await Token.objects.acreate(user=self.user)
+        headers = {"Authorization": f"Token {token.key}"}
+        response = await self.async_client.put(
+            reverse("async-change-password"),
+            {"old_password": "wrong", "new_password": "new-password-1234"},
+            content_type="application/json",
+            headers=headers,
+        )
+        self.assertEqual(response.status_code, 400)
+        response = await self.async_client.put(
+            reverse("async-change-password"),
+            {"old_password": "password", "new_password": "new-password-1234"},
+            content_type="application/json",
+            headers=headers,
+        )
+        self.assertEqual(response.status_code, 200)
+        await self.user.arefresh_from_db()
+        self.assertTrue(self.user.check_password("new-password-1234"))
+
+    @override_settings(PASSWORD_HASHING_MAX_PENDING=0)
+    async def test_async_login_sheds_load_when_hashing_is_saturated(self):
+        response = await self.async_client.post(
+            reverse("async-login"),
+            {"student_id_number": "2024000003", "password": "password"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 503)
+
+
+class MyAllBookingsTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user("2024000004", "password")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        treadmill = Treadmill.objects.create()
+        induction = Induction.objects.create()
+        base = timezone.now().replace(second=0, microsecond=0)
+        for hours in (-3, -1, 2, 4):
+            start = base + timedelta(hours=hours)
+            TreadmillTimeSlot.objects.create(
+                treadmill=treadmill,
+                user=self.user,
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                booked_at=base,
+            )
+        for hours in (-2, 3):
+            start = base + timedelta(hours=hours)
+            InductionTimeSlot.objects.create(
+                induction=induction,
+                user=self.user,
+                start_time=start,
+                end_time=start + timedelta(minutes=30),
+                booked_at=base,
+            )
+        self.induction = induction
+
+    def collect_pages(self, **params):
+        pages = []
+        cursor = None
+        while True:
+            query = dict(params, **({"cursor": cursor} if cursor else {}))
+            response = self.client.get(reverse("my-all-bookings"), query)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            cursor = response.data["next_cursor"]
+            if cursor is None:
+                return pages
+
+    def test_response_keeps_facility_groups(self):
+        # ETag 버전 조회 1번 + UNION ALL 쿼리 1번
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("my-all-bookings"))
+        self.assertEqual(len(response.data["treadmill_bookings"]), 4)
+        self.assertEqual(len(response.data["induction_bookings"]), 2)
+        self.assertEqual(response.data["cycle_bookings"], [])
+        booking = response.data["induction_bookings"][0]
+        self.assertEqual(booking["induction"], self.induction.pk)
+        self.assertTrue(booking["is_booked"])
+        self.assertIsNone(response.data["next_cursor"])
+
+    def test_cursor_pages_cover_every_booking_once(self):
+        pages = self.collect_pages(limit=2)
+        self.assertEqual(len(pages), 3)
+        start_times = [
+            booking["start_time"]
+            for page in pages
+            for key in ("treadmill_bookings", "induction_bookings")
+            for booking in page[key]
+        ]
+        self.assertEqual(len(start_times), 6)
+        self.assertEqual(len(set(start_times)), 6)
+
+    def test_upcoming_and_past_filters(self):
+        upcoming = self.client.get(reverse("my-all-bookings"), {"when": "upcoming"})
+        self.assertEqual(len(upcoming.data["treadmill_bookings"]), 2)
+        self.assertEqual(len(upcoming.data["induction_bookings"]), 1)
+        past_pages = self.collect_pages(when="past", limit=1)
+        past_start_times = [
+            booking["start_time"]
+            for page in past_pages
+            for key in ("treadmill_bookings", "induction_bookings")
+            for booking in page[key]
+        ]
+        self.assertEqual(len(past_start_times), 3)
+        self.assertEqual(past_start_times, sorted(past_start_times, reverse=True))
+
+    def test_archived_bookings_are_included_on_request(self):
+        def get_past_bookings(**params):
+            return [
+                (key, booking["start_time"])
+                for page in self.collect_pages(when="past", limit=1, **params)
+                for key in ("treadmill_bookings", "induction_bookings")
+                for booking in page[key]
+            ]
+
+        before_archiving = get_past_bookings()
+        archive_timeslots(
+            FACILITIES["treadmill"], timezone.now() - timedelta(minutes=90), 1
+        )
+        self.assertEqual(len(get_past_bookings()), 2)
+        self.assertEqual(get_past_bookings(include_archived="true"), before_archiving)
+
+    def test_invalid_parameters(self):
+        for params in (
+            {"when": "later"},
+            {"cursor": "nope"},
+            {"limit": "0"},
+            {"include_archived": "yes"},
+        ):
+            response = self.client.get(reverse("my-all-bookings"), params)
+            self.assertEqual(response.status_code, 400)
+
+    def test_async_view_matches_sync_view(self):
+        token = Token.objects.create(user=self.user)
+        headers = {"Authorization": f"Token {token.key}"}
+        for params in ({}, {"when": "past", "limit": 1}, {"limit": "0"}):
+            sync_response = self.client.get(reverse("my-all-bookings"), params)
+            async_response = async_to_sync(self.async_client.get)(
+                reverse("async-my-all-bookings"), params, headers=headers
+            )
+            self.assertEqual(async_response.status_code, sync_response.status_code)
+            self.assertEqual(
+                json.loads(async_response.content), json.loads(sync_response.content)
+            )
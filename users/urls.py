@@ -1,4 +1,9 @@
 from django.urls import path
+from .async_views import (
+    AsyncChangePasswordView,
+    AsyncLogInView,
+    AsyncMyAllBookingsView,
+)
 from .views import (
     ChangePasswordAPIView,
     LogInAPIView,
@@ -10,5 +15,16 @@ urlpatterns = [
     path("change-password/", ChangePasswordAPIView.as_view(), name="change-password"),
     path("login/", LogInAPIView.as_view(), name="login"),
     path("logout/", LogOutAPIView.as_view(), name="logout"),
+    path(
+        "async/change-password/",
+        AsyncChangePasswordView.as_view(),
+        name="async-change-password",
+    ),
+    path("async/login/", AsyncLogInView.as_view(), name="async-login"),
+    path(
+        "async/my-bookings/",
+        AsyncMyAllBookingsView.as_view(),
+        name="async-my-all-bookings",
+    ),
     path("my-bookings/", MyAllBookingsListAPIView.as_view(), name="my-all-bookings"),
 ]
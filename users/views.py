@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.contrib.auth import login, authenticate, logout
 from rest_framework import generics, permissions, status, views
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from .serializers import (
@@ -7,18 +9,32 @@ from .serializers import (
     LoginSerializer,
     MyAllBookingsResponseSerializer,
 )
+from .authentication import get_login_token_key, record_last_login
 from .models import User
-from lounge.models import PingPongTableTimeSlot, ArcadeMachineTimeSlot
 from lounge.serializers import (
     ListPingPongTableTimeSlotSerializer,
     ListArcadeMachineTimeSlotSerializer,
 )
-from kitchen.models import InductionTimeSlot
 from kitchen.serializers import ListInductionTimeSlotSerializer
-from gym.models import TreadmillTimeSlot, CycleTimeSlot
 from gym.serializers import ListTreadmillTimeSlotSerializer, ListCycleTimeSlotSerializer
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.utils import timezone
+from bookings.facilities import FACILITIES
+from bookings.fast_serializers import serialize_timeslot_rows
+from bookings.my_bookings import (
+    WHEN_CHOICES,
+    decode_booking_cursor,
+    encode_booking_cursor,
+    get_user_bookings,
+)
+from bookings.renderers import LIST_RENDERER_CLASSES
+from bookings.utils import get_next_slot_boundary
+from bookings.versions import get_user_version_key
+from bookings.views import VersionETagMixin
+
+MY_BOOKINGS_PAGE_SIZE = 50
+MY_BOOKINGS_MAX_PAGE_SIZE = 200
 
 
 class ChangePasswordAPIView(generics.GenericAPIView):
@@ -27,7 +43,8 @@ class ChangePasswordAPIView(generics.GenericAPIView):
     permission_classes = (permissions.IsAuthenticated,)
 
     def get_object(self, queryset=None):
-        return self.request.user
+        # 토큰 캐시의 사용자는 다른 워커에서 바뀐 비밀번호를 모를 수 있으므로 DB 에서 다시 읽습니다.
+        return User.objects.get(pk=self.request.user.pk)
 
     def put(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -68,10 +85,16 @@ class LogInAPIView(generics.GenericAPIView):
         )
 
         if user is not None:
-            login(request, user)
-            token, created = Token.objects.get_or_create(user=user)
+            if settings.LOGIN_TOKEN_ONLY:
+                # 세션을 만들지 않고 토큰만 발급합니다.
+                token_key = get_login_token_key(user)
+                record_last_login(user)
+            else:
+                login(request, user)
+                token, created = Token.objects.get_or_create(user=user)
+                token_key = token.key
             return Response(
-                {"detail": "로그인 성공", "token": token.key},
+                {"detail": "로그인 성공", "token": token_key},
                 status=status.HTTP_200_OK,
             )
         else:
@@ -94,14 +117,59 @@ class LogOutAPIView(views.APIView):
         return Response({"detail": "로그아웃 성공"}, status=status.HTTP_200_OK)
 
 
-class MyAllBookingsListAPIView(generics.GenericAPIView):
+class MyAllBookingsListAPIView(VersionETagMixin, generics.GenericAPIView):
+    """
+    사용자의 예약을 시설별로 나누어 반환합니다.
+
+    다섯 시설의 예약을 UNION ALL 쿼리 한 번으로 가져오고,
+    start_time 기준 cursor 로 한 페이지씩 반환합니다.
+    """
+
     permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = LIST_RENDERER_CLASSES
+    list_serializer_classes = {
+        "ping_pong_table": ListPingPongTableTimeSlotSerializer,
+        "arcade_machine": ListArcadeMachineTimeSlotSerializer,
+        "induction": ListInductionTimeSlotSerializer,
+        "treadmill": ListTreadmillTimeSlotSerializer,
+        "cycle": ListCycleTimeSlotSerializer,
+    }
 
     @swagger_auto_schema(
         operation_summary="사용자의 모든 예약 목록 조회",
-        operation_description="현재 로그인한 사용자가 예약한 모든 시설(라운지, 부엌, 헬스장)의 예약 내역을 시설 유형별로 분류하여 반환합니다.",
+        operation_description="현재 로그인한 사용자가 예약한 모든 시설(라운지, 부엌, 헬스장)의 예약 내역을 시설 유형별로 분류하여 반환합니다. 시작 시간 순으로 limit 개씩 반환하며, 다음 페이지는 next_cursor 를 cursor 로 넘겨 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                "when",
+                openapi.IN_QUERY,
+                description="upcoming: 끝나지 않은 예약(오래된 순), past: 끝난 예약(최근 순). 생략하면 전체(오래된 순)",
+                type=openapi.TYPE_STRING,
+                enum=list(WHEN_CHOICES),
+            ),
+            openapi.Parameter(
+                "cursor",
+                openapi.IN_QUERY,
+                description="이전 응답의 next_cursor",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "limit",
+                openapi.IN_QUERY,
+                description=f"한 페이지의 최대 예약 수 (기본값 {MY_BOOKINGS_PAGE_SIZE}, 최대 {MY_BOOKINGS_MAX_PAGE_SIZE})",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                "include_archived",
+                openapi.IN_QUERY,
+                description="true 이면 보관 기간이 지나 보관된 지난 예약도 함께 반환합니다. 기본값 false",
+                type=openapi.TYPE_BOOLEAN,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: MyAllBookingsResponseSerializer(),
+            status.HTTP_400_BAD_REQUEST: openapi.Response(
+                description="잘못된 when, cursor, limit"
+            ),
             status.HTTP_401_UNAUTHORIZED: openapi.Response(
                 description="인증되지 않은 사용자"
             ),
@@ -109,44 +177,104 @@ class MyAllBookingsListAPIView(generics.GenericAPIView):
         tags=["Users"],
     )
     def get(self, request, *args, **kwargs):
-        user = request.user
+        return self.get_with_etag(self.list, request, *args, **kwargs)
 
-        ping_pong_bookings = PingPongTableTimeSlot.objects.filter(user=user).order_by(
-            "start_time"
-        )
-        arcade_machine_bookings = ArcadeMachineTimeSlot.objects.filter(
-            user=user
-        ).order_by("start_time")
-        induction_bookings = InductionTimeSlot.objects.filter(user=user).order_by(
-            "start_time"
+    def get_version_keys(self):
+        return [get_user_version_key(self.request.user.pk)]
+
+    def get_etag_time_key(self):
+        # upcoming/past 는 예약이 끝나는 슬롯 경계마다 결과가 바뀝니다.
+        if self.request.query_params.get("when") is None:
+            return None
+        return get_next_slot_boundary(timezone.now()).isoformat()
+
+    def list(self, request, *args, **kwargs):
+        rows = list(self.get_bookings_queryset())
+        return Response(self.build_response_data(rows), status=status.HTTP_200_OK)
+
+    def get_bookings_queryset(self):
+        when = self.request.query_params.get("when")
+        if when is not None and when not in WHEN_CHOICES:
+            raise ValidationError("when 은 upcoming 또는 past 만 가능합니다.")
+        cursor = self.request.query_params.get("cursor")
+        if cursor is not None:
+            cursor = decode_booking_cursor(cursor)
+        limit = self.get_limit()
+        include_archived = self.get_include_archived()
+
+        # 다음 페이지가 있는지 알기 위해 하나 더 가져옵니다.
+        return get_user_bookings(
+            self.request.user, when, cursor, limit + 1, include_archived
         )
-        treadmill_bookings = TreadmillTimeSlot.objects.filter(user=user).order_by(
-            "start_time"
+
+    def build_response_data(self, rows):
+        """
+        get_bookings_queryset 으로 가져온 행을 시설별로 나누고 다음 페이지 cursor 를 붙입니다.
+        """
+        limit = self.get_limit()
+        next_cursor = (
+            encode_booking_cursor(rows[limit - 1]) if len(rows) > limit else None
         )
-        cycle_bookings = CycleTimeSlot.objects.filter(user=user).order_by("start_time")
+        rows = rows[:limit]
 
-        ping_pong_data = ListPingPongTableTimeSlotSerializer(
-            ping_pong_bookings, many=True, context={"request": request}
-        ).data
-        arcade_data = ListArcadeMachineTimeSlotSerializer(
-            arcade_machine_bookings, many=True, context={"request": request}
-        ).data
-        induction_data = ListInductionTimeSlotSerializer(
-            induction_bookings, many=True, context={"request": request}
-        ).data
-        treadmill_data = ListTreadmillTimeSlotSerializer(
-            treadmill_bookings, many=True, context={"request": request}
-        ).data
-        cycle_data = ListCycleTimeSlotSerializer(
-            cycle_bookings, many=True, context={"request": request}
+        response_data = {}
+        for facility_key, serializer_class in self.list_serializer_classes.items():
+            facility = FACILITIES[facility_key]
+            facility_rows = [row for row in rows if row["facility"] == facility_key]
+            response_data[f"{facility_key}_bookings"] = self.serialize_bookings(
+                facility, serializer_class, facility_rows
+            )
+        response_data["next_cursor"] = next_cursor
+        return response_data
+
+    def serialize_bookings(self, facility, serializer_class, rows):
+        if settings.TIMESLOT_LIST_FAST_SERIALIZATION:
+            return serialize_timeslot_rows(
+                serializer_class,
+                facility.machine_fk_field,
+                [
+                    (
+                        row["id"],
+                        row["machine_id"],
+                        self.request.user.pk,
+                        row["start_time"],
+                        row["end_time"],
+                        row["booked_at"],
+                    )
+                    for row in rows
+                ],
+            )
+        timeslots = [
+            facility.timeslot_model(
+                id=row["id"],
+                user_id=self.request.user.pk,
+                start_time=row["start_time"],
+                end_time=row["end_time"],
+                booked_at=row["booked_at"],
+                **{f"{facility.machine_fk_field}_id": row["machine_id"]},
+            )
+            for row in rows
+        ]
+        return serializer_class(
+            timeslots, many=True, context={"request": self.request}
         ).data
 
-        response_data = {
-            "ping_pong_table_bookings": ping_pong_data,
-            "arcade_machine_bookings": arcade_data,
-            "induction_bookings": induction_data,
-            "treadmill_bookings": treadmill_data,
-            "cycle_bookings": cycle_data,
-        }
+    def get_include_archived(self):
+        include_archived = self.request.query_params.get("include_archived", "false")
+        if include_archived not in ("true", "false"):
+            raise ValidationError("include_archived 는 true 또는 false 만 가능합니다.")
+        return include_archived == "true"
 
-        return Response(response_data, status=status.HTTP_200_OK)
+    def get_limit(self):
+        limit = self.request.query_params.get("limit")
+        if limit is None:
+            return MY_BOOKINGS_PAGE_SIZE
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError("limit 은 정수여야 합니다.")
+        if not 1 <= limit <= MY_BOOKINGS_MAX_PAGE_SIZE:
+            raise ValidationError(
+                f"limit 은 1 이상 {MY_BOOKINGS_MAX_PAGE_SIZE} 이하여야 합니다."
+            )
+        return limit